@@ -2,6 +2,7 @@
 WordPress Blogger Agent - Creates and publishes blog articles.
 """
 from typing import Dict, Any, List
+import asyncio
 from loguru import logger
 from .base_agent import BaseAgent
 
@@ -208,33 +209,47 @@ class WordPressBloggerAgent(BaseAgent):
     async def batch_generate(
         self, 
         topics: List[str],
-        publish: bool = False
+        publish: bool = False,
+        concurrency: int = 4
     ) -> Dict[str, Any]:
         """
         Generate multiple articles in batch.
 
+        Articles are generated concurrently, with at most `concurrency`
+        in flight to avoid flooding the LLM/WordPress endpoints.
+
         Args:
             topics: List of article topics
             publish: Whether to publish articles
+            concurrency: Maximum number of articles generated at once
 
         Returns:
             Batch processing results
         """
-        articles = []
-        failed = []
+        semaphore = asyncio.Semaphore(concurrency)
 
-        for topic in topics:
-            try:
-                result = await self.execute({
+        async def generate(topic: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.execute({
                     "topic": topic,
                     "publish": publish
                 })
-                if result["status"] == "success":
-                    articles.append(result)
-                else:
-                    failed.append({"topic": topic, "error": result.get("error")})
-            except Exception as e:
-                failed.append({"topic": topic, "error": str(e)})
+
+        results = await asyncio.gather(
+            *(generate(topic) for topic in topics),
+            return_exceptions=True
+        )
+
+        articles = []
+        failed = []
+
+        for topic, result in zip(topics, results):
+            if isinstance(result, Exception):
+                failed.append({"topic": topic, "error": str(result)})
+            elif result["status"] == "success":
+                articles.append(result)
+            else:
+                failed.append({"topic": topic, "error": result.get("error")})
 
         return {
             "status": "success",
@@ -26,6 +26,22 @@ class Settings(BaseSettings):
     max_reasoning_steps: int = 5
     confidence_threshold: float = 0.7
 
+    # Gemini context caching (préfixes d'instructions invariants)
+    gemini_context_cache: bool = False
+    gemini_context_cache_ttl: int = 3600
+
+    # Micro-batching des requêtes Gemini concurrentes
+    gemini_batching: bool = False
+    gemini_batch_max_size: int = 8
+    gemini_batch_max_wait_ms: int = 250
+
+    # Trace du flow (tampon circulaire, entrées les plus anciennes évincées)
+    trace_max_entries: int = 4096
+
+    # LLM Cache
+    llm_cache_max_size: int = 1024
+    llm_cache_ttl: float = 3600.0
+
     # Agents Configuration
     lead_gen_enabled: bool = True
     lead_gen_max_results: int = 50
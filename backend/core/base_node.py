@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Tuple
 from .shared import Shared, TraceEntry, NodeStatus
-from datetime import datetime
-import time
+from time import monotonic_ns, perf_counter
+import sys
 
 class BaseNode(ABC):
     """
@@ -11,7 +11,8 @@ class BaseNode(ABC):
     """
 
     def __init__(self, name: str):
-        self.name = name
+        # Nom interné : toutes les entrées de trace d'un même node partagent une seule chaîne
+        self.name = sys.intern(name)
 
     def prep(self, shared: Shared) -> Any:
         """Phase de préparation : lecture du contexte partagé."""
@@ -29,7 +30,7 @@ class BaseNode(ABC):
 
     async def run(self, shared: Shared, input_data: Any = None) -> Tuple[Any, str | None]:
         """Execute le cycle complet prep -> exec -> post avec traçabilité."""
-        start = time.perf_counter()
+        start = perf_counter()
 
         try:
             # Prep
@@ -44,9 +45,9 @@ class BaseNode(ABC):
             next_route = self.post(shared, prep_result, exec_result)
 
             # Trace success
-            duration = (time.perf_counter() - start) * 1000
+            duration = (perf_counter() - start) * 1000
             shared.add_trace(TraceEntry(
-                timestamp=datetime.now(),
+                ts_ns=monotonic_ns(),
                 node=self.name,
                 status=NodeStatus.SUCCESS,
                 duration_ms=duration,
@@ -56,9 +57,9 @@ class BaseNode(ABC):
             return exec_result, next_route
 
         except Exception as e:
-            duration = (time.perf_counter() - start) * 1000
+            duration = (perf_counter() - start) * 1000
             shared.add_trace(TraceEntry(
-                timestamp=datetime.now(),
+                ts_ns=monotonic_ns(),
                 node=self.name,
                 status=NodeStatus.FAILED,
                 duration_ms=duration,
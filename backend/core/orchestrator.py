@@ -32,13 +32,15 @@ class Orchestrator:
         flow_id = shared.get_metadata('flow_id')
         logger.info(f"Starting flow {flow_id}")
 
-        input_data = shared.get_context("user_input")
+        user_input = shared.get_context("user_input")
 
-        for node in self.pipeline:
+        for i, node in enumerate(self.pipeline):
             try:
                 logger.debug(f"Executing node: {node.name}")
-                result, next_route = await node.run(shared, input_data)
-                input_data = result
+                # Seul le premier node reçoit l'entrée utilisateur : les suivants lisent
+                # leurs entrées dans shared (prep), pas la sortie brute du node précédent
+                input_data = user_input if i == 0 else None
+                _, next_route = await node.run(shared, input_data)
 
                 # Gestion du routage conditionnel (si implémenté)
                 if next_route:
@@ -63,7 +65,7 @@ class Orchestrator:
 
         return {
             "answer": final_result.get("final") if final_result else "Erreur de traitement",
-            "confidence": shared.get_result("reasoning", {}).get("confidence") or 0.0,
+            "confidence": shared.get_result("reasoning", "confidence") or 0.0,
             "metadata": shared["metadata"],
             "trace": shared.get_trace(),
             "status": "completed" if final_result else "error"
@@ -1,7 +1,16 @@
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Deque, Dict, List, Tuple
+from collections import deque
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
+from ..utils.clock import monotonic_to_iso
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class NodeStatus(str, Enum):
     PENDING = "pending"
@@ -10,81 +19,170 @@ class NodeStatus(str, Enum):
     FAILED = "failed"
     SKIPPED = "skipped"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TraceEntry:
-    timestamp: datetime
+    """Entrée de trace immuable (slots : pas de __dict__ par entrée)."""
+    # Horodatage monotone (time.monotonic_ns()), formaté en ISO uniquement à l'export
+    ts_ns: int
     node: str
     status: NodeStatus
     duration_ms: float
     data: Dict[str, Any] = field(default_factory=dict)
 
-class Shared(dict):
+def _json_default(obj: Any) -> Any:
+    """Types non natifs JSON présents dans le contexte (dates, enums)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+# (tampon sérialisé, clé longueur/extrémités, entrées sérialisées)
+_TraceSnapshot = Tuple[Deque[TraceEntry], Tuple[Any, ...], List[Dict[str, Any]]]
+
+class Shared(dict[str, Any]):
     """
     Contract PocketFlow : Store partagé entre tous les nodes.
     Garantit la cohérence et la traçabilité du flow.
     """
 
-    def __init__(self) -> None:
+    # Conteneurs exposés aussi en attributs : une seule lecture de slot par accès
+    __slots__ = ("_context", "_results", "_trace", "_metadata", "_trace_snapshot")
+    _SLOTS: ClassVar[Dict[str, str]] = {
+        "context": "_context",
+        "results": "_results",
+        "trace": "_trace",
+        "metadata": "_metadata",
+    }
+
+    # Taille par défaut de la trace : au-delà, les entrées les plus anciennes sont évincées
+    TRACE_MAX_ENTRIES: ClassVar[int] = 1024
+
+    def __init__(self, trace_max_entries: int | None = None) -> None:
+        self._context: Dict[str, Any] = {}
+        self._results: Dict[str, Any] = {}
+        # Tampon circulaire borné : ajout O(1), mémoire constante sur les longs flows
+        self._trace: Deque[TraceEntry] = deque(maxlen=trace_max_entries or self.TRACE_MAX_ENTRIES)
+        # Trace sérialisée par to_dict, réutilisée tant que le tampon n'a pas changé
+        self._trace_snapshot: _TraceSnapshot | None = None
+        self._metadata: Dict[str, Any] = {
+            "flow_id": None,
+            "user_id": None,
+            "session_id": None,
+            "start_time": datetime.now(),
+        }
         super().__init__(
-            context={},
-            results={},
-            trace=[],
-            metadata={
-                "flow_id": None,
-                "user_id": None,
-                "session_id": None,
-                "start_time": datetime.now(),
-            }
+            context=self._context,
+            results=self._results,
+            trace=self._trace,
+            metadata=self._metadata
         )
 
+    # Les slots suivent tout conteneur remplacé via l'API dict.
+    # Pas de lecture d'attribut ici : le dépicklage appelle __setitem__ avant __init__.
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        slot = self._SLOTS.get(key)
+        if slot:
+            object.__setattr__(self, slot, value)
+            if slot == "_trace":
+                self._trace_snapshot = None
+
+    def _sync_slots(self) -> None:
+        for key, slot in self._SLOTS.items():
+            if key in self and getattr(self, slot, None) is not dict.__getitem__(self, key):
+                object.__setattr__(self, slot, dict.__getitem__(self, key))
+                if slot == "_trace":
+                    self._trace_snapshot = None
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._sync_slots()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        self._sync_slots()
+        return value
+
+    def __ior__(self, other: Any) -> "Shared":
+        super().__ior__(other)
+        self._sync_slots()
+        return self
+
     # Context methods
     def get_context(self, key: str, default: Any = None) -> Any:
-        return self["context"].get(key, default)
+        return self._context.get(key, default)
 
     def set_context(self, key: str, value: Any) -> None:
-        self["context"][key] = value
+        self._context[key] = value
 
     def update_context(self, data: Dict[str, Any]) -> None:
-        self["context"].update(data)
+        self._context.update(data)
 
     # Results methods
-    def get_result(self, node: str, key: str | None = None) -> Any:
-        result = self["results"].get(node)
-        if key and result:
-            return result.get(key)
+    def get_result(self, node: str, *path: str) -> Any:
+        result = self._results.get(node)
+        # Chemin imbriqué : get_result("node", "a", "b") -> results["node"]["a"]["b"]
+        for key in path:
+            if not isinstance(result, dict):
+                return None
+            result = result.get(key)
         return result
 
     def set_result(self, node: str, value: Any) -> None:
-        self["results"][node] = value
+        self._results[node] = value
 
     # Trace methods
     def add_trace(self, entry: TraceEntry) -> None:
-        self["trace"].append(entry)
+        self._trace.append(entry)
 
     def get_trace(self) -> List[TraceEntry]:
-        return self["trace"]
+        return list(self._trace)
 
     # Metadata
     def set_metadata(self, key: str, value: Any) -> None:
-        self["metadata"][key] = value
+        self._metadata[key] = value
 
     def get_metadata(self, key: str) -> Any:
-        return self["metadata"].get(key)
+        return self._metadata.get(key)
 
     # Utilities
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "context": self["context"],
-            "results": self["results"],
-            "trace": [
+    def _trace_dicts(self) -> List[Dict[str, Any]]:
+        """Trace sérialisée, reconstruite seulement si le tampon a changé."""
+        trace = self._trace
+        # Clé lue sur le tampon lui-même : couvre aussi shared["trace"].append(...)
+        # (ajout ou éviction changent la longueur ou une extrémité)
+        key = (len(trace), trace[0], trace[-1]) if trace else (0,)
+        snapshot = self._trace_snapshot
+        if snapshot is None or snapshot[0] is not trace or snapshot[1] != key:
+            snapshot = self._trace_snapshot = (trace, key, [
                 {
-                    "timestamp": t.timestamp.isoformat(),
+                    "timestamp": monotonic_to_iso(t.ts_ns),
                     "node": t.node,
                     "status": t.status.value,
                     "duration_ms": t.duration_ms,
                     "data": t.data,
                 }
-                for t in self["trace"]
-            ],
-            "metadata": self["metadata"],
+                for t in trace
+            ])
+        return snapshot[2]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "context": self._context,
+            "results": self._results,
+            "trace": list(self._trace_dicts()),
+            "metadata": self._metadata,
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """Sérialise directement en JSON (orjson si disponible), sans copie intermédiaire."""
+        data = {
+            "context": self._context,
+            "results": self._results,
+            "trace": self._trace_dicts(),
+            "metadata": self._metadata,
         }
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, default=_json_default)
+        return json.dumps(data, default=_json_default, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,144 @@
+from typing import Any, Dict, List, Set, Tuple
+from functools import lru_cache
+import asyncio
+import json
+from loguru import logger
+from .gemini_client import GeminiClient, get_gemini_client
+
+BatchKey = Tuple[Tuple[str, Any], ...]
+
+class BatchingGeminiClient:
+    """
+    Micro-batcher au-dessus de GeminiClient.generate.
+    Regroupe jusqu'à `max_batch_size` requêtes concurrentes (mêmes paramètres) reçues
+    dans une fenêtre de `max_wait_ms` en un seul appel : les instructions de cadrage
+    ne sont payées qu'une fois. En cas de réponse groupée illisible, chaque requête
+    est rejouée individuellement.
+    """
+
+    def __init__(self, client: GeminiClient, max_batch_size: int = 8, max_wait_ms: int = 250):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._pending: Dict[BatchKey, List[Tuple[str, asyncio.Future[str]]]] = {}
+        self._timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        # Références fortes vers les lots en cours (évite leur collecte prématurée)
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        # Délègue le reste de l'API (model, stream, get_prefix_cache...) au client sous-jacent
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    async def generate(self, prompt: str, **kwargs: Any) -> str:
+        """Génération mise en file puis envoyée avec les requêtes concurrentes compatibles."""
+        try:
+            key: BatchKey = tuple(sorted(kwargs.items()))
+            hash(key)
+        except TypeError:
+            # Paramètres non hashables : pas de regroupement possible
+            return await self.client.generate(prompt, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((prompt, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: BatchKey) -> None:
+        """Envoie le lot en attente pour ces paramètres."""
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(key, [])
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(batch, dict(key)))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future[str]]], kwargs: Dict[str, Any]) -> None:
+        """Exécute un lot et résout les futures de chaque appelant."""
+        if len(batch) == 1:
+            await self._run_single(*batch[0], kwargs)
+            return
+
+        params = dict(kwargs)
+        # Instructions communes au lot (elles font partie de la clé) : envoyées une seule fois
+        instructions = params.pop("instructions", None)
+        if "max_output_tokens" in params:
+            # Budget de sortie partagé entre toutes les réponses du lot
+            params["max_output_tokens"] = params["max_output_tokens"] * len(batch)
+
+        try:
+            prompt = self._build_batch_prompt([p for p, _ in batch], instructions)
+            response = await self.client.generate(prompt, **params)
+            answers = self._parse_batch_response(response, len(batch))
+        except Exception as e:
+            logger.warning(f"Batched Gemini call failed ({e}), replaying {len(batch)} requests individually")
+            await asyncio.gather(*(self._run_single(prompt, future, kwargs) for prompt, future in batch))
+            return
+
+        logger.debug(f"Batched {len(batch)} Gemini requests into one call")
+        for (_, future), answer in zip(batch, answers):
+            if not future.done():
+                future.set_result(answer)
+
+    async def _run_single(self, prompt: str, future: asyncio.Future[str], kwargs: Dict[str, Any]) -> None:
+        """Exécute une requête seule et propage son résultat ou son erreur."""
+        try:
+            result = await self.client.generate(prompt, **kwargs)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _build_batch_prompt(prompts: List[str], instructions: str | None = None) -> str:
+        """
+        Concatène les requêtes numérotées avec une consigne de sortie JSON,
+        sous un unique en-tête d'instructions partagé par tout le lot.
+        """
+        parts = [instructions] if instructions else []
+        parts += [
+            f"Traite indépendamment chacune des {len(prompts)} requêtes suivantes"
+            + (" en appliquant les instructions ci-dessus." if instructions else "."),
+            f"Réponds UNIQUEMENT avec un tableau JSON de {len(prompts)} chaînes : "
+            "l'élément i est la réponse complète à la requête i, dans l'ordre.",
+        ]
+        parts.extend(f"### Requête {i}\n{prompt}" for i, prompt in enumerate(prompts, 1))
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _parse_batch_response(response: str, expected: int) -> List[str]:
+        """Extrait le tableau JSON des réponses (éventuellement entouré de texte ou de balises)."""
+        start, end = response.find("["), response.rfind("]")
+        if start == -1 or end <= start:
+            raise ValueError("No JSON array in batched response")
+
+        answers = json.loads(response[start:end + 1])
+        if not isinstance(answers, list) or len(answers) != expected:
+            raise ValueError(f"Expected {expected} answers in batched response")
+
+        # Une réponse structurée (ex: JSON de décomposition) est renvoyée sous forme de texte
+        return [a if isinstance(a, str) else json.dumps(a, ensure_ascii=False) for a in answers]
+
+@lru_cache(maxsize=8)
+def get_batching_client(
+    api_key: str | None,
+    model: str,
+    max_batch_size: int = 8,
+    max_wait_ms: int = 250
+) -> BatchingGeminiClient:
+    """Retourne un micro-batcher partagé par couple (api_key, model)."""
+    return BatchingGeminiClient(get_gemini_client(api_key, model), max_batch_size, max_wait_ms)
@@ -0,0 +1,79 @@
+from typing import Any, Dict, Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import json
+import time
+from loguru import logger
+from ..config import get_settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def cache_key(model: str, prompt: str, **params: Any) -> str:
+    """Clé de cache exacte : sha256 du modèle, du prompt et des paramètres de génération."""
+    data = {"model": model, "prompt": prompt, **params}
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+class LLMCache:
+    """
+    Cache LRU + TTL des réponses LLM (correspondance exacte du prompt).
+    Interface async pour permettre un backend distant (Redis...) sans changer les appelants.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> str | None:
+        """Retourne la réponse en cache, ou None si absente ou expirée."""
+        # Aucune attente dans les opérations : atomiques vis-à-vis de l'event loop
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def set(self, key: str, value: str) -> None:
+        """Stocke une réponse (évince la moins récemment utilisée si plein)."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        """Vide le cache."""
+        self._entries.clear()
+        logger.info("LLM cache cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
+
+@lru_cache
+def get_llm_cache() -> LLMCache:
+    """Cache partagé par le processus."""
+    settings = get_settings()
+    return LLMCache(max_size=settings.llm_cache_max_size, ttl=settings.llm_cache_ttl)
@@ -1,21 +1,59 @@
 import os
-from typing import AsyncGenerator, Dict, Any, List
+import time
+import asyncio
+from functools import lru_cache
+from typing import AsyncGenerator, Dict, Any, List, Tuple
 from google import genai
+from google.genai import types
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+# États terminaux d'un job Gemini Batch
+_BATCH_TERMINAL_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED", "JOB_STATE_PARTIALLY_SUCCEEDED"
+})
+
 class GeminiClient:
     """Client Gemini avec support streaming et retry logic."""
 
+    # Intervalle de sondage des jobs Batch API (tier "batch", SLA < 24h)
+    batch_poll_interval: float = 30.0
+
     def __init__(self, api_key: str | None = None, model: str = "gemini-1.5-flash-latest"):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model = model
         self.client = genai.Client(api_key=self.api_key)
+        # Caches de contexte par préfixe d'instructions : (nom, expiration monotone)
+        self._prefix_caches: Dict[str, Tuple[str | None, float]] = {}
         logger.info(f"GeminiClient initialized with model: {model}")
 
+    async def generate(
+        self,
+        prompt: str,
+        service_tier: str = "standard",
+        instructions: str | None = None,
+        **kwargs: Any
+    ) -> str:
+        """
+        Génération simple (non-streaming).
+        `instructions` : préfixe invariant placé en tête du prompt (transmis à part pour
+        que le micro-batcher ne l'envoie qu'une fois par lot).
+        service_tier="batch" passe par la Batch API (moitié prix, réponse différée) :
+        réservé aux traitements hors ligne, jamais sur le chemin d'une requête HTTP
+        (l'appel attend la fin du job), sans nouvel essai automatique
+        (un job échoué ou expiré n'est pas resoumis).
+        """
+        if instructions:
+            prompt = f"{instructions}\n\n{prompt}"
+
+        if service_tier == "batch":
+            return await self._generate_batch(prompt, **kwargs)
+        return await self._generate_standard(prompt, **kwargs)
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
-    async def generate(self, prompt: str, **kwargs: Any) -> str:
-        """Génération simple (non-streaming)."""
+    async def _generate_standard(self, prompt: str, **kwargs: Any) -> str:
+        """Appel synchrone à l'API standard, avec retry."""
         try:
             response = self.client.models.generate_content(
                 model=self.model,
@@ -27,6 +65,56 @@ class GeminiClient:
             logger.error(f"Gemini generation error: {e}")
             raise
 
+    async def _generate_batch(self, prompt: str, **kwargs: Any) -> str:
+        """Soumet la requête comme job Batch API et attend son résultat."""
+        job = await self.client.aio.batches.create(
+            model=self.model,
+            src=[types.InlinedRequest(contents=prompt, config=types.GenerateContentConfig(**kwargs))]
+        )
+        logger.info(f"Gemini batch job submitted: {job.name}")
+
+        while job.state is None or job.state.name not in _BATCH_TERMINAL_STATES:
+            await asyncio.sleep(self.batch_poll_interval)
+            job = await self.client.aio.batches.get(name=job.name)
+
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Gemini batch job {job.name} ended in state {job.state.name}")
+
+        responses = job.dest.inlined_responses if job.dest else None
+        if not responses or responses[0].error or responses[0].response is None:
+            raise RuntimeError(f"Gemini batch job {job.name} returned no response")
+
+        return responses[0].response.text
+
+    async def get_prefix_cache(self, instructions: str, ttl_seconds: int = 3600) -> str | None:
+        """
+        Retourne le nom d'un cache de contexte Gemini contenant les instructions invariantes,
+        créé au premier appel et renouvelé à expiration. None si indisponible
+        (ex: préfixe sous le minimum de tokens du modèle) : envoyer alors le prompt complet.
+        """
+        name, expires_at = self._prefix_caches.get(instructions, (None, 0.0))
+        if time.monotonic() < expires_at:
+            return name
+
+        try:
+            # Client async : la création (aller-retour réseau) ne bloque pas l'event loop
+            cache = await self.client.aio.caches.create(
+                model=self.model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=instructions,
+                    ttl=f"{ttl_seconds}s"
+                )
+            )
+            name = cache.name
+            logger.info(f"Gemini context cache created: {name}")
+        except Exception as e:
+            logger.warning(f"Gemini context cache unavailable, sending full prompts: {e}")
+            name = None
+
+        # Marge de 60s avant l'expiration réelle ; en cas d'échec, pas de nouvel essai avant le TTL
+        self._prefix_caches[instructions] = (name, time.monotonic() + max(ttl_seconds - 60, 0))
+        return name
+
     async def stream(self, prompt: str, **kwargs: Any) -> AsyncGenerator[str, None]:
         """Génération streaming token par token."""
         try:
@@ -74,3 +162,8 @@ class GeminiClient:
         except Exception as e:
             logger.error(f"Gemini tools error: {e}")
             raise
+
+@lru_cache(maxsize=8)
+def get_gemini_client(api_key: str | None, model: str) -> GeminiClient:
+    """Retourne un client partagé par couple (api_key, model), créé au premier appel."""
+    return GeminiClient(api_key=api_key, model=model)
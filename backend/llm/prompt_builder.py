@@ -3,28 +3,49 @@ from typing import Dict, Any, List
 class PromptBuilder:
     """Constructeur de prompts pour RRLA et autres patterns."""
 
-    @staticmethod
-    def build_rrla_decompose(context: Dict[str, Any]) -> str:
-        """Construit un prompt pour la décomposition (R1)."""
-        return f"""Tu es un agent de raisonnement expert. Décompose cette requête en étapes logiques claires et actionnables.
-
-Requête utilisateur: {context.get('clean_input', '')}
-Type de tâche: {context.get('task_type', 'general')}
-Intention détectée: {context.get('intent', 'unknown')}
-
-Contexte additionnel:
-{context.get('memory_context', 'Aucun contexte historique')}
+    # Préfixes invariants placés en tête des prompts : ils forment un préfixe commun
+    # réutilisable par le cache de contexte Gemini (implicite ou explicite)
+    RRLA_DECOMPOSE_INSTRUCTIONS = """Tu es un agent de raisonnement expert. Décompose la requête utilisateur fournie en étapes logiques claires et actionnables.
 
 Réponds UNIQUEMENT en JSON avec cette structure exacte:
-{{
+{
     "steps": [
-        {{"id": 1, "action": "description de l'action", "rationale": "pourquoi cette étape"}},
-        {{"id": 2, "action": "description de l'action", "rationale": "pourquoi cette étape"}}
+        {"id": 1, "action": "description de l'action", "rationale": "pourquoi cette étape"},
+        {"id": 2, "action": "description de l'action", "rationale": "pourquoi cette étape"}
     ]
-}}
+}
 
 Sois concis et pragmatique. Maximum 5 étapes."""
 
+    SYNTHESIS_INSTRUCTIONS = """Tu es un agent de synthèse. Génère une réponse claire et complète à la question originale fournie.
+
+Génère une réponse:
+1. Naturelle et conversationnelle
+2. Qui intègre le raisonnement
+3. Qui répond directement à la question
+4. Avec des exemples si pertinent
+
+Réponds directement sans métadonnées ni JSON."""
+
+    @staticmethod
+    def build_rrla_decompose_request(context: Dict[str, Any]) -> str:
+        """Partie variable du prompt de décomposition (R1)."""
+        return f"""Requête utilisateur: {context.get('clean_input', '')}
+Type de tâche: {context.get('task_type', 'general')}
+Intention détectée: {context.get('intent', 'unknown')}
+
+Contexte additionnel:
+{context.get('memory_context', 'Aucun contexte historique')}"""
+
+    @staticmethod
+    def build_rrla_decompose(context: Dict[str, Any]) -> str:
+        """Construit un prompt pour la décomposition (R1)."""
+        return (
+            PromptBuilder.RRLA_DECOMPOSE_INSTRUCTIONS
+            + "\n\n"
+            + PromptBuilder.build_rrla_decompose_request(context)
+        )
+
     @staticmethod
     def build_rrla_reflect(steps: List[Dict[str, Any]], context: Dict[str, Any]) -> str:
         """Construit un prompt pour la réflexion (R2)."""
@@ -49,28 +70,27 @@ Réponds en JSON:
 }}"""
 
     @staticmethod
-    def build_synthesis(reasoning_result: Dict[str, Any], input_text: str) -> str:
-        """Construit un prompt pour la synthèse finale."""
+    def build_synthesis_request(reasoning_result: Dict[str, Any], input_text: str) -> str:
+        """Partie variable du prompt de synthèse."""
         steps = reasoning_result.get("steps", [])
         steps_summary = "\n".join([f"- {s.get('action', '')}" for s in steps])
 
-        return f"""Tu es un agent de synthèse. Génère une réponse claire et complète.
-
-Question originale: {input_text}
+        return f"""Question originale: {input_text}
 
 Raisonnement effectué:
 {steps_summary}
 
 Décision prise: {reasoning_result.get('decision', {})}
-Confiance: {reasoning_result.get('confidence', 0.0)*100:.0f}%
+Confiance: {reasoning_result.get('confidence', 0.0)*100:.0f}%"""
 
-Génère une réponse:
-1. Naturelle et conversationnelle
-2. Qui intègre le raisonnement
-3. Qui répond directement à la question
-4. Avec des exemples si pertinent
-
-Réponds directement sans métadonnées ni JSON."""
+    @staticmethod
+    def build_synthesis(reasoning_result: Dict[str, Any], input_text: str) -> str:
+        """Construit un prompt pour la synthèse finale."""
+        return (
+            PromptBuilder.SYNTHESIS_INSTRUCTIONS
+            + "\n\n"
+            + PromptBuilder.build_synthesis_request(reasoning_result, input_text)
+        )
 
     @staticmethod
     def build_system_prompt() -> str:
@@ -5,13 +5,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 from typing import AsyncGenerator
 from contextlib import asynccontextmanager
+import asyncio
 import uuid
 from loguru import logger
 
 from .config import get_settings
 from .core.orchestrator import Orchestrator
 from .core.shared import Shared
-from .llm.gemini_client import GeminiClient
+from .llm.gemini_client import get_gemini_client
 from .mcp import mcp_server
 from .agents import LeadGeneratorAgent, SocialMediaManagerAgent, WordPressBloggerAgent
 
@@ -25,6 +26,7 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Agent IA Backend starting...")
     logger.info(f"📦 Model: {settings.gemini_model}")
     logger.info(f"🔧 MCP Tools: {len(mcp_server.tools)}")
+    logger.info(f"⚡ Event loop: {type(asyncio.get_running_loop()).__module__}")
     
     # Initialize agents
     app.state.agents = {}
@@ -90,7 +92,7 @@ else:
 
 # Services
 orchestrator = Orchestrator()
-gemini = GeminiClient(settings.gemini_api_key, settings.gemini_model)
+gemini = get_gemini_client(settings.gemini_api_key, settings.gemini_model)
 
 # === ROUTES ===
 
@@ -116,7 +118,7 @@ async def chat(req: Request):
             raise HTTPException(400, "Missing 'input' field")
 
         # Créer shared context
-        shared = Shared()
+        shared = Shared(trace_max_entries=settings.trace_max_entries)
         shared.set_metadata("flow_id", str(uuid.uuid4()))
         shared.set_metadata("user_id", payload.get("user_id", "anonymous"))
         shared.set_context("user_input", user_input)
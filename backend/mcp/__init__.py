@@ -9,6 +9,7 @@ from .tools import (
 )
 from .artifacts import (
     create_artifact,
+    create_artifacts,
     save_artifact,
     list_artifacts,
     update_artifact,
@@ -74,6 +75,13 @@ mcp_server.register_tool(MCPTool(
     handler=create_artifact
 ))
 
+mcp_server.register_tool(MCPTool(
+    name="create_artifacts",
+    description="Crée plusieurs artifacts en un seul lot",
+    input_schema=TOOL_SCHEMAS["create_artifacts"],
+    handler=create_artifacts
+))
+
 mcp_server.register_tool(MCPTool(
     name="save_artifact",
     description="Sauvegarde un artifact sur le disque",
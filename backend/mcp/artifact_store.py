@@ -3,20 +3,52 @@ Store pour la gestion des artifacts.
 Stockage en mémoire avec persistence optionnelle.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List
+from collections import defaultdict
+import heapq
 from datetime import datetime
 from loguru import logger
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class ArtifactStore:
     """Store centralisé pour les artifacts."""
 
     def __init__(self):
         self.artifacts: Dict[str, Dict[str, Any]] = {}
         self.max_artifacts = 100
+        # Index secondaire par type et compteurs maintenus à chaque mutation
+        self._by_type: defaultdict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        self._total_size = 0
         logger.info("ArtifactStore initialized")
 
+    def _index(self, artifact_id: str, artifact: Dict[str, Any]) -> None:
+        """Enregistre un artifact dans le store et ses index."""
+        self._unindex(artifact_id)
+        self.artifacts[artifact_id] = artifact
+        self._by_type[artifact.get("type", "unknown")][artifact_id] = artifact
+        self._total_size += artifact.get("size_bytes", 0)
+
+    def _unindex(self, artifact_id: str) -> Dict[str, Any] | None:
+        """Retire un artifact du store et de ses index."""
+        artifact = self.artifacts.pop(artifact_id, None)
+        if artifact is None:
+            return None
+
+        artifact_type = artifact.get("type", "unknown")
+        bucket = self._by_type[artifact_type]
+        del bucket[artifact_id]
+        if not bucket:
+            del self._by_type[artifact_type]
+        self._total_size -= artifact.get("size_bytes", 0)
+        return artifact
+
     def add(self, artifact: Dict[str, Any]) -> str:
         """
         Ajoute un artifact au store.
@@ -36,14 +68,47 @@ class ArtifactStore:
                 self.artifacts.keys(),
                 key=lambda k: self.artifacts[k].get("created_at", "")
             )
-            del self.artifacts[oldest_id]
+            self._unindex(oldest_id)
             logger.warning(f"Removed oldest artifact {oldest_id} (max limit reached)")
 
-        self.artifacts[artifact_id] = artifact
+        self._index(artifact_id, artifact)
         logger.info(f"Added artifact {artifact_id} to store")
 
         return artifact_id
 
+    def add_many(self, artifacts: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Ajoute plusieurs artifacts en une passe.
+
+        L'éviction n'est faite qu'une fois, à la fin : les plus anciens
+        (tous artifacts confondus) sont supprimés jusqu'à max_artifacts.
+
+        Args:
+            artifacts: Données des artifacts
+
+        Returns:
+            IDs des artifacts ajoutés
+        """
+        ids = []
+        for artifact in artifacts:
+            self._index(artifact["id"], artifact)
+            ids.append(artifact["id"])
+
+        excess = len(self.artifacts) - self.max_artifacts
+        if excess > 0:
+            oldest = heapq.nsmallest(
+                excess,
+                self.artifacts,
+                key=lambda k: self.artifacts[k].get("created_at", "")
+            )
+            for artifact_id in oldest:
+                self._unindex(artifact_id)
+            logger.warning(f"Removed {excess} oldest artifacts (max limit reached)")
+
+        logger.info(f"Added {len(ids)} artifacts to store")
+
+        return ids
+
     def get(self, artifact_id: str) -> Dict[str, Any] | None:
         """Récupère un artifact par son ID."""
         return self.artifacts.get(artifact_id)
@@ -54,11 +119,11 @@ class ArtifactStore:
         limit: int = 10
     ) -> List[Dict[str, Any]]:
         """Liste les artifacts avec filtres."""
-        artifacts = list(self.artifacts.values())
-
-        # Filtre par type
+        # Filtre par type via l'index (pas de parcours de tout le store)
         if type_filter:
-            artifacts = [a for a in artifacts if a.get("type") == type_filter]
+            artifacts = list(self._by_type.get(type_filter, {}).values())
+        else:
+            artifacts = list(self.artifacts.values())
 
         # Trie par date de création (plus récent d'abord)
         artifacts.sort(
@@ -82,8 +147,10 @@ class ArtifactStore:
             return None
 
         if content is not None:
+            size_bytes = len(content.encode('utf-8'))
+            self._total_size += size_bytes - artifact.get("size_bytes", 0)
             artifact["content"] = content
-            artifact["size_bytes"] = len(content.encode('utf-8'))
+            artifact["size_bytes"] = size_bytes
             artifact["lines"] = len(content.split('\n'))
 
         if description is not None:
@@ -100,8 +167,7 @@ class ArtifactStore:
 
     def delete(self, artifact_id: str) -> bool:
         """Supprime un artifact."""
-        if artifact_id in self.artifacts:
-            del self.artifacts[artifact_id]
+        if self._unindex(artifact_id) is not None:
             logger.info(f"Deleted artifact {artifact_id}")
             return True
 
@@ -109,18 +175,10 @@ class ArtifactStore:
 
     def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques du store."""
-        types = {}
-        total_size = 0
-
-        for artifact in self.artifacts.values():
-            artifact_type = artifact.get("type", "unknown")
-            types[artifact_type] = types.get(artifact_type, 0) + 1
-            total_size += artifact.get("size_bytes", 0)
-
         return {
             "total_artifacts": len(self.artifacts),
-            "by_type": types,
-            "total_size_bytes": total_size,
+            "by_type": {t: len(bucket) for t, bucket in self._by_type.items()},
+            "total_size_bytes": self._total_size,
             "max_artifacts": self.max_artifacts
         }
 
@@ -129,19 +187,23 @@ class ArtifactStore:
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.artifacts, f, indent=2, ensure_ascii=False)
+        # Sérialisation complète en mémoire puis écriture en un seul appel
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(self.artifacts, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.artifacts, indent=2, ensure_ascii=False).encode('utf-8')
+        path.write_bytes(payload)
 
         logger.info(f"Exported {len(self.artifacts)} artifacts to {filepath}")
 
     def import_from_file(self, filepath: str) -> int:
         """Importe des artifacts depuis un fichier JSON."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            imported = json.load(f)
+        raw = Path(filepath).read_bytes()
+        imported = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
         count = 0
         for artifact_id, artifact in imported.items():
-            self.artifacts[artifact_id] = artifact
+            self._index(artifact_id, artifact)
             count += 1
 
         logger.info(f"Imported {count} artifacts from {filepath}")
@@ -152,6 +214,8 @@ class ArtifactStore:
         """Vide le store."""
         count = len(self.artifacts)
         self.artifacts.clear()
+        self._by_type.clear()
+        self._total_size = 0
         logger.info(f"Cleared {count} artifacts from store")
 
 
@@ -6,7 +6,33 @@ from typing import Dict, Any, List
 from pathlib import Path
 from loguru import logger
 import json
+import os
 from datetime import datetime
+from .artifact_store import artifact_store
+
+# Langage par extension de fichier (table construite une fois au chargement)
+_LANG_BY_EXT: Dict[str, str] = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'jsx',
+    '.tsx': 'tsx',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.html': 'html',
+    '.css': 'css',
+    '.md': 'markdown',
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.toml': 'toml',
+    '.sh': 'bash',
+}
 
 class ArtifactType:
     """Types d'artifacts supportés."""
@@ -24,7 +50,7 @@ async def create_artifact(
     metadata: Dict[str, Any] | None = None
 ) -> Dict[str, Any]:
     """
-    Crée un artifact (fichier virtuel ou réel).
+    Crée un artifact (fichier virtuel ou réel) et l'ajoute au store.
 
     Args:
         name: Nom de l'artifact (ex: "script.py", "doc.md")
@@ -35,24 +61,81 @@ async def create_artifact(
         metadata: Métadonnées additionnelles
 
     Returns:
-        Informations sur l'artifact créé
+        Informations sur l'artifact créé (rien n'est stocké en cas d'erreur)
     """
     logger.info(f"Creating artifact: {name} (type={type})")
 
-    # Validation du type
-    valid_types = [ArtifactType.CODE, ArtifactType.DOCUMENT, ArtifactType.DATA, ArtifactType.CONFIG]
-    if type not in valid_types:
+    try:
+        artifact = _build_artifact(name, type, content, language, description, metadata)
+    except ValueError as e:
         return {
             "success": False,
-            "error": f"Invalid type. Must be one of: {valid_types}"
+            "error": str(e)
         }
 
+    artifact_store.add(artifact)
+
+    return {
+        "success": True,
+        "artifact": artifact
+    }
+
+async def create_artifacts(artifacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Crée plusieurs artifacts et les ajoute au store en un seul lot.
+
+    Args:
+        artifacts: Liste de specs (mêmes champs que create_artifact)
+
+    Returns:
+        Artifacts créés et erreurs éventuelles (par index de spec)
+    """
+    logger.info(f"Creating {len(artifacts)} artifacts in batch")
+
+    created = []
+    errors = []
+    for index, spec in enumerate(artifacts):
+        try:
+            created.append(_build_artifact(
+                spec["name"],
+                spec["type"],
+                spec["content"],
+                spec.get("language"),
+                spec.get("description"),
+                spec.get("metadata")
+            ))
+        except (KeyError, ValueError) as e:
+            errors.append({"index": index, "error": str(e)})
+
+    # Une seule insertion (et une seule passe d'éviction) pour tout le lot
+    artifact_store.add_many(created)
+
+    return {
+        "success": not errors,
+        "artifacts": created,
+        "errors": errors
+    }
+
+def _build_artifact(
+    name: str,
+    type: str,
+    content: str,
+    language: str | None = None,
+    description: str | None = None,
+    metadata: Dict[str, Any] | None = None
+) -> Dict[str, Any]:
+    """Valide les paramètres et construit le dict d'un artifact."""
+    # Validation du type
+    valid_types = [ArtifactType.CODE, ArtifactType.DOCUMENT, ArtifactType.DATA, ArtifactType.CONFIG]
+    if type not in valid_types:
+        raise ValueError(f"Invalid type. Must be one of: {valid_types}")
+
     # Détection automatique du langage si non fourni
     if not language and type == ArtifactType.CODE:
         language = _detect_language(name)
 
     # Création de l'artifact
-    artifact = {
+    return {
         "id": f"artifact_{hash(name + str(datetime.now())) % 100000}",
         "name": name,
         "type": type,
@@ -65,11 +148,6 @@ async def create_artifact(
         "lines": len(content.split('\n'))
     }
 
-    return {
-        "success": True,
-        "artifact": artifact
-    }
-
 async def save_artifact(
     artifact_id: str,
     path: str,
@@ -190,28 +268,4 @@ async def delete_artifact(artifact_id: str) -> Dict[str, Any]:
 
 def _detect_language(filename: str) -> str | None:
     """Détecte le langage depuis l'extension."""
-    extensions = {
-        '.py': 'python',
-        '.js': 'javascript',
-        '.ts': 'typescript',
-        '.jsx': 'jsx',
-        '.tsx': 'tsx',
-        '.java': 'java',
-        '.cpp': 'cpp',
-        '.c': 'c',
-        '.go': 'go',
-        '.rs': 'rust',
-        '.rb': 'ruby',
-        '.php': 'php',
-        '.html': 'html',
-        '.css': 'css',
-        '.md': 'markdown',
-        '.json': 'json',
-        '.yaml': 'yaml',
-        '.yml': 'yaml',
-        '.toml': 'toml',
-        '.sh': 'bash',
-    }
-
-    ext = Path(filename).suffix.lower()
-    return extensions.get(ext)
+    return _LANG_BY_EXT.get(os.path.splitext(filename)[1].lower())
@@ -130,6 +130,18 @@ CREATE_ARTIFACT_SCHEMA: Dict[str, Any] = {
     "required": ["name", "type", "content"]
 }
 
+CREATE_ARTIFACTS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "artifacts": {
+            "type": "array",
+            "description": "Artifacts à créer en un seul lot",
+            "items": CREATE_ARTIFACT_SCHEMA
+        }
+    },
+    "required": ["artifacts"]
+}
+
 SAVE_ARTIFACT_SCHEMA: Dict[str, Any] = {
     "type": "object",
     "properties": {
@@ -213,6 +225,7 @@ TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {
     "get_current_context": GET_CONTEXT_SCHEMA,
     # Artifacts
     "create_artifact": CREATE_ARTIFACT_SCHEMA,
+    "create_artifacts": CREATE_ARTIFACTS_SCHEMA,
     "save_artifact": SAVE_ARTIFACT_SCHEMA,
     "list_artifacts": LIST_ARTIFACTS_SCHEMA,
     "update_artifact": UPDATE_ARTIFACT_SCHEMA,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Callable, Awaitable
+from typing import Any, Dict, List, Callable, Awaitable, Mapping
 from dataclasses import dataclass
 import json
 from loguru import logger
@@ -8,7 +8,7 @@ class MCPTool:
     """Définition d'un outil MCP."""
     name: str
     description: str
-    input_schema: Dict[str, Any]
+    input_schema: Mapping[str, Any]
     handler: Callable[..., Awaitable[Any]]
 
 class MCPServer:
@@ -21,20 +21,32 @@ class MCPServer:
         self.name = name
         self.version = version
         self.tools: Dict[str, MCPTool] = {}
+        # Réponses des accesseurs en lecture seule, invalidées à chaque enregistrement
+        self._schema_cache: List[Dict[str, Any]] | None = None
+        self._info_cache: Dict[str, Any] | None = None
         logger.info(f"MCP Server initialized: {name} v{version}")
 
     def register_tool(self, tool: MCPTool) -> None:
         """Enregistre un nouvel outil."""
         self.tools[tool.name] = tool
+        self._schema_cache = None
+        self._info_cache = None
         logger.info(f"MCP tool registered: {tool.name}")
 
     def get_tools_schema(self) -> List[Dict[str, Any]]:
         """Retourne les schémas pour Gemini function calling."""
+        if self._schema_cache is None:
+            self._schema_cache = self._build_tools_schema()
+        # Copies superficielles : un appelant qui ajoute une clé n'altère pas le cache
+        return [dict(schema) for schema in self._schema_cache]
+
+    def _build_tools_schema(self) -> List[Dict[str, Any]]:
         return [
             {
                 "name": tool.name,
                 "description": tool.description,
-                "parameters": tool.input_schema
+                # Les schémas peuvent être des MappingProxyType en lecture seule
+                "parameters": dict(tool.input_schema)
             }
             for tool in self.tools.values()
         ]
@@ -56,6 +68,11 @@ class MCPServer:
 
     def get_server_info(self) -> Dict[str, Any]:
         """Info du serveur MCP."""
+        if self._info_cache is None:
+            self._info_cache = self._build_server_info()
+        return dict(self._info_cache)
+
+    def _build_server_info(self) -> Dict[str, Any]:
         return {
             "name": self.name,
             "version": self.version,
@@ -2,6 +2,7 @@
 Generic content generation tools.
 """
 from typing import Dict, Any, List
+from types import MappingProxyType
 from loguru import logger
 import asyncio
 
@@ -291,8 +292,8 @@ async def extract_entities(
     }
 
 
-# Tool schemas for MCP registration
-GENERATE_TEXT_SCHEMA = {
+# Tool schemas for MCP registration (read-only, safe to share without copying)
+GENERATE_TEXT_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "prompt": {"type": "string", "description": "Generation prompt"},
@@ -301,9 +302,9 @@ GENERATE_TEXT_SCHEMA = {
         "format": {"type": "string", "description": "Output format", "default": "paragraph"}
     },
     "required": ["prompt"]
-}
+})
 
-SUMMARIZE_CONTENT_SCHEMA = {
+SUMMARIZE_CONTENT_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "text": {"type": "string", "description": "Text to summarize"},
@@ -311,9 +312,9 @@ SUMMARIZE_CONTENT_SCHEMA = {
         "style": {"type": "string", "description": "Summary style", "default": "concise"}
     },
     "required": ["text"]
-}
+})
 
-GENERATE_OUTLINE_SCHEMA = {
+GENERATE_OUTLINE_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Content topic"},
@@ -321,9 +322,9 @@ GENERATE_OUTLINE_SCHEMA = {
         "detail_level": {"type": "string", "description": "Detail level", "default": "medium"}
     },
     "required": ["topic"]
-}
+})
 
-GENERATE_HEADLINES_SCHEMA = {
+GENERATE_HEADLINES_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Headline topic"},
@@ -331,4 +332,4 @@ GENERATE_HEADLINES_SCHEMA = {
         "style": {"type": "string", "description": "Headline style", "default": "engaging"}
     },
     "required": ["topic"]
-}
+})
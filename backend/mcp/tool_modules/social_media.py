@@ -2,10 +2,23 @@
 Social media content creation and management tools.
 """
 from typing import Dict, Any, List
+from types import MappingProxyType
 from loguru import logger
 import asyncio
 
 
+# Topic-independent hashtags, built once at import; only the topic tag varies per call
+_STATIC_HASHTAGS = (
+    {"tag": "#Business", "popularity": "high", "volume": 500000, "relevance": 0.85},
+    {"tag": "#Innovation", "popularity": "high", "volume": 350000, "relevance": 0.82},
+    {"tag": "#Marketing", "popularity": "medium", "volume": 280000, "relevance": 0.78},
+    {"tag": "#Growth", "popularity": "medium", "volume": 220000, "relevance": 0.75},
+    {"tag": "#Success", "popularity": "high", "volume": 180000, "relevance": 0.72},
+    {"tag": "#Entrepreneur", "popularity": "medium", "volume": 160000, "relevance": 0.70},
+    {"tag": "#Digital", "popularity": "medium", "volume": 140000, "relevance": 0.68},
+)
+
+
 async def generate_social_post(
     topic: str,
     platform: str = "twitter",
@@ -58,6 +71,46 @@ async def generate_social_post(
     }
 
 
+async def generate_multi_platform_post(
+    topic: str,
+    platforms: List[str] | None = None,
+    tone: str = "professional",
+    include_hashtags: bool = True
+) -> Dict[str, Any]:
+    """
+    Generate the same post for several platforms concurrently.
+
+    Args:
+        topic: Post topic
+        platforms: Target platforms (defaults to twitter, linkedin, instagram, facebook)
+        tone: Writing tone
+        include_hashtags: Whether to include hashtags
+
+    Returns:
+        Generated posts keyed by platform
+    """
+    if platforms is None:
+        platforms = ["twitter", "linkedin", "instagram", "facebook"]
+
+    logger.info(f"Generating multi-platform post about: {topic} ({len(platforms)} platforms)")
+
+    # TaskGroup cancels the remaining generations as soon as one fails
+    async with asyncio.TaskGroup() as tg:
+        tasks = {
+            platform: tg.create_task(
+                generate_social_post(topic, platform, tone, include_hashtags)
+            )
+            for platform in platforms
+        }
+
+    return {
+        "success": True,
+        "topic": topic,
+        "posts": {platform: task.result() for platform, task in tasks.items()},
+        "count": len(tasks)
+    }
+
+
 async def create_content_calendar(
     topic: str,
     duration_days: int = 7,
@@ -192,28 +245,22 @@ async def hashtag_research(
     logger.info(f"Researching hashtags for: {topic}")
     await asyncio.sleep(0.1)
     
-    hashtags = [
-        {"tag": f"#{topic.replace(' ', '')}", "popularity": "high", "volume": 150000, "relevance": 1.0},
-        {"tag": "#Business", "popularity": "high", "volume": 500000, "relevance": 0.85},
-        {"tag": "#Innovation", "popularity": "high", "volume": 350000, "relevance": 0.82},
-        {"tag": "#Marketing", "popularity": "medium", "volume": 280000, "relevance": 0.78},
-        {"tag": "#Growth", "popularity": "medium", "volume": 220000, "relevance": 0.75},
-        {"tag": "#Success", "popularity": "high", "volume": 180000, "relevance": 0.72},
-        {"tag": "#Entrepreneur", "popularity": "medium", "volume": 160000, "relevance": 0.70},
-        {"tag": "#Digital", "popularity": "medium", "volume": 140000, "relevance": 0.68},
-    ]
+    hashtags: List[Dict[str, Any]] = []
+    if max_hashtags > 0:
+        topic_tag = {"tag": f"#{topic.replace(' ', '')}", "popularity": "high", "volume": 150000, "relevance": 1.0}
+        hashtags = [topic_tag, *map(dict.copy, _STATIC_HASHTAGS[:max_hashtags - 1])]
     
     return {
         "success": True,
         "topic": topic,
         "platform": platform,
-        "hashtags": hashtags[:max_hashtags],
-        "count": len(hashtags[:max_hashtags])
+        "hashtags": hashtags,
+        "count": len(hashtags)
     }
 
 
-# Tool schemas for MCP registration
-GENERATE_SOCIAL_POST_SCHEMA = {
+# Tool schemas for MCP registration (read-only, safe to share without copying)
+GENERATE_SOCIAL_POST_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Post topic"},
@@ -222,9 +269,20 @@ GENERATE_SOCIAL_POST_SCHEMA = {
         "include_hashtags": {"type": "boolean", "description": "Include hashtags", "default": True}
     },
     "required": ["topic"]
-}
+})
+
+GENERATE_MULTI_PLATFORM_POST_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "topic": {"type": "string", "description": "Post topic"},
+        "platforms": {"type": "array", "items": {"type": "string"}, "description": "Target platforms"},
+        "tone": {"type": "string", "description": "Writing tone", "default": "professional"},
+        "include_hashtags": {"type": "boolean", "description": "Include hashtags", "default": True}
+    },
+    "required": ["topic"]
+})
 
-CREATE_CONTENT_CALENDAR_SCHEMA = {
+CREATE_CONTENT_CALENDAR_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Main topic"},
@@ -232,18 +290,18 @@ CREATE_CONTENT_CALENDAR_SCHEMA = {
         "posts_per_day": {"type": "integer", "description": "Posts per day", "default": 1}
     },
     "required": ["topic"]
-}
+})
 
-ANALYZE_POST_PERFORMANCE_SCHEMA = {
+ANALYZE_POST_PERFORMANCE_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "post_id": {"type": "string", "description": "Post identifier"},
         "platform": {"type": "string", "description": "Platform name"}
     },
     "required": ["post_id", "platform"]
-}
+})
 
-GENERATE_IMAGE_PROMPT_SCHEMA = {
+GENERATE_IMAGE_PROMPT_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Image topic"},
@@ -251,9 +309,9 @@ GENERATE_IMAGE_PROMPT_SCHEMA = {
         "dimensions": {"type": "string", "description": "Image dimensions", "default": "1024x1024"}
     },
     "required": ["topic"]
-}
+})
 
-HASHTAG_RESEARCH_SCHEMA = {
+HASHTAG_RESEARCH_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Content topic"},
@@ -261,4 +319,4 @@ HASHTAG_RESEARCH_SCHEMA = {
         "max_hashtags": {"type": "integer", "description": "Max hashtags", "default": 10}
     },
     "required": ["topic"]
-}
+})
@@ -2,6 +2,7 @@
 Web scraping and lead generation tools.
 """
 from typing import Dict, Any, List
+from types import MappingProxyType
 from loguru import logger
 import asyncio
 
@@ -163,8 +164,8 @@ async def save_leads_to_db(leads: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-# Tool schemas for MCP registration
-SEARCH_GOOGLE_MAPS_SCHEMA = {
+# Tool schemas for MCP registration (read-only, safe to share without copying)
+SEARCH_GOOGLE_MAPS_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "query": {"type": "string", "description": "Business type or keyword"},
@@ -172,37 +173,37 @@ SEARCH_GOOGLE_MAPS_SCHEMA = {
         "max_results": {"type": "integer", "description": "Maximum results", "default": 50}
     },
     "required": ["query", "location"]
-}
+})
 
-EXTRACT_BUSINESS_EMAIL_SCHEMA = {
+EXTRACT_BUSINESS_EMAIL_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "url": {"type": "string", "description": "Website URL"}
     },
     "required": ["url"]
-}
+})
 
-ENRICH_LEAD_DATA_SCHEMA = {
+ENRICH_LEAD_DATA_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "lead": {"type": "object", "description": "Lead information"}
     },
     "required": ["lead"]
-}
+})
 
-QUALIFY_LEAD_SCHEMA = {
+QUALIFY_LEAD_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "lead": {"type": "object", "description": "Lead information"},
         "criteria": {"type": "object", "description": "Qualification criteria"}
     },
     "required": ["lead", "criteria"]
-}
+})
 
-SAVE_LEADS_TO_DB_SCHEMA = {
+SAVE_LEADS_TO_DB_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "leads": {"type": "array", "description": "List of leads", "items": {"type": "object"}}
     },
     "required": ["leads"]
-}
+})
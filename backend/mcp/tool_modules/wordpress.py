@@ -2,10 +2,20 @@
 WordPress content creation and publishing tools.
 """
 from typing import Dict, Any, List
+from types import MappingProxyType
 from loguru import logger
 import asyncio
 
 
+# Keyword variants built once at import; only the topic is substituted per call
+_KEYWORD_TEMPLATES = (
+    ("{topic} guide", {"volume": 2500, "difficulty": 35, "cpc": 3.20, "relevance": 0.95}),
+    ("best {topic}", {"volume": 3000, "difficulty": 50, "cpc": 4.10, "relevance": 0.90}),
+    ("{topic} tutorial", {"volume": 1800, "difficulty": 30, "cpc": 2.80, "relevance": 0.88}),
+    ("how to {topic}", {"volume": 4200, "difficulty": 40, "cpc": 3.50, "relevance": 0.85}),
+)
+
+
 async def research_keywords(
     topic: str,
     max_keywords: int = 10
@@ -23,19 +33,19 @@ async def research_keywords(
     logger.info(f"Researching keywords for: {topic}")
     await asyncio.sleep(0.1)
     
-    keywords = [
-        {"keyword": topic.lower(), "volume": 5000, "difficulty": 45, "cpc": 2.50, "relevance": 1.0},
-        {"keyword": f"{topic} guide", "volume": 2500, "difficulty": 35, "cpc": 3.20, "relevance": 0.95},
-        {"keyword": f"best {topic}", "volume": 3000, "difficulty": 50, "cpc": 4.10, "relevance": 0.90},
-        {"keyword": f"{topic} tutorial", "volume": 1800, "difficulty": 30, "cpc": 2.80, "relevance": 0.88},
-        {"keyword": f"how to {topic}", "volume": 4200, "difficulty": 40, "cpc": 3.50, "relevance": 0.85},
-    ]
+    keywords: List[Dict[str, Any]] = []
+    if max_keywords > 0:
+        keywords = [{"keyword": topic.lower(), "volume": 5000, "difficulty": 45, "cpc": 2.50, "relevance": 1.0}]
+        keywords.extend(
+            {"keyword": pattern.format(topic=topic), **metrics}
+            for pattern, metrics in _KEYWORD_TEMPLATES[:max_keywords - 1]
+        )
     
     return {
         "success": True,
         "topic": topic,
-        "keywords": keywords[:max_keywords],
-        "count": len(keywords[:max_keywords])
+        "keywords": keywords,
+        "count": len(keywords)
     }
 
 
@@ -235,17 +245,23 @@ async def fetch_stock_images(
     logger.info(f"Fetching stock images: {query}")
     await asyncio.sleep(0.1)
     
-    images = []
-    for i in range(count):
-        images.append({
-            "id": f"img_{i+1}",
-            "url": f"https://example.com/images/{query.replace(' ', '-')}-{i+1}.jpg",
-            "thumbnail": f"https://example.com/thumbs/{query.replace(' ', '-')}-{i+1}.jpg",
+    slug = query.replace(" ", "-")
+    url_base = f"https://example.com/images/{slug}-"
+    thumb_base = f"https://example.com/thumbs/{slug}-"
+    alt_base = f"{query} image "
+    
+    images = [
+        {
+            "id": f"img_{i}",
+            "url": f"{url_base}{i}.jpg",
+            "thumbnail": f"{thumb_base}{i}.jpg",
             "width": 1200,
             "height": 800,
-            "alt": f"{query} image {i+1}",
+            "alt": f"{alt_base}{i}",
             "license": "free"
-        })
+        }
+        for i in range(1, count + 1)
+    ]
     
     return {
         "success": True,
@@ -342,17 +358,72 @@ async def calculate_readability(content: str) -> Dict[str, Any]:
     }
 
 
-# Tool schemas for MCP registration
-RESEARCH_KEYWORDS_SCHEMA = {
+async def publish_wordpress_pipeline(
+    topic: str,
+    wordpress_url: str,
+    api_key: str = None,
+    status: str = "draft"
+) -> Dict[str, Any]:
+    """
+    Run the full article publishing pipeline.
+
+    Independent analysis steps (SEO score, readability, featured image,
+    stock images) run concurrently once the article is generated.
+
+    Args:
+        topic: Article topic
+        wordpress_url: WordPress site URL
+        api_key: WordPress API key
+        status: Post status (draft, publish)
+
+    Returns:
+        Article, analyses and created post information
+    """
+    logger.info(f"Running WordPress publishing pipeline for: {topic}")
+
+    keywords = (await research_keywords(topic))["keywords"]
+    keyword_list = [kw["keyword"] for kw in keywords]
+    article = await generate_article_content(topic, keyword_list)
+
+    seo, readability, featured_image, stock_images = await asyncio.gather(
+        calculate_seo_score(article, keyword_list),
+        calculate_readability("\n\n".join(s["content"] for s in article["sections"])),
+        generate_featured_image(topic),
+        fetch_stock_images(topic)
+    )
+
+    post = await create_wordpress_post(article, wordpress_url, api_key, status)
+    yoast = await set_yoast_seo_meta(post["post_id"], {
+        "yoast_title": article["title"],
+        "yoast_description": article["excerpt"],
+        "yoast_focus_keyword": keyword_list[0] if keyword_list else topic
+    })
+
+    return {
+        "success": True,
+        "topic": topic,
+        "keywords": keywords,
+        "article": article,
+        "seo": seo,
+        "readability": readability,
+        "featured_image": featured_image,
+        "stock_images": stock_images,
+        "post": post,
+        "yoast": yoast
+    }
+
+
+# Tool schemas for MCP registration (read-only, safe to share without copying)
+RESEARCH_KEYWORDS_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Article topic"},
         "max_keywords": {"type": "integer", "description": "Max keywords", "default": 10}
     },
     "required": ["topic"]
-}
+})
 
-GENERATE_ARTICLE_CONTENT_SCHEMA = {
+GENERATE_ARTICLE_CONTENT_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Article topic"},
@@ -361,18 +432,18 @@ GENERATE_ARTICLE_CONTENT_SCHEMA = {
         "tone": {"type": "string", "description": "Writing tone", "default": "professional"}
     },
     "required": ["topic", "keywords"]
-}
+})
 
-CALCULATE_SEO_SCORE_SCHEMA = {
+CALCULATE_SEO_SCORE_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "article": {"type": "object", "description": "Article content"},
         "keywords": {"type": "array", "items": {"type": "string"}, "description": "Keywords"}
     },
     "required": ["article", "keywords"]
-}
+})
 
-CREATE_WORDPRESS_POST_SCHEMA = {
+CREATE_WORDPRESS_POST_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "article": {"type": "object", "description": "Article content"},
@@ -381,9 +452,9 @@ CREATE_WORDPRESS_POST_SCHEMA = {
         "status": {"type": "string", "description": "Post status", "default": "draft"}
     },
     "required": ["article", "wordpress_url"]
-}
+})
 
-GENERATE_FEATURED_IMAGE_SCHEMA = {
+GENERATE_FEATURED_IMAGE_SCHEMA = MappingProxyType({
     "type": "object",
     "properties": {
         "topic": {"type": "string", "description": "Image topic"},
@@ -391,4 +462,15 @@ GENERATE_FEATURED_IMAGE_SCHEMA = {
         "size": {"type": "string", "description": "Image size", "default": "1200x630"}
     },
     "required": ["topic"]
-}
+})
+
+PUBLISH_WORDPRESS_PIPELINE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "topic": {"type": "string", "description": "Article topic"},
+        "wordpress_url": {"type": "string", "description": "WordPress URL"},
+        "api_key": {"type": "string", "description": "API key"},
+        "status": {"type": "string", "description": "Post status", "default": "draft"}
+    },
+    "required": ["topic", "wordpress_url"]
+})
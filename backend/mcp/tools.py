@@ -1,9 +1,60 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from types import CodeType
 from loguru import logger
+import ast
 import asyncio
+import re
+
+_WORD_RE = re.compile(r'\b\w{4,}\b')
+
+# Lexique de sentiment, compilé une fois en une seule alternation (un seul passage sur le texte)
+_POSITIVE_WORDS = frozenset({'bon', 'excellent', 'super', 'génial', 'parfait', 'merci'})
+_NEGATIVE_WORDS = frozenset({'mauvais', 'nul', 'problème', 'erreur', 'bug'})
+_SENTIMENT_RE = re.compile(
+    "|".join(map(re.escape, sorted(_POSITIVE_WORDS | _NEGATIVE_WORDS, key=len, reverse=True)))
+)
+
+
+@dataclass
+class TextView:
+    """
+    Vue d'un texte partagée entre plusieurs outils d'analyse.
+
+    La version minuscule et les tokens sont calculés à la demande puis
+    réutilisés, ce qui évite de refaire `lower()` dans chaque outil.
+    """
+    raw: str
+    _lower: str | None = field(default=None, init=False, repr=False)
+    _tokens: Tuple[str, ...] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.raw.lower()
+        return self._lower
+
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """Mots d'au moins 4 caractères, en minuscules."""
+        if self._tokens is None:
+            self._tokens = tuple(_WORD_RE.findall(self.lower))
+        return self._tokens
 
 # === MEMORY TOOLS ===
 
+# Cache LRU des recherches, clé (requête, top_k, version de la mémoire)
+_SEARCH_CACHE_MAX = 512
+_search_cache: OrderedDict[Tuple[str, int, int], List[Dict[str, Any]]] = OrderedDict()
+# Incrémentée à chaque écriture : les recherches antérieures deviennent obsolètes.
+# store_memory est le seul écrivain de cette mémoire ; tout nouveau chemin d'écriture
+# doit aussi l'incrémenter, sinon le cache sert des résultats périmés.
+_memory_version = 0
+
 async def search_memory(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
     """
     Recherche sémantique dans la mémoire de l'agent.
@@ -13,10 +64,24 @@ async def search_memory(query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         top_k: Nombre de résultats à retourner
 
     Returns:
-        Liste de résultats avec scores
+        Liste de résultats avec scores (copie : la modifier n'altère pas le cache)
     """
-    logger.info(f"Searching memory for: {query} (top_k={top_k})")
+    key = (query, top_k, _memory_version)
+    cached = _search_cache.get(key)
+    if cached is None:
+        logger.info(f"Searching memory for: {query} (top_k={top_k})")
+        cached = await _search(query, top_k)
+
+        _search_cache[key] = cached
+        if len(_search_cache) > _SEARCH_CACHE_MAX:
+            _search_cache.popitem(last=False)
+    else:
+        _search_cache.move_to_end(key)
 
+    return [dict(item) for item in cached]
+
+async def _search(query: str, top_k: int) -> List[Dict[str, Any]]:
+    """Recherche effective (non mise en cache)."""
     # Simulation - à remplacer par une vraie recherche vectorielle
     await asyncio.sleep(0.1)  # Simule une latence
 
@@ -41,7 +106,9 @@ async def store_memory(content: str, metadata: Dict[str, Any] | None = None) ->
     Returns:
         Confirmation avec ID
     """
+    global _memory_version
     logger.info(f"Storing memory: {content[:50]}...")
+    _memory_version += 1
 
     memory_id = f"mem_{hash(content) % 100000}"
 
@@ -53,25 +120,23 @@ async def store_memory(content: str, metadata: Dict[str, Any] | None = None) ->
 
 # === ANALYSIS TOOLS ===
 
-async def analyze_sentiment(text: str) -> Dict[str, Any]:
+async def analyze_sentiment(text: str | TextView) -> Dict[str, Any]:
     """
     Analyse le sentiment d'un texte.
 
     Args:
-        text: Texte à analyser
+        text: Texte à analyser (ou TextView partagée avec d'autres outils)
 
     Returns:
         Résultats d'analyse de sentiment
     """
-    logger.info(f"Analyzing sentiment for text length: {len(text)}")
-
-    # Analyse basique
-    positive_words = ['bon', 'excellent', 'super', 'génial', 'parfait', 'merci']
-    negative_words = ['mauvais', 'nul', 'problème', 'erreur', 'bug']
+    view = text if isinstance(text, TextView) else TextView(text)
+    logger.info(f"Analyzing sentiment for text length: {len(view.raw)}")
 
-    text_lower = text.lower()
-    pos_count = sum(1 for word in positive_words if word in text_lower)
-    neg_count = sum(1 for word in negative_words if word in text_lower)
+    # Analyse basique : chaque indicateur présent compte une fois
+    found = set(_SENTIMENT_RE.findall(view.lower))
+    pos_count = len(found & _POSITIVE_WORDS)
+    neg_count = len(found & _NEGATIVE_WORDS)
 
     total = pos_count + neg_count
     if total == 0:
@@ -94,25 +159,23 @@ async def analyze_sentiment(text: str) -> Dict[str, Any]:
         }
     }
 
-async def extract_keywords(text: str, max_keywords: int = 10) -> List[Dict[str, Any]]:
+async def extract_keywords(text: str | TextView, max_keywords: int = 10) -> List[Dict[str, Any]]:
     """
     Extrait les mots-clés importants d'un texte.
 
     Args:
-        text: Texte à analyser
+        text: Texte à analyser (ou TextView partagée avec d'autres outils)
         max_keywords: Nombre maximum de mots-clés
 
     Returns:
         Liste de mots-clés avec scores
     """
-    logger.info(f"Extracting keywords from text length: {len(text)}")
+    view = text if isinstance(text, TextView) else TextView(text)
+    logger.info(f"Extracting keywords from text length: {len(view.raw)}")
 
     # Extraction basique par fréquence (à améliorer avec TF-IDF)
-    import re
-    from collections import Counter
-
     # Nettoie et tokenize
-    words = re.findall(r'\b\w{4,}\b', text.lower())
+    words = view.tokens
 
     # Stop words français basiques
     stop_words = {'dans', 'avec', 'pour', 'cette', 'mais', 'sont', 'était', 'fait', 'plus'}
@@ -123,13 +186,37 @@ async def extract_keywords(text: str, max_keywords: int = 10) -> List[Dict[str,
 
     keywords = [
         {"keyword": word, "frequency": count, "score": count / len(words)}
-        for word, count in word_counts.most_common(max_keywords)
+        # Sélection top-k par tas : O(N log k) au lieu d'un tri complet
+        for word, count in nlargest(max_keywords, word_counts.items(), key=itemgetter(1))
     ]
 
     return keywords
 
 # === UTILITY TOOLS ===
 
+# Sécurité: whitelist des opérations autorisées
+_ALLOWED_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub)
+
+def _check_expr(node: ast.AST) -> None:
+    """Vérifie récursivement que l'arbre ne contient que de l'arithmétique."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        # Calcul en flottants : un dépassement lève une erreur au lieu d'un entier géant
+        node.value = float(node.value)
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, _ALLOWED_OPERATORS):
+        _check_expr(node.left)
+        _check_expr(node.right)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, _ALLOWED_OPERATORS):
+        _check_expr(node.operand)
+    else:
+        raise ValueError(f"Unsupported operation: {type(node)}")
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expression: str) -> CodeType:
+    """Parse, valide et compile une expression (mis en cache par texte d'expression)."""
+    tree = ast.parse(expression, mode='eval')
+    _check_expr(tree.body)
+    return compile(tree, "<calculate>", "eval")
+
 async def calculate(expression: str) -> Dict[str, Any]:
     """
     Évalue une expression mathématique.
@@ -143,31 +230,7 @@ async def calculate(expression: str) -> Dict[str, Any]:
     logger.info(f"Calculating: {expression}")
 
     try:
-        # Sécurité: whitelist des opérations autorisées
-        import ast
-        import operator
-
-        ops = {
-            ast.Add: operator.add,
-            ast.Sub: operator.sub,
-            ast.Mult: operator.mul,
-            ast.Div: operator.truediv,
-            ast.Pow: operator.pow,
-            ast.USub: operator.neg,
-        }
-
-        def eval_expr(node: Any) -> float:
-            if isinstance(node, ast.Num):
-                return float(node.n)
-            elif isinstance(node, ast.BinOp):
-                return ops[type(node.op)](eval_expr(node.left), eval_expr(node.right))
-            elif isinstance(node, ast.UnaryOp):
-                return ops[type(node.op)](eval_expr(node.operand))
-            else:
-                raise ValueError(f"Unsupported operation: {type(node)}")
-
-        tree = ast.parse(expression, mode='eval')
-        result = eval_expr(tree.body)
+        result = eval(_compile_expression(expression), {"__builtins__": {}}, {})
 
         return {
             "expression": expression,
@@ -1,6 +1,53 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Deque
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from loguru import logger
+import re
+import time
+from ..utils.clock import monotonic_to_iso
+
+# Seuil (fraction de max_length) déclenchant le résumé des anciens tours
+SUMMARY_THRESHOLD = 0.8
+# Nombre minimal de tours avant de résumer
+SUMMARY_MIN_TURNS = 8
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+# Faits conservés tels quels : URLs, citations et nombres
+_FACT_RE = re.compile(r'https?://\S*[^\s.,;:!?)]|"[^"]+"|«[^»]+»|\b\d+(?:[.,]\d+)?%?')
+
+@dataclass(slots=True)
+class Turn:
+    """Tour de conversation (slots : empreinte mémoire réduite, accès attributs rapide)."""
+    role: str
+    content: str
+    ts_ns: int
+    tokens: int
+    formatted: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def create(cls, role: str, content: str, metadata: Dict[str, Any] | None = None) -> "Turn":
+        """Construit un tour avec son texte formaté et son estimation de tokens."""
+        return cls(
+            role=role,
+            content=content,
+            # Horodatage monotone, formaté en ISO uniquement à l'export
+            ts_ns=time.monotonic_ns(),
+            # Approximation : 1 token ≈ 4 caractères
+            tokens=max(1, (len(content) + len(role) + len(str(metadata or ""))) // 4),
+            formatted=f"{role.upper()}: {content}",
+            metadata=metadata or {}
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le tour en dictionnaire exportable."""
+        return {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": monotonic_to_iso(self.ts_ns),
+            "metadata": self.metadata
+        }
 
 class ContextManager:
     """
@@ -10,7 +57,16 @@ class ContextManager:
 
     def __init__(self, max_length: int = 8000):
         self.max_length = max_length
-        self.history: List[Dict[str, Any]] = []
+        # deque : éviction O(1) des tours les plus anciens
+        self.history: Deque[Turn] = deque()
+        # Estimation de tokens maintenue incrémentalement (évite de reconstruire le contexte)
+        self._total_tokens = 0
+        self._has_system = False
+        # Tours ajoutés depuis la dernière tentative de résumé (hystérésis)
+        self._turns_since_compaction = 0
+        # Cache du contexte texte, invalidé à chaque mutation de l'historique
+        self._context_cache = ""
+        self._context_dirty = False
         self.session_metadata: Dict[str, Any] = {
             "session_id": None,
             "user_id": None,
@@ -25,74 +81,129 @@ class ContextManager:
         metadata: Dict[str, Any] | None = None
     ) -> None:
         """Ajoute un tour de conversation."""
-        turn = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.now().isoformat(),
-            "metadata": metadata or {}
-        }
+        turn = Turn.create(role, content, metadata)
+
+        if not self.history and role == "system":
+            self._has_system = True
 
         self.history.append(turn)
+        self._total_tokens += turn.tokens
+        self._turns_since_compaction += 1
+        self._context_dirty = True
         logger.debug(f"Added turn: {role} ({len(content)} chars)")
 
         # Tronque si nécessaire
         self._truncate_if_needed()
 
-    def get_recent_history(self, n_turns: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_history(self, n_turns: int = 10) -> List[Turn]:
         """Récupère les N derniers tours."""
-        return self.history[-n_turns:]
+        return list(self.history)[-n_turns:]
 
     def get_full_context(self) -> str:
         """Construit le contexte complet sous forme de texte."""
-        context_parts = []
+        if self._context_dirty:
+            self._context_cache = "\n\n".join(turn.formatted for turn in self.history)
+            self._context_dirty = False
 
-        for turn in self.history:
-            role = turn["role"]
-            content = turn["content"]
-            context_parts.append(f"{role.upper()}: {content}")
-
-        return "\n\n".join(context_parts)
+        return self._context_cache
 
     def get_token_count_estimate(self) -> int:
         """Estime le nombre de tokens dans le contexte."""
-        # Approximation : 1 token ≈ 4 caractères
-        full_context = self.get_full_context()
-        return len(full_context) // 4
+        return self._total_tokens
 
     def _truncate_if_needed(self) -> None:
         """Tronque l'historique si la limite est dépassée."""
-        while self.get_token_count_estimate() > self.max_length:
+        # Résume d'abord la moitié la plus ancienne à l'approche de la limite,
+        # au plus une tentative tous les SUMMARY_MIN_TURNS nouveaux tours
+        if (
+            self._total_tokens > SUMMARY_THRESHOLD * self.max_length
+            and len(self.history) > SUMMARY_MIN_TURNS
+            and self._turns_since_compaction >= SUMMARY_MIN_TURNS
+        ):
+            self._turns_since_compaction = 0
+            self._compact_old_turns()
+
+        # Supprime le tour le plus ancien, hors tête protégée (system et résumés)
+        while self._total_tokens > self.max_length:
             if len(self.history) <= 2:
                 # Garde au moins 2 tours
                 break
 
-            # Supprime le tour le plus ancien (sauf le premier system message si présent)
-            if self.history[0]["role"] == "system":
-                self.history.pop(1)
-            else:
-                self.history.pop(0)
+            head = self._head_length()
+            # Un résumé n'est sacrifié que s'il ne reste plus qu'un tour ordinaire
+            index = head if len(self.history) - head > 1 else int(self._has_system)
+            removed = self.history[index]
+            del self.history[index]
+            self._total_tokens -= removed.tokens
+            self._context_dirty = True
 
             logger.debug("Truncated history to fit max_length")
 
+    def _head_length(self) -> int:
+        """Longueur de la tête protégée : message system initial puis tours de résumé."""
+        head = 1 if self._has_system else 0
+        while head < len(self.history) and self.history[head].metadata.get("summary"):
+            head += 1
+        return head
+
+    def _compact_old_turns(self) -> None:
+        """Remplace la moitié la plus ancienne de l'historique par un tour système de résumé."""
+        turns = list(self.history)
+        # Les résumés existants ne sont pas re-résumés (perte d'information cumulée)
+        start = self._head_length()
+        end = len(turns) // 2
+        old_turns = turns[start:end]
+        if len(old_turns) < 2:
+            return
+
+        summary = Turn.create(
+            "system",
+            "[Summary]\n" + self._summarize_turns(old_turns),
+            {"summary": True}
+        )
+        removed_tokens = sum(turn.tokens for turn in old_turns)
+        if summary.tokens >= removed_tokens:
+            return
+
+        self.history = deque(turns[:start] + [summary] + turns[end:])
+        self._total_tokens += summary.tokens - removed_tokens
+        self._context_dirty = True
+        logger.debug(f"Summarized {len(old_turns)} old turns")
+
+    @staticmethod
+    def _summarize_turns(turns: List[Turn]) -> str:
+        """Résumé heuristique (sans LLM) : première phrase de chaque tour et faits extraits."""
+        lines = []
+        facts: Dict[str, None] = {}
+
+        for turn in turns:
+            content = turn.content.strip()
+            first_sentence = _SENTENCE_END_RE.split(content, 1)[0][:120]
+            lines.append(f"- {turn.role}: {first_sentence}")
+            facts.update(dict.fromkeys(_FACT_RE.findall(content)))
+
+        if facts:
+            lines.append("Faits: " + ", ".join(list(facts)[:20]))
+
+        return "\n".join(lines)
+
     def summarize_old_context(self) -> str:
         """Résume l'ancien contexte (pour compression)."""
         if len(self.history) < 5:
             return ""
 
-        # Résumé basique des N premiers tours
-        old_turns = self.history[:5]
-        summary_parts = []
-
-        for turn in old_turns:
-            role = turn["role"]
-            content = turn["content"][:100]  # Premiers 100 chars
-            summary_parts.append(f"{role}: {content}...")
-
-        return "Contexte précédent: " + " | ".join(summary_parts)
+        # Résumé heuristique des N premiers tours
+        old_turns = list(self.history)[:5]
+        return "Contexte précédent:\n" + self._summarize_turns(old_turns)
 
     def clear(self) -> None:
         """Vide l'historique."""
         self.history.clear()
+        self._total_tokens = 0
+        self._has_system = False
+        self._turns_since_compaction = 0
+        self._context_cache = ""
+        self._context_dirty = False
         logger.info("Context cleared")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -106,4 +217,4 @@ class ContextManager:
 
     def export_history(self) -> List[Dict[str, Any]]:
         """Exporte l'historique complet."""
-        return self.history.copy()
+        return [turn.to_dict() for turn in self.history]
@@ -1,16 +1,34 @@
 from typing import Dict, List, Any, Tuple
+import json
 import networkx as nx
+import numpy as np
 from loguru import logger
-from datetime import datetime
+import time
+from ..utils.clock import monotonic_to_iso
+
+# Nombre minimal de nœuds modifiés avant reconstruction complète du snapshot CSR
+CSR_REBUILD_MIN_DIRTY = 64
 
 class GraphMemory:
     """
     Graphe morphique de mémoire.
     Stocke les relations pondérées entre concepts/entités.
+
+    Les arêtes ajoutées directement sur `graph` (hors add_edge) entre nœuds déjà
+    indexés ne sont vues par le BFS qu'à la reconstruction suivante du snapshot.
     """
 
     def __init__(self):
         self.graph = nx.DiGraph()
+        # Snapshot CSR de l'adjacence, reconstruit paresseusement : seuls les nœuds
+        # dont les arêtes sortantes ont changé sont suivis entre deux reconstructions
+        self._dirty_nodes: set[str] = set()
+        # Statistiques mises en cache (density / connexité coûtent O(V+E))
+        self._stats_cache: Dict[str, Any] | None = None
+        self._indptr = np.zeros(1, dtype=np.int32)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._id_to_idx: Dict[str, int] = {}
+        self._idx_to_id: List[str] = []
         logger.info("GraphMemory initialized")
 
     def add_node(self, node_id: str, node_type: str, data: Dict[str, Any] | None = None) -> None:
@@ -19,8 +37,10 @@ class GraphMemory:
             node_id,
             type=node_type,
             data=data or {},
-            created_at=datetime.now().isoformat()
+            created_ns=time.monotonic_ns()
         )
+        # Un nœud isolé n'atteint rien : le snapshot CSR reste valide pour le BFS
+        self._stats_cache = None
         logger.debug(f"Added node: {node_id} (type={node_type})")
 
     def add_edge(
@@ -44,8 +64,9 @@ class GraphMemory:
             relation=relation,
             weight=weight,
             metadata=metadata or {},
-            created_at=datetime.now().isoformat()
+            created_ns=time.monotonic_ns()
         )
+        self._invalidate(source)
         logger.debug(f"Added edge: {source} --[{relation}]--> {target} (weight={weight})")
 
     def strengthen_edge(self, source: str, target: str, delta: float = 0.1) -> None:
@@ -62,9 +83,7 @@ class GraphMemory:
             return []
 
         neighbors = []
-        for neighbor in self.graph.successors(node_id):
-            edge_data = self.graph[node_id][neighbor]
-
+        for neighbor, edge_data in self.graph[node_id].items():
             if relation is None or edge_data.get("relation") == relation:
                 neighbors.append((neighbor, edge_data))
 
@@ -85,20 +104,31 @@ class GraphMemory:
         if not self.graph.has_node(node_id):
             return []
 
-        visited = set()
-        queue = [(node_id, 0)]
+        self._ensure_csr()
+        nodes = self.graph.nodes
         results = []
 
-        while queue:
-            current, depth = queue.pop(0)
-
-            if current in visited or depth > max_depth:
-                continue
-
-            visited.add(current)
-
-            if current != node_id:
-                node_data = self.graph.nodes[current]
+        # BFS par niveaux sur le snapshot CSR avec bitmap de visite
+        visited = np.zeros(len(self._idx_to_id), dtype=bool)
+        start = self._id_to_idx[node_id]
+        visited[start] = True
+        frontier = [start]
+
+        for depth in range(1, max_depth + 1):
+            if not frontier:
+                break
+
+            candidates = np.concatenate([self._successor_indices(u) for u in frontier])
+            candidates = candidates[~visited[candidates]]
+            # Dédoublonne en conservant l'ordre de découverte
+            _, first = np.unique(candidates, return_index=True)
+            level = candidates[np.sort(first)]
+            visited[level] = True
+            frontier = level.tolist()
+
+            for j in frontier:
+                current = self._idx_to_id[j]
+                node_data = nodes[current]
                 results.append({
                     "node_id": current,
                     "type": node_data.get("type", "unknown"),
@@ -106,28 +136,101 @@ class GraphMemory:
                     "data": node_data.get("data", {})
                 })
 
-            # Ajoute les voisins à la queue
-            for neighbor in self.graph.successors(current):
-                if neighbor not in visited:
-                    queue.append((neighbor, depth + 1))
-
         return results
 
+    def _successor_indices(self, i: int) -> np.ndarray:
+        """Indices des successeurs d'un nœud indexé, en tenant compte des nœuds modifiés."""
+        node_id = self._idx_to_id[i]
+        if node_id in self._dirty_nodes:
+            id_to_idx = self._id_to_idx
+            return np.array(
+                [id_to_idx[target] for target in self.graph[node_id]],
+                dtype=np.int32
+            )
+        return self._indices[self._indptr[i]:self._indptr[i + 1]]
+
+    def _ensure_csr(self) -> None:
+        """
+        Reconstruit le snapshot CSR si des nœuds n'y sont pas indexés ou si trop de
+        nœuds ont été modifiés ; sinon les nœuds modifiés sont lus dans le graphe.
+        """
+        threshold = max(CSR_REBUILD_MIN_DIRTY, len(self._idx_to_id) // 16)
+        if (
+            len(self._idx_to_id) == self.graph.number_of_nodes()
+            and len(self._dirty_nodes) <= threshold
+        ):
+            return
+
+        idx_to_id = sorted(self.graph.nodes)
+        id_to_idx = {node: i for i, node in enumerate(idx_to_id)}
+        n_edges = self.graph.number_of_edges()
+
+        indptr = np.zeros(len(idx_to_id) + 1, dtype=np.int32)
+        indices = np.empty(n_edges, dtype=np.int32)
+
+        # Successeurs dans l'ordre d'insertion, comme graph.successors
+        pos = 0
+        for i, node in enumerate(idx_to_id):
+            for target in self.graph[node]:
+                indices[pos] = id_to_idx[target]
+                pos += 1
+            indptr[i + 1] = pos
+
+        self._indptr, self._indices = indptr, indices
+        self._id_to_idx, self._idx_to_id = id_to_idx, idx_to_id
+        self._dirty_nodes.clear()
+
     def get_stats(self) -> Dict[str, Any]:
-        """Retourne les statistiques du graphe."""
-        return {
-            "nodes": self.graph.number_of_nodes(),
-            "edges": self.graph.number_of_edges(),
-            "density": nx.density(self.graph) if self.graph.number_of_nodes() > 0 else 0,
-            "is_connected": nx.is_weakly_connected(self.graph) if self.graph.number_of_nodes() > 0 else False
-        }
+        """Retourne les statistiques du graphe (recalculées uniquement après mutation)."""
+        if self._stats_cache is None:
+            self._stats_cache = {
+                "nodes": self.graph.number_of_nodes(),
+                "edges": self.graph.number_of_edges(),
+                "density": nx.density(self.graph) if self.graph.number_of_nodes() > 0 else 0,
+                "is_connected": (
+                    nx.is_weakly_connected(self.graph)
+                    if self.graph.number_of_nodes() > 0 else False
+                )
+            }
+        return dict(self._stats_cache)
+
+    def _invalidate(self, node_id: str) -> None:
+        """Marque les arêtes sortantes d'un nœud comme modifiées et invalide les statistiques."""
+        self._dirty_nodes.add(node_id)
+        self._stats_cache = None
 
     def export_graphml(self, filepath: str) -> None:
-        """Exporte le graphe au format GraphML."""
-        nx.write_graphml(self.graph, filepath)
+        """Exporte le graphe au format GraphML (dates ISO, dicts sérialisés en JSON)."""
+        exported = nx.DiGraph()
+        exported.add_nodes_from(
+            (node, _export_attrs(attrs)) for node, attrs in self.graph.nodes(data=True)
+        )
+        exported.add_edges_from(
+            (source, target, _export_attrs(attrs))
+            for source, target, attrs in self.graph.edges(data=True)
+        )
+        nx.write_graphml(exported, filepath)
         logger.info(f"Graph exported to {filepath}")
 
     def clear(self) -> None:
         """Vide le graphe."""
         self.graph.clear()
+        self._dirty_nodes.clear()
+        self._id_to_idx, self._idx_to_id = {}, []
+        self._indptr = np.zeros(1, dtype=np.int32)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._stats_cache = None
         logger.info("Graph memory cleared")
+
+
+def _export_attrs(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """Attributs sérialisables : horodatage monotone converti en `created_at` ISO à l'export."""
+    exported = {}
+    for key, value in attrs.items():
+        if key == "created_ns":
+            exported["created_at"] = monotonic_to_iso(value)
+        elif isinstance(value, (dict, list)):
+            exported[key] = json.dumps(value, ensure_ascii=False)
+        else:
+            exported[key] = value
+    return exported
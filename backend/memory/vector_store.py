@@ -1,5 +1,10 @@
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Literal
+from pathlib import Path
 import numpy as np
+import json
+import os
+import threading
+from contextlib import nullcontext
 from loguru import logger
 
 try:
@@ -10,69 +15,205 @@ except ImportError:
     logger.warning("FAISS not available, using simple similarity")
 
 try:
+    import torch
     from sentence_transformers import SentenceTransformer
     SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     logger.warning("sentence-transformers not available, using dummy embeddings")
 
+try:
+    from scipy.linalg.blas import sgemv
+    SGEMV_AVAILABLE = True
+except ImportError:
+    SGEMV_AVAILABLE = False
+
+# Modèle d'embeddings partagé, chargé paresseusement au premier encodage
+_ENCODER_MODEL = 'all-MiniLM-L6-v2'
+_ENCODER_DIMENSION = 384  # Dimension du modèle all-MiniLM-L6-v2
+_ENCODER: Any = None
+_ENCODER_LOCK = threading.Lock()
+
+
+def _get_encoder() -> Any:
+    """Retourne l'encodeur partagé entre toutes les instances (chargé une seule fois)."""
+    global _ENCODER
+    if _ENCODER is None:
+        with _ENCODER_LOCK:
+            if _ENCODER is None:
+                device = 'cuda' if torch.cuda.is_available() else 'cpu'
+                logger.info(f"Loading sentence-transformers model {_ENCODER_MODEL} on {device}")
+                encoder = SentenceTransformer(_ENCODER_MODEL, device=device)
+                if device == 'cuda':
+                    # Poids FP16 sur GPU : moitié de bande passante, tensor cores
+                    encoder = encoder.half()
+                _ENCODER = encoder
+    return _ENCODER
+
+
+Quantization = Literal["fp32", "fp16", "int8"]
+
+# Type de stockage des vecteurs du fallback selon la quantification
+_STORAGE_DTYPES = {"fp32": np.float32, "fp16": np.float16, "int8": np.int8}
+# Échelle int8 : les composantes d'un vecteur unitaire sont dans [-1, 1]
+_INT8_SCALE = 127.0
+# Capacité initiale de la matrice du fallback (doublée à chaque saturation)
+_INITIAL_CAPACITY = 128
+
 class VectorStore:
     """
     Store vectoriel pour recherche sémantique.
     Utilise FAISS + sentence-transformers pour les embeddings.
     """
 
-    def __init__(self, dimension: int = 768):
+    def __init__(
+        self,
+        dimension: int = 768,
+        quantization: Quantization = "fp32",
+        persist_path: str | None = None
+    ):
+        if quantization not in _STORAGE_DTYPES:
+            raise ValueError(f"Unsupported quantization: {quantization}")
+
         self.dimension = dimension
+        self.quantization = quantization
+        self.persist_path = persist_path
         self.documents: List[Dict[str, Any]] = []
 
-        # Encoder pour les embeddings
+        # Encoder pour les embeddings (le modèle partagé n'est chargé qu'au premier encodage)
+        self._encoder: Any = None
         if SENTENCE_TRANSFORMERS_AVAILABLE:
-            self.encoder = SentenceTransformer('all-MiniLM-L6-v2')
-            self.dimension = 384  # Dimension du modèle all-MiniLM-L6-v2
-        else:
-            self.encoder = None
+            self.dimension = _ENCODER_DIMENSION
 
         # Index FAISS
         if FAISS_AVAILABLE:
-            self.index = faiss.IndexFlatL2(self.dimension)
+            self.index = self._build_index()
         else:
             self.index = None
-            self.vectors: List[np.ndarray] = []
+            self._reset_matrix()
 
-        logger.info(f"VectorStore initialized (dim={self.dimension})")
+        # Recharge un store persisté (index mappé en mémoire, pas de ré-encodage)
+        if persist_path and Path(persist_path).exists():
+            self._load()
 
-    def _encode(self, text: str) -> np.ndarray:
-        """Encode un texte en vecteur."""
-        if self.encoder:
-            return self.encoder.encode(text, convert_to_numpy=True)
+        logger.info(f"VectorStore initialized (dim={self.dimension}, quantization={quantization})")
+
+    @property
+    def encoder(self) -> Any:
+        """Encodeur de l'instance, ou l'encodeur partagé par défaut."""
+        if self._encoder is not None:
+            return self._encoder
+        if SENTENCE_TRANSFORMERS_AVAILABLE:
+            return _get_encoder()
+        return None
+
+    @encoder.setter
+    def encoder(self, value: Any) -> None:
+        self._encoder = value
+
+    def _build_index(self) -> Any:
+        """Construit l'index FAISS en produit scalaire selon la quantification."""
+        if self.quantization == "fp32":
+            # HNSW : recherche log(N) sur vecteurs normalisés
+            index = faiss.IndexHNSWFlat(self.dimension, 32, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 200
+            index.hnsw.efSearch = 64
+            return index
+
+        qtype = (
+            faiss.ScalarQuantizer.QT_fp16 if self.quantization == "fp16"
+            else faiss.ScalarQuantizer.QT_8bit
+        )
+        index = faiss.IndexScalarQuantizer(self.dimension, qtype, faiss.METRIC_INNER_PRODUCT)
+        # Vecteurs unitaires : les bornes [-1, 1] suffisent à entraîner le quantifieur
+        bounds = np.array([[-1.0] * self.dimension, [1.0] * self.dimension], dtype='float32')
+        index.train(bounds)
+        return index
+
+    def _quantize(self, vectors: np.ndarray) -> np.ndarray:
+        """Convertit des vecteurs unitaires float32 au type de stockage du fallback."""
+        if self.quantization == "int8":
+            return np.round(vectors * _INT8_SCALE).astype(np.int8)
+        return vectors.astype(_STORAGE_DTYPES[self.quantization], copy=False)
+
+    def _encode(self, text: str | List[str]) -> np.ndarray:
+        """Encode un texte (vecteur) ou une liste de textes (matrice)."""
+        encoder = self.encoder
+        if encoder:
+            # inference_mode : pas de suivi autograd pendant l'encodage
+            with torch.inference_mode() if SENTENCE_TRANSFORMERS_AVAILABLE else nullcontext():
+                return encoder.encode(
+                    text,
+                    batch_size=64,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                )
         else:
             # Fallback: vecteur aléatoire (pour tests)
+            if isinstance(text, list):
+                return np.random.rand(len(text), self.dimension).astype('float32')
             return np.random.rand(self.dimension).astype('float32')
 
     def add(self, text: str, metadata: Dict[str, Any] | None = None) -> str:
         """Ajoute un document au store."""
-        doc_id = f"doc_{len(self.documents)}"
+        return self.add_batch([text], [metadata])[0]
+
+    def add_batch(
+        self,
+        texts: List[str],
+        metadatas: List[Dict[str, Any] | None] | None = None
+    ) -> List[str]:
+        """Ajoute plusieurs documents en un seul passage d'encodage."""
+        if not texts:
+            return []
+
+        if metadatas is None:
+            metadatas = [None] * len(texts)
 
-        # Génère l'embedding
-        vector = self._encode(text)
+        # Génère les embeddings en un seul batch
+        vectors = self._normalize(self._encode(texts))
 
-        # Stocke le document
-        self.documents.append({
-            "id": doc_id,
-            "text": text,
-            "metadata": metadata or {},
-            "vector": vector
-        })
+        start = len(self.documents)
+        doc_ids = []
+        for offset, (text, metadata, vector) in enumerate(zip(texts, metadatas, vectors)):
+            doc_id = f"doc_{start + offset}"
+            self.documents.append({
+                "id": doc_id,
+                "text": text,
+                "metadata": metadata or {},
+                "vector": vector
+            })
+            doc_ids.append(doc_id)
 
-        # Ajoute à l'index
+        # Ajoute à l'index en un seul appel
         if self.index:
-            self.index.add(vector.reshape(1, -1))
+            self.index.add(vectors)
         else:
-            self.vectors.append(vector)
+            self._append_rows(self._quantize(vectors))
 
-        logger.debug(f"Added document {doc_id} to vector store")
-        return doc_id
+        logger.debug(f"Added {len(doc_ids)} documents to vector store")
+        return doc_ids
+
+    def _reset_matrix(self) -> None:
+        """Alloue une matrice vide pour le fallback."""
+        # Matrice des vecteurs unitaires (une ligne par document), croissance par doublement
+        self._capacity = _INITIAL_CAPACITY
+        self._matrix = np.empty((self._capacity, self.dimension), dtype=_STORAGE_DTYPES[self.quantization])
+        self._n = 0
+
+    def _append_rows(self, rows: np.ndarray) -> None:
+        """Ajoute des lignes à la matrice du fallback (croissance amortie O(1))."""
+        end = self._n + len(rows)
+        if end > self._capacity:
+            while self._capacity < end:
+                self._capacity *= 2
+            grown = np.empty((self._capacity, self.dimension), dtype=self._matrix.dtype)
+            grown[:self._n] = self._matrix[:self._n]
+            self._matrix = grown
+
+        self._matrix[self._n:end] = rows
+        self._n = end
 
     def search(self, query: str, top_k: int = 5) -> List[Tuple[Dict[str, Any], float]]:
         """Recherche les documents les plus similaires."""
@@ -80,49 +221,55 @@ class VectorStore:
             return []
 
         # Encode la query
-        query_vector = self._encode(query)
+        query_vector = self._normalize(self._encode(query))
 
         if self.index:
             # Recherche avec FAISS
-            distances, indices = self.index.search(query_vector.reshape(1, -1), min(top_k, len(self.documents)))
+            scores, indices = self.index.search(query_vector.reshape(1, -1), min(top_k, len(self.documents)))
 
+            # Le produit scalaire de vecteurs normalisés est directement la similarité cosine
             results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx < len(self.documents):
-                    doc = self.documents[idx]
-                    similarity = float(1.0 / (1.0 + dist))  # Convert distance to similarity
-                    results.append((doc, similarity))
+            for score, idx in zip(scores[0], indices[0]):
+                if 0 <= idx < len(self.documents):
+                    results.append((self.documents[idx], float(score)))
 
             return results
         else:
-            # Fallback: calcul manuel de similarité cosine
-            results = []
-            for doc in self.documents:
-                doc_vector = doc["vector"]
-                similarity = self._cosine_similarity(query_vector, doc_vector)
-                results.append((doc, float(similarity)))
+            # Fallback: vecteurs unitaires, la similarité cosine est un simple produit scalaire
+            matrix = self._matrix[:self._n]
+            if SGEMV_AVAILABLE and self.quantization == "fp32":
+                # BLAS direct : la transposée d'une matrice C-contiguë est F-contiguë (pas de copie)
+                similarities = sgemv(1.0, matrix.T, query_vector, trans=1)
+            else:
+                similarities = matrix @ query_vector
+                if self.quantization == "int8":
+                    similarities = similarities / _INT8_SCALE
 
-            results.sort(key=lambda x: x[1], reverse=True)
-            return results[:top_k]
+            # Sélection top-k en O(N) puis tri des seuls k candidats
+            k = min(top_k, len(similarities))
+            if k <= 0:
+                return []
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top])]
 
-    def _cosine_similarity(self, v1: np.ndarray, v2: np.ndarray) -> float:
-        """Calcule la similarité cosine entre deux vecteurs."""
-        dot = np.dot(v1, v2)
-        norm1 = np.linalg.norm(v1)
-        norm2 = np.linalg.norm(v2)
+            return [(self.documents[i], float(similarities[i])) for i in top]
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot / (norm1 * norm2)
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """Normalise des vecteurs (L2) en float32 contigu ; les vecteurs nuls sont conservés."""
+        vectors = np.ascontiguousarray(vectors, dtype='float32')
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
 
     def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques du store."""
         return {
             "total_documents": len(self.documents),
             "dimension": self.dimension,
+            "quantization": self.quantization,
             "faiss_available": FAISS_AVAILABLE,
-            "encoder_available": SENTENCE_TRANSFORMERS_AVAILABLE
+            "encoder_available": SENTENCE_TRANSFORMERS_AVAILABLE,
+            "sgemv_available": SGEMV_AVAILABLE
         }
 
     def clear(self) -> None:
@@ -132,6 +279,59 @@ class VectorStore:
         if self.index:
             self.index.reset()
         else:
-            self.vectors.clear()
+            self._reset_matrix()
 
         logger.info("Vector store cleared")
+
+    def save(self) -> None:
+        """Persiste l'index (FAISS ou matrice du fallback) et les documents sur disque."""
+        if not self.persist_path:
+            raise ValueError("No persist_path configured for this vector store")
+
+        path = Path(self.persist_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Écriture dans un fichier temporaire puis remplacement atomique :
+        # un index actuellement mappé en mémoire n'est jamais écrasé en place
+        tmp_index = path.with_name(path.name + ".tmp")
+        if self.index:
+            faiss.write_index(self.index, str(tmp_index))
+        else:
+            with open(tmp_index, "wb") as f:
+                np.save(f, self._matrix[:self._n])
+        os.replace(tmp_index, path)
+
+        docs_path = Path(f"{path}.jsonl")
+        tmp_docs = docs_path.with_name(docs_path.name + ".tmp")
+        with open(tmp_docs, "w", encoding="utf-8") as f:
+            for doc in self.documents:
+                record = {k: v for k, v in doc.items() if k != "vector"}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_docs, docs_path)
+
+        logger.info(f"Vector store saved to {path} ({len(self.documents)} documents)")
+
+    def _load(self) -> None:
+        """Charge l'index persisté (mmap) et les documents associés."""
+        path = self.persist_path
+
+        if self.index:
+            index = faiss.read_index(path, faiss.IO_FLAG_MMAP)
+            if index.d != self.dimension:
+                raise ValueError(f"Persisted index dimension {index.d} != {self.dimension}")
+            self.index = index
+        else:
+            matrix = np.load(path, mmap_mode="r")
+            if matrix.shape[1] != self.dimension or matrix.dtype != self._matrix.dtype:
+                raise ValueError(f"Persisted matrix {matrix.shape}/{matrix.dtype} does not match store")
+            if len(matrix):
+                # Lecture seule : le premier ajout recopie la matrice (capacité pleine)
+                self._matrix, self._n, self._capacity = matrix, len(matrix), len(matrix)
+
+        # Documents lus ligne par ligne
+        docs_path = Path(f"{path}.jsonl")
+        if docs_path.exists():
+            with open(docs_path, encoding="utf-8") as f:
+                self.documents = [json.loads(line) for line in f if line.strip()]
+
+        logger.info(f"Vector store loaded from {path} ({len(self.documents)} documents)")
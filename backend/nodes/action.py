@@ -2,6 +2,10 @@ from ..core.base_node import BaseNode
 from ..core.shared import Shared
 from typing import Dict, Any
 from loguru import logger
+import re
+
+# Bloc de code englobant toute la réponse (ligne d'ouverture avec tag de langage optionnel)
+_FENCE_RE = re.compile(r"\A```[^\n]*\n(.*?)\n?```\Z", re.DOTALL)
 
 class ActionNode(BaseNode):
     """
@@ -59,11 +63,8 @@ class ActionNode(BaseNode):
         text = text.strip()
 
         # Enlève les balises markdown inutiles si présentes
-        if text.startswith("```") and text.endswith("```"):
-            lines = text.split("\n")
-            text = "\n".join(lines[1:-1])
-
-        return text
+        match = _FENCE_RE.match(text)
+        return match.group(1) if match else text
 
     def _execute_actions(self, input_data: Dict[str, Any]) -> list[str]:
         """Exécute des actions post-génération si nécessaire."""
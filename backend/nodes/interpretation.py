@@ -1,6 +1,21 @@
 from ..core.base_node import BaseNode
 from ..core.shared import Shared
 from typing import Dict, Any
+import re
+
+
+def _keywords_re(*stems: str) -> re.Pattern[str]:
+    """Compile des radicaux en une seule regex : début de mot, formes fléchies incluses."""
+    return re.compile(r"\b(" + "|".join(map(re.escape, stems)) + r")\w*")
+
+
+_INFO_RE = _keywords_re("comment", "pourquoi", "quel", "quand", "où")
+_CREATE_RE = _keywords_re("crée", "créer", "créez", "génère", "générer", "générez", "écri")
+_ANALYSIS_RE = _keywords_re("analys", "expliqu", "détaill")
+_CODE_RE = _keywords_re("code", "fonction", "script", "programm")
+_POS_RE = _keywords_re("merci", "super", "excellent", "génial", "parfait", "bien")
+_NEG_RE = _keywords_re("problème", "erreur", "bug", "mauvais", "nul", "mal")
+_ENTITY_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
 
 class InterpretationNode(BaseNode):
     """
@@ -23,7 +38,10 @@ class InterpretationNode(BaseNode):
 
     async def exec(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Détermine l'intention et le type de tâche."""
-        text = input_data.get("clean_input", "").lower()
+        # Texte original (casse conservée pour les entités) et minuscule, calculés une fois
+        original = input_data.get("clean_input", "")
+        text = original.lower()
+        word_count = len(text.split())
 
         # Détection d'intention
         intent = self._detect_intent(text, input_data)
@@ -32,7 +50,7 @@ class InterpretationNode(BaseNode):
         task_type = self._detect_task_type(text, intent)
 
         # Extraction d'entités simples
-        entities = self._extract_entities(text)
+        entities = self._extract_entities(original)
 
         # Analyse de sentiment
         sentiment = self._analyze_sentiment(text)
@@ -43,20 +61,20 @@ class InterpretationNode(BaseNode):
             "entities": entities,
             "sentiment": sentiment,
             "language": input_data.get("language", "unknown"),
-            "complexity": self._estimate_complexity(text)
+            "complexity": self._estimate_complexity(word_count)
         }
 
     def _detect_intent(self, text: str, context: Dict[str, Any]) -> str:
         """Détecte l'intention principale."""
         if context.get("has_question"):
-            if any(kw in text for kw in ["comment", "pourquoi", "quel", "quand", "où"]):
+            if _INFO_RE.search(text):
                 return "information_seeking"
             return "question"
 
         if context.get("has_command"):
-            if any(kw in text for kw in ["crée", "génère", "écris"]):
+            if _CREATE_RE.search(text):
                 return "creation"
-            if any(kw in text for kw in ["analyse", "explique", "détaille"]):
+            if _ANALYSIS_RE.search(text):
                 return "analysis"
             return "instruction"
 
@@ -67,7 +85,7 @@ class InterpretationNode(BaseNode):
         if intent in ["information_seeking", "question"]:
             return "qa"
         elif intent == "creation":
-            if any(kw in text for kw in ["code", "fonction", "script", "programme"]):
+            if _CODE_RE.search(text):
                 return "code_generation"
             return "text_generation"
         elif intent == "analysis":
@@ -77,17 +95,14 @@ class InterpretationNode(BaseNode):
     def _extract_entities(self, text: str) -> list[str]:
         """Extraction basique d'entités (à améliorer avec NER)."""
         # Pour l'instant, retourne les mots capitalisés
-        import re
-        entities = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)
+        entities = _ENTITY_RE.findall(text)
         return list(set(entities))
 
     def _analyze_sentiment(self, text: str) -> str:
         """Analyse de sentiment basique."""
-        positive_words = ['merci', 'super', 'excellent', 'génial', 'parfait', 'bien']
-        negative_words = ['problème', 'erreur', 'bug', 'mauvais', 'nul', 'mal']
-
-        pos_count = sum(1 for word in positive_words if word in text)
-        neg_count = sum(1 for word in negative_words if word in text)
+        # Chaque radical présent compte une fois, quelles que soient ses répétitions
+        pos_count = len(set(_POS_RE.findall(text)))
+        neg_count = len(set(_NEG_RE.findall(text)))
 
         if pos_count > neg_count:
             return "positive"
@@ -95,10 +110,8 @@ class InterpretationNode(BaseNode):
             return "negative"
         return "neutral"
 
-    def _estimate_complexity(self, text: str) -> str:
-        """Estime la complexité de la requête."""
-        word_count = len(text.split())
-
+    def _estimate_complexity(self, word_count: int) -> str:
+        """Estime la complexité de la requête à partir du nombre de mots."""
         if word_count < 10:
             return "simple"
         elif word_count < 30:
@@ -1,6 +1,11 @@
 from ..core.base_node import BaseNode
 from ..core.shared import Shared
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set
+from collections import defaultdict
+import re
+
+# Mots indexés : la ponctuation collée ("python?", "python,") est ignorée
+_WORD_RE = re.compile(r"\w+")
 
 class MemoryNode(BaseNode):
     """
@@ -13,6 +18,8 @@ class MemoryNode(BaseNode):
         super().__init__("memory")
         self.short_term_memory: List[Dict[str, Any]] = []
         self.max_memory_size = 10
+        # Index inversé : mot → indices des interactions qui le contiennent
+        self._inv_index: Dict[str, Set[int]] = defaultdict(set)
 
     def prep(self, shared: Shared) -> Dict[str, Any]:
         """Récupère le contexte pour la recherche mémoire."""
@@ -46,10 +53,12 @@ class MemoryNode(BaseNode):
         }
 
         self.short_term_memory.append(interaction)
+        self._index_interaction(len(self.short_term_memory) - 1, interaction)
 
-        # Limite la taille
+        # Limite la taille (les indices changent : reconstruit l'index)
         if len(self.short_term_memory) > self.max_memory_size:
             self.short_term_memory = self.short_term_memory[-self.max_memory_size:]
+            self._rebuild_index()
 
         # Met à jour le contexte partagé
         shared.set_context("memory_snapshot", self.short_term_memory)
@@ -61,12 +70,20 @@ class MemoryNode(BaseNode):
         if not query:
             return []
 
-        query_lower = query.lower()
-        results = []
+        hits: Set[int] = set()
+        for word in _WORD_RE.findall(query.lower()):
+            hits.update(self._inv_index.get(word, ()))
+
+        # Top 3 plus récents
+        return [self.short_term_memory[i] for i in sorted(hits)[-3:]]
 
-        for memory in self.short_term_memory:
-            memory_query = memory.get("query", "").lower()
-            if any(word in memory_query for word in query_lower.split()):
-                results.append(memory)
+    def _index_interaction(self, position: int, interaction: Dict[str, Any]) -> None:
+        """Indexe les mots de la requête d'une interaction."""
+        for word in _WORD_RE.findall((interaction.get("query") or "").lower()):
+            self._inv_index[word].add(position)
 
-        return results[-3:]  # Top 3 plus récents
+    def _rebuild_index(self) -> None:
+        """Reconstruit l'index inversé après troncature de la mémoire."""
+        self._inv_index.clear()
+        for position, interaction in enumerate(self.short_term_memory):
+            self._index_interaction(position, interaction)
@@ -1,7 +1,13 @@
 from ..core.base_node import BaseNode
 from ..core.shared import Shared
 from typing import Dict, Any
-import re
+
+# Mots-outils caractéristiques de chaque langue
+_FRENCH_MARKERS = frozenset({'le', 'la', 'les', 'un', 'une', 'des', 'est', 'sont', 'quel', 'comment'})
+_ENGLISH_MARKERS = frozenset({'the', 'a', 'an', 'is', 'are', 'what', 'how', 'can', 'will'})
+# Verbes d'instruction reconnus en début de message
+_COMMANDS = ('fais', 'crée', 'génère', 'écris', 'explique', 'analyse')
+_COMMAND_PREFIX_LEN = max(map(len, _COMMANDS))
 
 class PerceptionNode(BaseNode):
     """
@@ -18,13 +24,15 @@ class PerceptionNode(BaseNode):
 
         # Nettoyage basique
         clean_input = raw_input.strip()
-        clean_input = re.sub(r'\s+', ' ', clean_input)  # Normalise les espaces
+        # Normalise les espaces : split()/join en C, ignoré si seuls des espaces simples
+        # (isprintable() est faux pour tout autre blanc Unicode : \t, \n, \xa0...)
+        if '  ' in clean_input or not clean_input.isprintable():
+            clean_input = ' '.join(clean_input.split())
 
         # Détection de patterns
         has_question = '?' in clean_input
-        has_command = any(clean_input.lower().startswith(cmd) for cmd in [
-            'fais', 'crée', 'génère', 'écris', 'explique', 'analyse'
-        ])
+        # Seul le préfixe est mis en minuscules ; startswith(tuple) compare en C
+        has_command = clean_input[:_COMMAND_PREFIX_LEN].lower().startswith(_COMMANDS)
 
         return {
             "raw": raw_input,
@@ -37,12 +45,10 @@ class PerceptionNode(BaseNode):
 
     def _detect_language(self, text: str) -> str:
         """Détection simple de la langue."""
-        french_markers = ['le', 'la', 'les', 'un', 'une', 'des', 'est', 'sont', 'quel', 'comment']
-        english_markers = ['the', 'a', 'an', 'is', 'are', 'what', 'how', 'can', 'will']
-
-        text_lower = text.lower()
-        french_count = sum(1 for marker in french_markers if f' {marker} ' in f' {text_lower} ')
-        english_count = sum(1 for marker in english_markers if f' {marker} ' in f' {text_lower} ')
+        # Une seule tokenisation, puis intersection avec les marqueurs (nombre de marqueurs distincts)
+        tokens = set(text.lower().split())
+        french_count = len(_FRENCH_MARKERS & tokens)
+        english_count = len(_ENGLISH_MARKERS & tokens)
 
         if french_count > english_count:
             return "fr"
@@ -1,12 +1,23 @@
 from typing import Dict, Any, List
 from ..core.base_node import BaseNode
 from ..core.shared import Shared
-from ..llm.gemini_client import GeminiClient
+from ..llm.gemini_client import get_gemini_client
+from ..llm.batching import get_batching_client
 from ..llm.prompt_builder import PromptBuilder
+from ..llm.cache import cache_key, get_llm_cache
 from ..config import get_settings
 from loguru import logger
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Tuple vide partagé (lecture seule en aval) : pas d'allocation par étape
+_NO_RISKS: tuple[str, ...] = ()
+
 class ReasoningNode(BaseNode):
     """
     Module 3: Raisonnement (RRLA)
@@ -19,11 +30,18 @@ class ReasoningNode(BaseNode):
     def __init__(self) -> None:
         super().__init__("reasoning")
         self.settings = get_settings()
-        self.gemini = GeminiClient(
-            api_key=self.settings.gemini_api_key,
-            model=self.settings.gemini_model
-        )
+        # Client partagé entre instances (pas de ré-initialisation par node)
+        if self.settings.gemini_batching:
+            self.gemini = get_batching_client(
+                self.settings.gemini_api_key,
+                self.settings.gemini_model,
+                self.settings.gemini_batch_max_size,
+                self.settings.gemini_batch_max_wait_ms
+            )
+        else:
+            self.gemini = get_gemini_client(self.settings.gemini_api_key, self.settings.gemini_model)
         self.prompt_builder = PromptBuilder()
+        self.cache = get_llm_cache()
 
     def prep(self, shared: Shared) -> Dict[str, Any]:
         """Récupère le contexte nécessaire au raisonnement."""
@@ -84,12 +102,38 @@ class ReasoningNode(BaseNode):
 
     async def _decompose(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """R1: Décompose le problème en étapes."""
-        prompt = self.prompt_builder.build_rrla_decompose(context)
+        prompt = self.prompt_builder.build_rrla_decompose_request(context)
+        # Instructions transmises à part : un lot micro-batché ne les envoie qu'une fois
+        params: Dict[str, Any] = {
+            "temperature": 0.7,
+            "instructions": PromptBuilder.RRLA_DECOMPOSE_INSTRUCTIONS
+        }
 
         try:
-            response = await self.gemini.generate(prompt, temperature=0.7)
-            data = json.loads(response)
-            return data.get("steps", [])
+            # Instructions invariantes servies depuis le cache de contexte Gemini si activé
+            if self.settings.gemini_context_cache:
+                cache_name = await self.gemini.get_prefix_cache(
+                    PromptBuilder.RRLA_DECOMPOSE_INSTRUCTIONS,
+                    self.settings.gemini_context_cache_ttl
+                )
+                if cache_name:
+                    del params["instructions"]
+                    params["cached_content"] = cache_name
+
+            key = cache_key(self.gemini.model, prompt, **params)
+            cached = await self.cache.get(key)
+            response = cached
+            if response is None:
+                response = await self.gemini.generate(prompt, **params)
+            # orjson.JSONDecodeError hérite de json.JSONDecodeError
+            data = orjson.loads(response) if ORJSON_AVAILABLE else json.loads(response)
+            steps = data.get("steps", [])
+            if not isinstance(steps, list):
+                raise ValueError("RRLA decompose response has no step list")
+            # Mise en cache seulement après validation : une réponse invalide serait rejouée
+            if cached is None:
+                await self.cache.set(key, response)
+            return steps
         except json.JSONDecodeError:
             logger.warning("Failed to parse RRLA decompose response, using fallback")
             return [{"id": 1, "action": "Répondre directement", "rationale": "Pas de décomposition nécessaire"}]
@@ -100,22 +144,30 @@ class ReasoningNode(BaseNode):
     async def _reflect(self, steps: List[Dict[str, Any]], context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """R2: Évalue chaque étape."""
         # Évaluation simplifiée (peut être améliorée avec un appel LLM)
+        n = len(steps)
         for i, step in enumerate(steps):
             step["feasibility"] = 0.8 - (i * 0.1)  # Décroît légèrement
-            step["priority"] = len(steps) - i  # Priorité inverse
-            step["risks"] = []
+            step["priority"] = n - i  # Priorité inverse
+            step["risks"] = _NO_RISKS
 
         return steps
 
     async def _build_logic_chain(self, steps: List[Dict[str, Any]]) -> Dict[str, Any]:
         """L: Construit la chaîne logique d'exécution."""
-        # Trie par priorité
-        sorted_steps = sorted(steps, key=lambda x: x.get("priority", 0), reverse=True)
+        critical_path = [s["id"] for s in steps if s.get("feasibility", 0) > 0.7]
+
+        # Cas courant (réponse directe, fallback) : rien à trier
+        if len(steps) <= 1:
+            sequence = [s["id"] for s in steps]
+        else:
+            # Trie par priorité (étapes issues du LLM : une priorité peut manquer)
+            ordered = sorted(steps, key=lambda s: s.get("priority", 0), reverse=True)
+            sequence = [s["id"] for s in ordered]
 
         return {
-            "sequence": [s["id"] for s in sorted_steps],
+            "sequence": sequence,
             "dependencies": {},
-            "critical_path": [s["id"] for s in steps if s.get("feasibility", 0) > 0.7],
+            "critical_path": critical_path,
             "parallel_eligible": []
         }
 
@@ -141,14 +193,13 @@ class ReasoningNode(BaseNode):
         chain: Dict[str, Any]
     ) -> str:
         """Construit une trace lisible du raisonnement."""
-        trace = "=== RRLA Reasoning Trace ===\n"
-        trace += f"Decomposition: {len(steps)} steps\n"
-
-        for step in steps:
-            trace += f"  {step['id']}. {step.get('action', 'N/A')} "
-            trace += f"(feasibility: {step.get('feasibility', 0):.2f})\n"
-
-        trace += f"\nLogic chain: {chain['sequence']}\n"
-        trace += f"Critical path: {chain['critical_path']}\n"
+        parts = ["=== RRLA Reasoning Trace ===\n", f"Decomposition: {len(steps)} steps\n"]
+        parts.extend(
+            f"  {step['id']}. {step.get('action', 'N/A')} (feasibility: {step.get('feasibility', 0):.2f})\n"
+            for step in steps
+        )
+        parts.append(f"\nLogic chain: {chain['sequence']}\n")
+        parts.append(f"Critical path: {chain['critical_path']}\n")
 
-        return trace
+        # Une seule concaténation finale, linéaire en la taille de la trace
+        return "".join(parts)
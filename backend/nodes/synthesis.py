@@ -1,7 +1,9 @@
 from ..core.base_node import BaseNode
 from ..core.shared import Shared
-from ..llm.gemini_client import GeminiClient
+from ..llm.gemini_client import get_gemini_client
+from ..llm.batching import get_batching_client
 from ..llm.prompt_builder import PromptBuilder
+from ..llm.cache import cache_key, get_llm_cache
 from ..config import get_settings
 from typing import Dict, Any
 from loguru import logger
@@ -15,11 +17,18 @@ class SynthesisNode(BaseNode):
     def __init__(self) -> None:
         super().__init__("synthesis")
         self.settings = get_settings()
-        self.gemini = GeminiClient(
-            api_key=self.settings.gemini_api_key,
-            model=self.settings.gemini_model
-        )
+        # Client partagé entre instances (pas de ré-initialisation par node)
+        if self.settings.gemini_batching:
+            self.gemini = get_batching_client(
+                self.settings.gemini_api_key,
+                self.settings.gemini_model,
+                self.settings.gemini_batch_max_size,
+                self.settings.gemini_batch_max_wait_ms
+            )
+        else:
+            self.gemini = get_gemini_client(self.settings.gemini_api_key, self.settings.gemini_model)
         self.prompt_builder = PromptBuilder()
+        self.cache = get_llm_cache()
 
     def prep(self, shared: Shared) -> Dict[str, Any]:
         """Récupère les résultats du raisonnement."""
@@ -38,14 +47,30 @@ class SynthesisNode(BaseNode):
         logger.info(f"Synthesizing response (mode: {reasoning.get('mode', 'unknown')})")
 
         # Génération de la réponse via Gemini
-        prompt = self.prompt_builder.build_synthesis(reasoning, user_input)
+        prompt = self.prompt_builder.build_synthesis_request(reasoning, user_input)
+        # Instructions transmises à part : un lot micro-batché ne les envoie qu'une fois
+        params: Dict[str, Any] = {
+            "temperature": 0.7,
+            "max_output_tokens": 1024,
+            "instructions": PromptBuilder.SYNTHESIS_INSTRUCTIONS
+        }
 
         try:
-            response_text = await self.gemini.generate(
-                prompt,
-                temperature=0.7,
-                max_output_tokens=1024
-            )
+            # Instructions invariantes servies depuis le cache de contexte Gemini si activé
+            if self.settings.gemini_context_cache:
+                cache_name = await self.gemini.get_prefix_cache(
+                    PromptBuilder.SYNTHESIS_INSTRUCTIONS,
+                    self.settings.gemini_context_cache_ttl
+                )
+                if cache_name:
+                    del params["instructions"]
+                    params["cached_content"] = cache_name
+
+            key = cache_key(self.gemini.model, prompt, **params)
+            response_text = await self.cache.get(key)
+            if response_text is None:
+                response_text = await self.gemini.generate(prompt, **params)
+                await self.cache.set(key, response_text)
 
             return {
                 "draft": response_text,
@@ -70,24 +95,21 @@ class SynthesisNode(BaseNode):
 
     def _extract_sources(self, input_data: Dict[str, Any]) -> list[Dict[str, str]]:
         """Extrait les sources utilisées."""
-        sources = []
+        # Cas courant : aucune source mémoire
+        memory_context = input_data.get("memory_context")
+        if not memory_context:
+            return []
 
-        # Ajouter les sources mémoire si présentes
-        memory_context = input_data.get("memory_context", [])
-        if memory_context:
-            sources.append({
-                "type": "memory",
-                "count": len(memory_context),
-                "description": "Contexte conversationnel"
-            })
-
-        return sources
+        return [{
+            "type": "memory",
+            "count": len(memory_context),
+            "description": "Contexte conversationnel"
+        }]
 
     def _summarize_reasoning(self, reasoning: Dict[str, Any]) -> str:
         """Résume le processus de raisonnement."""
-        mode = reasoning.get("mode", "unknown")
-
-        if mode == "simple":
+        # Mode simple : résumé fixe, sans autre lecture
+        if reasoning.get("mode") == "simple":
             return "Raisonnement direct"
 
         steps = reasoning.get("steps", [])
@@ -0,0 +1,9 @@
+import time
+from datetime import datetime
+
+# Décalage entre l'horloge monotone et l'horloge murale, fixé au chargement du module
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+def monotonic_to_iso(ts_ns: int) -> str:
+    """Convertit un horodatage `time.monotonic_ns()` en date ISO 8601 locale."""
+    return datetime.fromtimestamp((ts_ns + _WALL_OFFSET_NS) / 1e9).isoformat()
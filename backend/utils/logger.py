@@ -14,11 +14,15 @@ def setup_logger(log_level: str = "INFO", log_file: str | None = None) -> None:
     logger.remove()
 
     # Console handler avec couleurs
+    # enqueue : formatage et écriture dans un thread dédié, hors du chemin des requêtes
     logger.add(
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=log_level,
         colorize=True,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
     # File handler si spécifié
@@ -26,13 +30,17 @@ def setup_logger(log_level: str = "INFO", log_file: str | None = None) -> None:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Format minimal (sans fonction/ligne) et sans introspection des variables
         logger.add(
             log_file,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name} - {message}",
             level=log_level,
             rotation="10 MB",
             retention="7 days",
             compression="zip",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
         )
 
     logger.info(f"Logger configured (level={log_level})")
@@ -1,15 +1,23 @@
 from typing import Any, Dict
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
+from html.parser import HTMLParser
 import re
 
+# Motifs précompilés au chargement du module
+_REPEAT_RE = re.compile(r'(.)\1{50,}')
+# Longueur minimale d'une répétition détectée par _REPEAT_RE
+_REPEAT_MIN_LEN = 51
+
 class ChatRequest(BaseModel):
     """Validation d'une requête de chat."""
     input: str = Field(..., min_length=1, max_length=10000, description="Message utilisateur")
-    user_id: str | None = Field(default="anonymous", description="ID de l'utilisateur")
+    # Format vérifié par pydantic-core ; une chaîne vide retombe sur "anonymous"
+    user_id: str | None = Field(default="anonymous", pattern=r'^[a-zA-Z0-9_-]*$', description="ID de l'utilisateur")
     session_id: str | None = Field(default=None, description="ID de session")
     context: Dict[str, Any] | None = Field(default=None, description="Contexte additionnel")
 
-    @validator('input')
+    @field_validator('input')
+    @classmethod
     def validate_input(cls, v: str) -> str:
         """Valide et nettoie l'input."""
         # Trim whitespace
@@ -19,36 +27,30 @@ class ChatRequest(BaseModel):
         if not v:
             raise ValueError("Input cannot be empty")
 
-        # Limite les répétitions excessives de caractères
-        if re.search(r'(.)\1{50,}', v):
+        # Limite les répétitions excessives de caractères (impossible sous _REPEAT_MIN_LEN)
+        if len(v) >= _REPEAT_MIN_LEN and _REPEAT_RE.search(v):
             raise ValueError("Input contains excessive character repetition")
 
         return v
 
-    @validator('user_id')
+    @field_validator('user_id')
+    @classmethod
     def validate_user_id(cls, v: str | None) -> str:
-        """Valide l'user_id."""
-        if v and not re.match(r'^[a-zA-Z0-9_-]+$', v):
-            raise ValueError("Invalid user_id format")
+        """Normalise l'user_id."""
         return v or "anonymous"
 
 class MCPCallRequest(BaseModel):
     """Validation d'un appel MCP."""
-    tool: str = Field(..., min_length=1, description="Nom de l'outil MCP")
+    # Minuscules, chiffres et underscores (vérifié par pydantic-core)
+    tool: str = Field(..., min_length=1, pattern=r'^[a-z_][a-z0-9_]*$', description="Nom de l'outil MCP")
     arguments: Dict[str, Any] = Field(default_factory=dict, description="Arguments de l'outil")
 
-    @validator('tool')
-    def validate_tool_name(cls, v: str) -> str:
-        """Valide le nom de l'outil."""
-        if not re.match(r'^[a-z_][a-z0-9_]*$', v):
-            raise ValueError("Tool name must be lowercase alphanumeric with underscores")
-        return v
-
 class StreamRequest(BaseModel):
     """Validation d'une requête de streaming."""
     prompt: str = Field(..., min_length=1, max_length=5000, description="Prompt pour le streaming")
 
-    @validator('prompt')
+    @field_validator('prompt')
+    @classmethod
     def validate_prompt(cls, v: str) -> str:
         """Valide le prompt."""
         v = v.strip()
@@ -102,13 +104,42 @@ def validate_token_count(tokens: int, max_tokens: int = 100000) -> int:
 
     return tokens
 
+class _TextExtractor(HTMLParser):
+    """Parseur à passe unique ne conservant que le texte hors <script>/<style>."""
+
+    _SKIPPED_TAGS = frozenset({"script", "style"})
+
+    def __init__(self) -> None:
+        # Entités conservées telles quelles (pas de décodage de &lt;script&gt; en balise)
+        super().__init__(convert_charrefs=False)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in self._SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.parts.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        self.handle_data(f"&{name};")
+
+    def handle_charref(self, name: str) -> None:
+        self.handle_data(f"&#{name};")
+
 def sanitize_html(text: str) -> str:
     """
-    Nettoie le HTML d'un texte (basique).
-    
-    WARNING: This is a basic sanitization function. For production use,
-    consider using a proper HTML parser like 'bleach' or 'html.parser'.
-    Regex-based HTML sanitization can miss edge cases.
+    Nettoie le HTML d'un texte.
+
+    Une seule passe avec html.parser : les balises et leurs attributs (dont les
+    gestionnaires on*) sont supprimés, le contenu des <script>/<style> est ignoré.
+    Pas d'expression régulière, donc pas de retour arrière pathologique.
 
     Args:
         text: Texte à nettoyer
@@ -116,16 +147,10 @@ def sanitize_html(text: str) -> str:
     Returns:
         Texte nettoyé
     """
-    # Remove JavaScript blocks - handle whitespace in closing tags
-    text = re.sub(r'<script[^>]*>.*?</script\s*>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    
-    # Remove inline JavaScript event handlers
-    text = re.sub(r'on\w+\s*=\s*["\'].*?["\']', '', text, flags=re.IGNORECASE)
-    
-    # Remove HTML tags (done last to catch any remaining tags)
-    text = re.sub(r'<[^>]+>', '', text)
-
-    return text.strip()
+    parser = _TextExtractor()
+    parser.feed(text)
+    parser.close()
+    return "".join(parser.parts).strip()
 
 def validate_json_structure(data: Any, required_keys: list[str]) -> bool:
     """
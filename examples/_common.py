@@ -0,0 +1,50 @@
+"""
+Helpers shared by the agent examples.
+Optional speedups (uvloop, orjson) are used when installed.
+"""
+import asyncio
+from pathlib import Path
+from typing import Any, Coroutine
+
+from backend.config import get_settings
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Settings loaded once for every example
+settings = get_settings()
+
+# Directories already created in this process (skips repeated mkdir syscalls)
+_ensured_dirs: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def run(main: Coroutine[Any, Any, Any]) -> None:
+    """Run an example's entry point on uvloop when installed."""
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main)
+    else:
+        asyncio.run(main)
@@ -7,8 +7,94 @@ Démontre comment créer, gérer et sauvegarder des artifacts.
 import asyncio
 import httpx
 from pathlib import Path
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 API_URL = "http://localhost:8000"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Client HTTP partagé par toute la démo (connexions keep-alive réutilisées)
+_client: httpx.AsyncClient | None = None
+
+def get_client() -> httpx.AsyncClient:
+    """Retourne le client HTTP partagé (créé à la première utilisation)."""
+    global _client
+    if _client is None:
+        # Pool assez large pour les fan-outs asyncio.gather sans attente de connexion libre
+        _client = httpx.AsyncClient(
+            base_url=API_URL,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=300)
+        )
+    return _client
+
+async def close_client() -> None:
+    """Ferme le client HTTP partagé."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+class AsyncBatcher:
+    """
+    Regroupe des appels soumis un par un et les exécute par lots via asyncio.gather.
+    Un lot part dès `flush_size` appels en attente ou après `flush_ms` millisecondes.
+    """
+
+    def __init__(self, flush_size: int = 16, flush_ms: int = 25):
+        self.flush_size = flush_size
+        self.flush_delay = flush_ms / 1000
+        self._pending: list[tuple[Coroutine[Any, Any, Any], asyncio.Future[Any]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # Références fortes vers les lots en cours
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def add(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Future[Any]:
+        """Met un appel en file et retourne le future de son résultat."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append((coro, future))
+
+        if len(self._pending) >= self.flush_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_delay, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Lance le lot en attente."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _run(batch: list[tuple[Coroutine[Any, Any, Any], asyncio.Future[Any]]]) -> None:
+        """Exécute un lot et propage chaque résultat ou erreur à son future."""
+        results = await asyncio.gather(*(coro for coro, _ in batch), return_exceptions=True)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 async def mcp_call(tool: str, arguments: dict) -> dict:
     """
@@ -21,13 +107,19 @@ async def mcp_call(tool: str, arguments: dict) -> dict:
     Returns:
         Résultat de l'appel
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{API_URL}/api/mcp/call",
-            json={"tool": tool, "arguments": arguments}
-        )
+    payload = {"tool": tool, "arguments": arguments}
+    if not ORJSON_AVAILABLE:
+        response = await get_client().post("/api/mcp/call", json=payload)
         return response.json()
 
+    # Corps encodé/décodé par orjson (évite le json de la stdlib côté httpx)
+    response = await get_client().post(
+        "/api/mcp/call",
+        content=orjson.dumps(payload),
+        headers=_JSON_HEADERS
+    )
+    return orjson.loads(response.content)
+
 async def demo_create_python_script():
     """Démo: Créer un script Python."""
     print("\n=== Création d'un script Python ===")
@@ -181,12 +273,14 @@ async def demo_list_artifacts():
         artifacts = result["result"]["artifacts"]
         print(f"📦 Total: {len(artifacts)} artifacts\n")
 
-        for artifact in artifacts:
-            print(f"  • {artifact['name']}")
-            print(f"    ID: {artifact['id']}")
-            print(f"    Type: {artifact['type']}")
-            print(f"    Créé: {artifact['created_at']}")
-            print()
+        # Listing formaté en une seule écriture sur stdout
+        print("".join(
+            f"  • {artifact['name']}\n"
+            f"    ID: {artifact['id']}\n"
+            f"    Type: {artifact['type']}\n"
+            f"    Créé: {artifact['created_at']}\n\n"
+            for artifact in artifacts
+        ), end="")
 
 async def demo_update_artifact(artifact_id: str):
     """Démo: Mettre à jour un artifact."""
@@ -240,10 +334,12 @@ async def demo_workflow_complet():
     print("=" * 60)
 
     try:
-        # 1. Créer des artifacts
-        script_id = await demo_create_python_script()
-        doc_id = await demo_create_documentation()
-        config_id = await demo_create_config()
+        # 1. Créer des artifacts (créations indépendantes, lancées en parallèle)
+        script_id, doc_id, config_id = await asyncio.gather(
+            demo_create_python_script(),
+            demo_create_documentation(),
+            demo_create_config()
+        )
 
         # 2. Lister
         await demo_list_artifacts()
@@ -256,12 +352,18 @@ async def demo_workflow_complet():
         output_dir = Path("./output_artifacts")
         output_dir.mkdir(exist_ok=True)
 
-        if script_id:
-            await demo_save_to_disk(script_id, str(output_dir / "data_processor.py"))
-        if doc_id:
-            await demo_save_to_disk(doc_id, str(output_dir / "README.md"))
-        if config_id:
-            await demo_save_to_disk(config_id, str(output_dir / "config.json"))
+        targets = [
+            (script_id, "data_processor.py"),
+            (doc_id, "README.md"),
+            (config_id, "config.json")
+        ]
+        # Sauvegardes regroupées en lots bornés
+        batcher = AsyncBatcher()
+        await asyncio.gather(*(
+            batcher.add(demo_save_to_disk(artifact_id, str(output_dir / filename)))
+            for artifact_id, filename in targets
+            if artifact_id
+        ))
 
         print("\n" + "=" * 60)
         print("✅ Démonstration terminée avec succès !")
@@ -275,21 +377,27 @@ async def main():
     """Point d'entrée principal."""
     print("\n🚀 Démarrage de la démonstration...\n")
 
-    # Vérifie que l'API est accessible
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{API_URL}/health")
+        # Vérifie que l'API est accessible (même connexion que les appels MCP)
+        try:
+            response = await get_client().get("/health")
             if response.status_code == 200:
                 print("✅ API accessible")
             else:
                 print("⚠️  API répond mais statut inhabituel")
-    except Exception as e:
-        print(f"❌ Impossible de se connecter à l'API: {e}")
-        print(f"   Assurez-vous que le serveur tourne sur {API_URL}")
-        return
+        except httpx.HTTPError as e:
+            print(f"❌ Impossible de se connecter à l'API: {e}")
+            print(f"   Assurez-vous que le serveur tourne sur {API_URL}")
+            return
 
-    # Lance la démo
-    await demo_workflow_complet()
+        # Lance la démo
+        await demo_workflow_complet()
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Boucle libuv (uvloop) si installée (indisponible sous Windows)
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -14,10 +14,14 @@ from backend.agents import (
     SocialMediaManagerAgent,
     WordPressBloggerAgent
 )
-from backend.config import get_settings
+from examples._common import dumps, ensure_dir, run, settings
 
 
-async def complete_marketing_workflow():
+async def complete_marketing_workflow(
+    lead_agent: LeadGeneratorAgent,
+    social_agent: SocialMediaManagerAgent,
+    blog_agent: WordPressBloggerAgent
+):
     """
     Example: Complete marketing workflow using all 3 agents.
     
@@ -30,18 +34,9 @@ async def complete_marketing_workflow():
     print("🚀 Complete Marketing Workflow")
     print("="*60)
     
-    settings = get_settings()
     niche = "AI SaaS Companies"
     location = "San Francisco, CA"
-    
-    # Initialize all agents
-    lead_agent = LeadGeneratorAgent(max_results=settings.lead_gen_max_results)
-    social_agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
-    blog_agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
+    city = location.split(",", 1)[0]
     
     print(f"\n📋 Campaign: {niche} in {location}")
     print("="*60)
@@ -68,7 +63,7 @@ async def complete_marketing_workflow():
     print("-" * 60)
     
     campaign_result = await social_agent.create_campaign(
-        topic=f"Best {niche} in {location.split(',')[0]}",
+        topic=f"Best {niche} in {city}",
         duration_days=5,
         platforms=["twitter", "linkedin"]
     )
@@ -86,7 +81,7 @@ async def complete_marketing_workflow():
     print("-" * 60)
     
     article_result = await blog_agent.execute({
-        "topic": f"Top {niche} in {location.split(',')[0]} - 2025 Guide",
+        "topic": f"Top {niche} in {city} - 2025 Guide",
         "word_count": 1500,
         "tone": "professional"
     })
@@ -109,23 +104,16 @@ async def complete_marketing_workflow():
     print(f"\n🎯 Total Marketing Assets: {lead_result['count'] + campaign_result['total_posts'] + 1}")
 
 
-async def parallel_agent_execution():
+async def parallel_agent_execution(
+    lead_agent: LeadGeneratorAgent,
+    social_agent: SocialMediaManagerAgent,
+    blog_agent: WordPressBloggerAgent
+):
     """Example: Execute multiple agents in parallel."""
     print("\n" + "="*60)
     print("⚡ Parallel Agent Execution")
     print("="*60)
     
-    settings = get_settings()
-    
-    # Initialize agents
-    lead_agent = LeadGeneratorAgent(max_results=settings.lead_gen_max_results)
-    social_agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
-    blog_agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
-    
     print("\n🚀 Executing all agents simultaneously...")
     
     # Run all agents in parallel
@@ -155,23 +143,17 @@ async def parallel_agent_execution():
     print(f"  Blog Article: {'✓' if blog_result.get('status') == 'success' else '✗'}")
 
 
-async def agent_collaboration():
+async def agent_collaboration(
+    social_agent: SocialMediaManagerAgent,
+    blog_agent: WordPressBloggerAgent
+):
     """Example: Agents working together on related tasks."""
     print("\n" + "="*60)
     print("🤝 Agent Collaboration Example")
     print("="*60)
     
-    settings = get_settings()
     topic = "Cloud Computing Solutions"
     
-    # Initialize agents
-    social_agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
-    blog_agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
-    
     print(f"\n📝 Topic: {topic}")
     
     # Step 1: Generate blog article
@@ -193,15 +175,18 @@ async def agent_collaboration():
     # Use the blog's keywords for social posts
     keywords = [kw["keyword"] for kw in blog_result["keywords"][:3]]
     
-    social_posts = []
-    for platform in ["twitter", "linkedin", "facebook"]:
-        result = await social_agent.execute({
+    results = await asyncio.gather(*(
+        social_agent.execute({
             "type": "post",
             "topic": f"New article: {topic}",
             "platform": platform
         })
-        if result["status"] == "success":
-            social_posts.append(result["content"])
+        for platform in ["twitter", "linkedin", "facebook"]
+    ), return_exceptions=True)
+    social_posts = [
+        result["content"] for result in results
+        if not isinstance(result, Exception) and result["status"] == "success"
+    ]
     
     print(f"✅ Created {len(social_posts)} promotional posts")
     
@@ -214,23 +199,16 @@ async def agent_collaboration():
     print(f"✅ Promotional Posts: {len(social_posts)} across multiple platforms")
 
 
-async def export_all_results():
+async def export_all_results(
+    lead_agent: LeadGeneratorAgent,
+    social_agent: SocialMediaManagerAgent,
+    blog_agent: WordPressBloggerAgent
+):
     """Example: Generate content and export everything."""
     print("\n" + "="*60)
     print("💾 Export All Results Example")
     print("="*60)
     
-    settings = get_settings()
-    
-    # Initialize agents
-    lead_agent = LeadGeneratorAgent(max_results=settings.lead_gen_max_results)
-    social_agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
-    blog_agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
-    
     campaign_name = "tech_campaign_2025"
     
     print(f"\n📦 Campaign: {campaign_name}")
@@ -255,12 +233,14 @@ async def export_all_results():
     )
     
     # Export all results
-    import json
-    from datetime import datetime
+    from datetime import datetime, timezone
+    
+    # Timestamp computed once (stable if the export is retried)
+    created_at = datetime.now(timezone.utc).isoformat()
     
-    campaign_data = {
+    sections = {
         "campaign_name": campaign_name,
-        "created_at": datetime.now().isoformat(),
+        "created_at": created_at,
         "leads": results[0],
         "social_campaign": results[1],
         "blog_articles": results[2]
@@ -268,10 +248,19 @@ async def export_all_results():
     
     # Save to output directory
     output_file = Path("./output") / f"{campaign_name}.json"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_file, "w") as f:
-        json.dump(campaign_data, f, indent=2)
+    ensure_dir(output_file.parent)
+    
+    # Stream the outer object section by section through a 1 MiB buffer,
+    # so only one section's serialized form exists at a time
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(sections.items()):
+            if i:
+                f.write(b",")
+            f.write(dumps(key))
+            f.write(b":")
+            f.write(dumps(value))
+        f.write(b"}")
     
     print(f"\n✅ Campaign exported to: {output_file}")
     print(f"📊 Summary:")
@@ -288,11 +277,20 @@ async def main():
     print("All 3 agents working together")
     print("="*60)
     
+    # One set of agents shared by every workflow
+    lead_agent = LeadGeneratorAgent(max_results=settings.lead_gen_max_results)
+    social_agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
+    blog_agent = WordPressBloggerAgent(
+        wordpress_url=settings.wordpress_url,
+        target_word_count=settings.target_word_count,
+        min_seo_score=settings.min_seo_score
+    )
+    
     try:
-        await complete_marketing_workflow()
-        await parallel_agent_execution()
-        await agent_collaboration()
-        await export_all_results()
+        await complete_marketing_workflow(lead_agent, social_agent, blog_agent)
+        await parallel_agent_execution(lead_agent, social_agent, blog_agent)
+        await agent_collaboration(social_agent, blog_agent)
+        await export_all_results(lead_agent, social_agent, blog_agent)
         
         print("\n" + "="*60)
         print("✅ All examples completed successfully!")
@@ -305,4 +303,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based event loop when installed (not available on Windows)
+    run(main())
@@ -2,7 +2,7 @@
 Lead Generator Agent Example
 Demonstrates lead generation with batch processing.
 """
-import asyncio
+from collections import Counter
 import sys
 from pathlib import Path
 
@@ -10,7 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backend.agents import LeadGeneratorAgent
-from backend.config import get_settings
+from examples._common import dumps, ensure_dir, run, settings
 
 
 async def single_lead_search():
@@ -19,7 +19,6 @@ async def single_lead_search():
     print("Example 1: Single Lead Generation Search")
     print("="*60)
     
-    settings = get_settings()
     agent = LeadGeneratorAgent(max_results=settings.lead_gen_max_results)
     
     task = {
@@ -33,11 +32,14 @@ async def single_lead_search():
     
     if result["status"] == "success":
         print(f"✅ Found {result['count']} leads")
-        for i, lead in enumerate(result["leads"][:3], 1):
-            print(f"\n  Lead {i}:")
-            print(f"    Name: {lead['name']}")
-            print(f"    Location: {lead['location']}")
-            print(f"    Score: {lead['score']}")
+        # One write for the whole listing instead of four prints per lead
+        print("".join(
+            f"\n  Lead {i}:\n"
+            f"    Name: {lead['name']}\n"
+            f"    Location: {lead['location']}\n"
+            f"    Score: {lead['score']}\n"
+            for i, lead in enumerate(result["leads"][:3], 1)
+        ), end="")
     else:
         print(f"❌ Error: {result.get('error')}")
 
@@ -48,7 +50,6 @@ async def batch_lead_generation():
     print("Example 2: Batch Lead Generation")
     print("="*60)
     
-    settings = get_settings()
     agent = LeadGeneratorAgent(max_results=settings.lead_gen_max_results)
     
     queries = [
@@ -65,9 +66,9 @@ async def batch_lead_generation():
         print(f"✅ Total leads generated: {result['total_leads']}")
         print(f"✅ Queries processed: {result['queries_processed']}")
         print(f"\n📊 Breakdown:")
+        counts = Counter(lead['query'] for lead in result['leads'])
         for query in queries:
-            count = len([l for l in result['leads'] if l['query'] == query])
-            print(f"  {query}: {count} leads")
+            print(f"  {query}: {counts[query]} leads")
     else:
         print(f"❌ Error: {result.get('error')}")
 
@@ -78,7 +79,6 @@ async def search_with_qualification():
     print("Example 3: Search with Lead Qualification")
     print("="*60)
     
-    settings = get_settings()
     agent = LeadGeneratorAgent(max_results=settings.lead_gen_max_results)
     
     # First search
@@ -102,7 +102,6 @@ async def export_leads():
     print("Example 4: Export Leads to File")
     print("="*60)
     
-    settings = get_settings()
     agent = LeadGeneratorAgent(max_results=settings.lead_gen_max_results)
     
     # Generate leads
@@ -118,14 +117,15 @@ async def export_leads():
     if result["status"] == "success":
         # Simulate export
         output_file = Path(settings.output_dir_leads) / "coffee_shops_seattle.json"
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_file.parent)
         
-        import json
-        with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
+        # Compact JSON encoded once and written in a single call;
+        # the payload length gives the file size without a stat()
+        payload = dumps(result)
+        output_file.write_bytes(payload)
         
         print(f"✅ Exported {result['count']} leads to: {output_file}")
-        print(f"📁 File size: {output_file.stat().st_size} bytes")
+        print(f"📁 File size: {len(payload)} bytes")
     else:
         print(f"❌ Error: {result.get('error')}")
 
@@ -153,4 +153,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based event loop when installed (not available on Windows)
+    run(main())
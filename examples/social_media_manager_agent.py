@@ -10,7 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backend.agents import SocialMediaManagerAgent
-from backend.config import get_settings
+from examples._common import dumps, ensure_dir, run, settings
 
 
 async def generate_single_post():
@@ -19,7 +19,6 @@ async def generate_single_post():
     print("Example 1: Generate Single Social Media Post")
     print("="*60)
     
-    settings = get_settings()
     agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
     
     task = {
@@ -50,7 +49,6 @@ async def create_content_calendar():
     print("Example 2: Create Content Calendar")
     print("="*60)
     
-    settings = get_settings()
     agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
     
     task = {
@@ -83,7 +81,6 @@ async def research_hashtags():
     print("Example 3: Hashtag Research")
     print("="*60)
     
-    settings = get_settings()
     agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
     
     task = {
@@ -113,7 +110,6 @@ async def create_complete_campaign():
     print("Example 4: Complete Social Media Campaign")
     print("="*60)
     
-    settings = get_settings()
     agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
     
     topic = "Product Launch: AI Assistant"
@@ -151,7 +147,6 @@ async def multi_platform_posting():
     print("Example 5: Multi-Platform Post Generation")
     print("="*60)
     
-    settings = get_settings()
     agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
     
     topic = "Remote Work Best Practices"
@@ -160,17 +155,19 @@ async def multi_platform_posting():
     print(f"\n📱 Generating posts for {len(platforms)} platforms...")
     print(f"📝 Topic: {topic}\n")
     
-    for platform in platforms:
-        task = {
+    # Platforms are independent: generate all posts concurrently
+    results = await asyncio.gather(*(
+        agent.execute({
             "type": "post",
             "topic": topic,
             "platform": platform,
             "tone": "professional"
-        }
-        
-        result = await agent.execute(task)
-        
-        if result["status"] == "success":
+        })
+        for platform in platforms
+    ), return_exceptions=True)
+    
+    for platform, result in zip(platforms, results):
+        if not isinstance(result, Exception) and result["status"] == "success":
             content = result["content"]
             print(f"✅ {platform.title()}:")
             print(f"   {content['text'][:80]}...")
@@ -185,7 +182,6 @@ async def export_campaign():
     print("Example 6: Export Campaign to File")
     print("="*60)
     
-    settings = get_settings()
     agent = SocialMediaManagerAgent(default_tone=settings.default_tone)
     
     result = await agent.create_campaign(
@@ -197,14 +193,15 @@ async def export_campaign():
     if result["status"] == "success":
         # Export to file
         output_file = Path(settings.output_dir_social) / "holiday_campaign.json"
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_file.parent)
         
-        import json
-        with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
+        # Compact JSON encoded once and written in a single call;
+        # the payload length gives the file size without a stat()
+        payload = dumps(result)
+        output_file.write_bytes(payload)
         
         print(f"✅ Campaign exported to: {output_file}")
-        print(f"📁 File size: {output_file.stat().st_size} bytes")
+        print(f"📁 File size: {len(payload)} bytes")
         print(f"📊 Campaign includes {result['total_posts']} posts")
     else:
         print(f"❌ Error: {result.get('error')}")
@@ -235,4 +232,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based event loop when installed (not available on Windows)
+    run(main())
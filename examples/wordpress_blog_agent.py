@@ -3,14 +3,69 @@ WordPress Blogger Agent Example
 Demonstrates SEO-optimized article generation and WordPress publishing.
 """
 import asyncio
+import io
 import sys
+import traceback
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backend.agents import WordPressBloggerAgent
-from backend.config import get_settings
+from examples._common import dumps, ensure_dir, run, settings
+
+
+@lru_cache(maxsize=1)
+def _agent() -> WordPressBloggerAgent:
+    """Agent shared by every example (stateless between tasks)."""
+    return WordPressBloggerAgent(
+        wordpress_url=settings.wordpress_url,
+        target_word_count=settings.target_word_count,
+        min_seo_score=settings.min_seo_score
+    )
+
+
+# Per-task output buffer, so concurrent examples don't interleave their prints
+_task_output: ContextVar[io.StringIO | None] = ContextVar("_task_output", default=None)
+
+
+class _TaskStdout:
+    """stdout proxy writing to the current task's buffer when one is set."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        return (_task_output.get() or self._stream).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write a file atomically (temporary file, then rename)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+async def _write_files_batch(pairs: list[tuple[Path, bytes]]) -> None:
+    """Write several files concurrently from worker threads."""
+    await asyncio.gather(*(asyncio.to_thread(_atomic_write, path, data) for path, data in pairs))
+
+
+async def _run_buffered(example) -> str:
+    """Run one example in its own task context and return everything it printed."""
+    buffer = io.StringIO()
+    _task_output.set(buffer)
+    try:
+        await example()
+    except Exception as e:
+        buffer.write(f"\n❌ Error running {example.__name__}: {e}\n")
+        traceback.print_exc(file=buffer)
+    return buffer.getvalue()
 
 
 async def generate_single_article():
@@ -19,12 +74,7 @@ async def generate_single_article():
     print("Example 1: Generate SEO-Optimized Article")
     print("="*60)
     
-    settings = get_settings()
-    agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
+    agent = _agent()
     
     task = {
         "topic": "Machine Learning for Beginners",
@@ -66,18 +116,12 @@ async def generate_with_publishing():
     print("Example 2: Generate and Publish to WordPress")
     print("="*60)
     
-    settings = get_settings()
-    
     if not settings.wordpress_url:
         print("⚠️  WordPress URL not configured, skipping publish...")
         print("   Set WORDPRESS_URL in .env to enable publishing")
         return
     
-    agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
+    agent = _agent()
     
     task = {
         "topic": "Content Marketing Strategies",
@@ -107,12 +151,7 @@ async def batch_article_generation():
     print("Example 3: Batch Article Generation")
     print("="*60)
     
-    settings = get_settings()
-    agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
+    agent = _agent()
     
     topics = [
         "Python Programming Best Practices",
@@ -131,10 +170,13 @@ async def batch_article_generation():
         print(f"  Failed: {result['failed']}")
         
         print(f"\n📚 Generated Articles:")
-        for article in result['articles']:
-            print(f"  • {article['topic']}")
-            print(f"    Word Count: {article['word_count']}")
-            print(f"    SEO Score: {article['seo_score']['overall']}/100")
+        # One write for the whole listing instead of three prints per article
+        print("".join(
+            f"  • {article['topic']}\n"
+            f"    Word Count: {article['word_count']}\n"
+            f"    SEO Score: {article['seo_score']['overall']}/100\n"
+            for article in result['articles']
+        ), end="")
     else:
         print(f"❌ Error: {result.get('error')}")
 
@@ -145,12 +187,7 @@ async def article_with_seo_analysis():
     print("Example 4: Article with SEO Analysis")
     print("="*60)
     
-    settings = get_settings()
-    agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
+    agent = _agent()
     
     task = {
         "topic": "Artificial Intelligence Ethics",
@@ -186,12 +223,7 @@ async def export_article():
     print("Example 5: Export Article to File")
     print("="*60)
     
-    settings = get_settings()
-    agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
+    agent = _agent()
     
     task = {
         "topic": "DevOps Best Practices",
@@ -205,22 +237,30 @@ async def export_article():
     if result["status"] == "success":
         # Export to JSON
         output_file = Path(settings.output_dir_blog) / "devops_best_practices.json"
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_file.parent)
         
-        import json
-        with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
+        # Serialization runs off the event loop (other examples keep running)
+        payload = await asyncio.to_thread(dumps, result)
         
-        print(f"✅ Article exported to: {output_file}")
-        print(f"📁 File size: {output_file.stat().st_size} bytes")
+        files = [(output_file, payload)]
         
-        # Also save HTML version
+        # Also save HTML version (page built in memory), unless there is no body
         html_file = output_file.with_suffix(".html")
-        with open(html_file, "w") as f:
-            f.write(f"<html><head><title>{result['article']['title']}</title></head>")
-            f.write(f"<body>{result['article']['content']}</body></html>")
+        content = result['article'].get('content')
+        if content:
+            html = (
+                f"<html><head><title>{result['article']['title']}</title></head>"
+                f"<body>{content}</body></html>"
+            )
+            files.append((html_file, html.encode("utf-8")))
+        
+        # Files written in one concurrent batch
+        await _write_files_batch(files)
         
-        print(f"📄 HTML version: {html_file}")
+        print(f"✅ Article exported to: {output_file}")
+        print(f"📁 File size: {len(payload)} bytes")
+        if content:
+            print(f"📄 HTML version: {html_file}")
     else:
         print(f"❌ Error: {result.get('error')}")
 
@@ -231,12 +271,7 @@ async def article_sections_breakdown():
     print("Example 6: Article Structure Analysis")
     print("="*60)
     
-    settings = get_settings()
-    agent = WordPressBloggerAgent(
-        wordpress_url=settings.wordpress_url,
-        target_word_count=settings.target_word_count,
-        min_seo_score=settings.min_seo_score
-    )
+    agent = _agent()
     
     task = {
         "topic": "Cybersecurity Fundamentals",
@@ -269,23 +304,30 @@ async def main():
     print("🤖 WordPress Blogger Agent - Examples")
     print("="*60)
     
+    examples = [
+        generate_single_article,
+        generate_with_publishing,
+        batch_article_generation,
+        article_with_seo_analysis,
+        export_article,
+        article_sections_breakdown
+    ]
+    
+    # Independent I/O-bound examples run concurrently (each in its own task);
+    # their buffered output is printed afterwards in declaration order
+    stdout = sys.stdout
+    sys.stdout = _TaskStdout(stdout)
     try:
-        await generate_single_article()
-        await generate_with_publishing()
-        await batch_article_generation()
-        await article_with_seo_analysis()
-        await export_article()
-        await article_sections_breakdown()
-        
-        print("\n" + "="*60)
-        print("✅ All examples completed successfully!")
-        print("="*60 + "\n")
-        
-    except Exception as e:
-        print(f"\n❌ Error running examples: {e}")
-        import traceback
-        traceback.print_exc()
+        outputs = await asyncio.gather(*(_run_buffered(example) for example in examples))
+    finally:
+        sys.stdout = stdout
+    
+    print("".join(outputs), end="")
+    print("\n" + "="*60)
+    print("✅ All examples completed!")
+    print("="*60 + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based event loop when installed (not available on Windows)
+    run(main())
@@ -1,6 +1,7 @@
 import pytest
 from backend.mcp.artifacts import (
     create_artifact,
+    create_artifacts,
     save_artifact,
     list_artifacts,
     update_artifact,
@@ -72,6 +73,18 @@ async def test_create_artifact_with_metadata():
     assert result["artifact"]["metadata"]["author"] == "Test"
     assert result["artifact"]["metadata"]["version"] == "1.0"
 
+@pytest.mark.asyncio
+async def test_create_artifact_adds_to_store():
+    """Test that single and batch creation both store their artifacts."""
+    single = await create_artifact("one.py", "code", "print(1)")
+    batch = await create_artifacts([{"name": "two.md", "type": "document", "content": "# 2"}])
+    invalid = await create_artifact("bad.txt", "invalid_type", "x")
+
+    assert artifact_store.get(single["artifact"]["id"]) is single["artifact"]
+    assert artifact_store.get(batch["artifacts"][0]["id"]) is batch["artifacts"][0]
+    assert invalid["success"] is False
+    assert artifact_store.get_stats()["total_artifacts"] == 2
+
 @pytest.mark.asyncio
 async def test_list_artifacts():
     """Test listing artifacts."""
@@ -170,26 +183,24 @@ async def test_artifact_store_max_limit():
     finally:
         artifact_store.max_artifacts = original_max
 
+@pytest.mark.parametrize("filename,expected_lang", [
+    ("script.py", "python"),
+    ("app.js", "javascript"),
+    ("main.go", "go"),
+    ("component.tsx", "tsx"),
+    ("styles.css", "css"),
+    ("config.yaml", "yaml"),
+])
 @pytest.mark.asyncio
-async def test_language_auto_detection():
+async def test_language_auto_detection(filename, expected_lang):
     """Test automatic language detection from filename."""
-    test_cases = [
-        ("script.py", "python"),
-        ("app.js", "javascript"),
-        ("main.go", "go"),
-        ("component.tsx", "tsx"),
-        ("styles.css", "css"),
-        ("config.yaml", "yaml"),
-    ]
-
-    for filename, expected_lang in test_cases:
-        result = await create_artifact(
-            name=filename,
-            type="code",
-            content="test"
-        )
+    result = await create_artifact(
+        name=filename,
+        type="code",
+        content="test"
+    )
 
-        assert result["artifact"]["language"] == expected_lang
+    assert result["artifact"]["language"] == expected_lang
 
 def test_artifact_store_stats():
     """Test artifact store statistics."""
@@ -245,3 +256,40 @@ def test_artifact_store_export_import(tmp_path):
 
     assert count == 1
     assert artifact_store.get("test1") is not None
+
+def test_artifact_store_type_index():
+    """Test that the type index and stats follow add/update/delete."""
+    artifact_store.add({"id": "a", "type": "code", "size_bytes": 10, "created_at": "2025-01-01"})
+    artifact_store.add({"id": "b", "type": "document", "size_bytes": 5, "created_at": "2025-01-02"})
+    artifact_store.add({"id": "c", "type": "code", "size_bytes": 1, "metadata": {}, "created_at": "2025-01-03"})
+
+    assert [a["id"] for a in artifact_store.list(type_filter="code")] == ["c", "a"]
+
+    artifact_store.update("c", content="abcd")
+    artifact_store.delete("a")
+
+    assert [a["id"] for a in artifact_store.list(type_filter="code")] == ["c"]
+    stats = artifact_store.get_stats()
+    assert stats["by_type"] == {"code": 1, "document": 1}
+    assert stats["total_size_bytes"] == 9
+
+@pytest.mark.asyncio
+async def test_create_artifacts_batch_respects_max_limit():
+    """Test bulk creation with a single eviction pass."""
+    original_max = artifact_store.max_artifacts
+    artifact_store.max_artifacts = 3
+
+    try:
+        result = await create_artifacts(
+            [{"name": f"test{i}.py", "type": "code", "content": f"print({i})"} for i in range(5)]
+            + [{"name": "bad.txt", "type": "invalid_type", "content": "x"}]
+        )
+
+        assert result["success"] is False
+        assert len(result["artifacts"]) == 5
+        assert result["errors"][0]["index"] == 5
+        assert artifact_store.get_stats()["total_artifacts"] == 3
+        assert all(a["language"] == "python" for a in artifact_store.list())
+
+    finally:
+        artifact_store.max_artifacts = original_max
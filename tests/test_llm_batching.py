@@ -0,0 +1,138 @@
+import asyncio
+import json
+import pytest
+from types import SimpleNamespace
+from backend.llm.batching import BatchingGeminiClient
+from backend.llm.gemini_client import GeminiClient
+
+class FakeGemini:
+    """Faux client Gemini enregistrant les prompts reçus."""
+
+    model = "test-model"
+
+    def __init__(self, batched_response=None):
+        self.batched_response = batched_response
+        self.prompts = []
+
+    async def generate(self, prompt: str, **kwargs):
+        self.prompts.append((prompt, kwargs))
+        if "### Requête 1" in prompt:
+            return self.batched_response
+        return f"seul: {prompt}"
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_call():
+    """Test le regroupement de requêtes concurrentes en un seul appel."""
+    fake = FakeGemini('```json\n["r1", {"steps": []}, "r3"]\n```')
+    client = BatchingGeminiClient(fake, max_batch_size=8, max_wait_ms=10)
+
+    results = await asyncio.gather(*(client.generate(p, max_output_tokens=100) for p in ["a", "b", "c"]))
+
+    assert results == ["r1", json.dumps({"steps": []}), "r3"]
+    assert len(fake.prompts) == 1
+    assert fake.prompts[0][1] == {"max_output_tokens": 300}
+    assert client.model == "test-model"
+
+@pytest.mark.asyncio
+async def test_batch_sends_shared_instructions_once():
+    """Test que les instructions invariantes ne sont envoyées qu'une fois par lot."""
+    fake = FakeGemini('["r1", "r2", "r3"]')
+    client = BatchingGeminiClient(fake, max_batch_size=8, max_wait_ms=10)
+
+    results = await asyncio.gather(
+        *(client.generate(p, instructions="CONSIGNES") for p in ["a", "b", "c"])
+    )
+
+    assert results == ["r1", "r2", "r3"]
+    assert len(fake.prompts) == 1
+    prompt, kwargs = fake.prompts[0]
+    assert prompt.startswith("CONSIGNES")
+    assert prompt.count("CONSIGNES") == 1
+    assert "instructions" not in kwargs
+
+@pytest.mark.asyncio
+async def test_unparseable_batch_falls_back_to_single_calls():
+    """Test le rejeu individuel quand la réponse groupée est illisible."""
+    fake = FakeGemini("pas de JSON")
+    client = BatchingGeminiClient(fake, max_batch_size=2, max_wait_ms=1000)
+
+    results = await asyncio.gather(client.generate("a"), client.generate("b"))
+
+    assert results == ["seul: a", "seul: b"]
+    assert len(fake.prompts) == 3
+
+class FakeBatches:
+    """Faux service Batch API : le job aboutit au second sondage."""
+
+    def __init__(self):
+        self.polls = 0
+
+    async def create(self, model, src):
+        return SimpleNamespace(name="batches/1", state=SimpleNamespace(name="JOB_STATE_PENDING"), dest=None)
+
+    async def get(self, name):
+        self.polls += 1
+        response = SimpleNamespace(response=SimpleNamespace(text="réponse différée"), error=None)
+        return SimpleNamespace(
+            name=name,
+            state=SimpleNamespace(name="JOB_STATE_SUCCEEDED"),
+            dest=SimpleNamespace(inlined_responses=[response])
+        )
+
+@pytest.mark.asyncio
+async def test_batch_service_tier_polls_job():
+    """Test le tier batch : soumission puis sondage du job jusqu'à son terme."""
+    client = GeminiClient(api_key="x", model="test-model")
+    batches = FakeBatches()
+    client.client = SimpleNamespace(aio=SimpleNamespace(batches=batches))
+    client.batch_poll_interval = 0
+
+    assert await client.generate("Résume", service_tier="batch") == "réponse différée"
+    assert batches.polls == 1
+
+class FailingBatches(FakeBatches):
+    """Faux service Batch API : le job expire."""
+
+    def __init__(self):
+        super().__init__()
+        self.created = 0
+
+    async def create(self, model, src):
+        self.created += 1
+        return await super().create(model, src)
+
+    async def get(self, name):
+        return SimpleNamespace(name=name, state=SimpleNamespace(name="JOB_STATE_EXPIRED"), dest=None)
+
+@pytest.mark.asyncio
+async def test_failed_batch_job_is_not_resubmitted():
+    """Test qu'un job Batch API en échec n'est pas resoumis par le retry."""
+    client = GeminiClient(api_key="x", model="test-model")
+    batches = FailingBatches()
+    client.client = SimpleNamespace(aio=SimpleNamespace(batches=batches))
+    client.batch_poll_interval = 0
+
+    with pytest.raises(RuntimeError):
+        await client.generate("Résume", service_tier="batch")
+    assert batches.created == 1
+
+class FakeCaches:
+    """Faux service de cache de contexte asynchrone."""
+
+    def __init__(self):
+        self.created = 0
+
+    async def create(self, model, config):
+        self.created += 1
+        return SimpleNamespace(name=f"cachedContents/{self.created}")
+
+@pytest.mark.asyncio
+async def test_prefix_cache_created_once_with_async_client():
+    """Test la création du cache de contexte via le client async, réutilisé ensuite."""
+    client = GeminiClient(api_key="x", model="test-model")
+    caches = FakeCaches()
+    client.client = SimpleNamespace(aio=SimpleNamespace(caches=caches))
+
+    assert await client.get_prefix_cache("Instructions", ttl_seconds=3600) == "cachedContents/1"
+    assert await client.get_prefix_cache("Instructions", ttl_seconds=3600) == "cachedContents/1"
+    assert caches.created == 1
@@ -0,0 +1,72 @@
+import pytest
+from backend.llm.cache import LLMCache, cache_key
+from backend.llm.prompt_builder import PromptBuilder
+from backend.nodes.reasoning import ReasoningNode
+
+class CountingGemini:
+    """Faux client Gemini comptant les appels."""
+
+    model = "test-model"
+
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    async def generate(self, prompt: str, **kwargs):
+        self.calls += 1
+        return self.response
+
+def test_cache_key_is_stable():
+    """Test la stabilité de la clé indépendamment de l'ordre des paramètres."""
+    a = cache_key("m", "prompt", temperature=0.7, max_output_tokens=10)
+    b = cache_key("m", "prompt", max_output_tokens=10, temperature=0.7)
+
+    assert a == b
+    assert a != cache_key("m", "prompt", temperature=0.2, max_output_tokens=10)
+
+@pytest.mark.asyncio
+async def test_cache_lru_eviction():
+    """Test l'éviction de l'entrée la moins récemment utilisée."""
+    cache = LLMCache(max_size=2)
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    assert await cache.get("a") == "1"
+
+    await cache.set("c", "3")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "1"
+    assert cache.get_stats()["hits"] == 2
+
+@pytest.mark.asyncio
+async def test_cache_ttl_expiry():
+    """Test l'expiration des entrées."""
+    cache = LLMCache(ttl=-1)
+    await cache.set("a", "1")
+
+    assert await cache.get("a") is None
+    assert cache.get_stats()["size"] == 0
+
+@pytest.mark.asyncio
+async def test_reasoning_decompose_uses_cache():
+    """Test que la décomposition identique ne rappelle pas le LLM."""
+    node = ReasoningNode()
+    node.gemini = CountingGemini('{"steps": [{"id": 1, "action": "A"}]}')
+    node.cache = LLMCache()
+    context = {"clean_input": "Explique les trous noirs", "task_type": "qa", "intent": "question"}
+
+    first = await node._decompose(context)
+    second = await node._decompose(context)
+
+    assert first == second == [{"id": 1, "action": "A"}]
+    assert node.gemini.calls == 1
+
+def test_prompts_start_with_invariant_prefix():
+    """Test que les prompts commencent par le préfixe invariant (cache de contexte)."""
+    for text in ["Bonjour", "Explique la relativité"]:
+        decompose = PromptBuilder.build_rrla_decompose({"clean_input": text})
+        synthesis = PromptBuilder.build_synthesis({"steps": []}, text)
+
+        assert decompose.startswith(PromptBuilder.RRLA_DECOMPOSE_INSTRUCTIONS)
+        assert decompose.endswith(PromptBuilder.build_rrla_decompose_request({"clean_input": text}))
+        assert synthesis.startswith(PromptBuilder.SYNTHESIS_INSTRUCTIONS)
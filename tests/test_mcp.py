@@ -1,6 +1,8 @@
+import asyncio
 import pytest
-from backend.mcp import mcp_server
-from backend.mcp.tools import search_memory, calculate, analyze_sentiment
+from backend.mcp import mcp_server, tools
+from backend.mcp.tool_modules import social_media, wordpress
+from backend.mcp.tools import search_memory, store_memory, calculate, analyze_sentiment, extract_keywords, TextView
 
 @pytest.mark.asyncio
 async def test_mcp_server_initialization():
@@ -37,6 +39,42 @@ async def test_search_memory_tool():
     assert all("content" in item for item in result)
     assert all("score" in item for item in result)
 
+@pytest.mark.asyncio
+async def test_search_memory_cached_until_store(monkeypatch):
+    """Test le cache des recherches, invalidé par une écriture en mémoire."""
+    calls = []
+    original = tools._search
+
+    async def counting(query, top_k):
+        calls.append((query, top_k))
+        return await original(query, top_k)
+
+    monkeypatch.setattr(tools, "_search", counting)
+
+    first = await search_memory(query="cache", top_k=2)
+    assert await search_memory(query="cache", top_k=2) == first
+    assert len(calls) == 1
+
+    await search_memory(query="cache", top_k=1)
+    assert len(calls) == 2
+
+    await store_memory("nouveau souvenir")
+
+    await search_memory(query="cache", top_k=2)
+    assert len(calls) == 3
+
+@pytest.mark.asyncio
+async def test_search_memory_cache_hits_are_copies():
+    """Test qu'un appelant qui modifie un résultat n'altère pas le cache."""
+    first = await search_memory(query="copie", top_k=2)
+    first[0]["content"] = "modifié"
+    first.append({"content": "ajouté"})
+
+    second = await search_memory(query="copie", top_k=2)
+
+    assert len(second) == 2
+    assert second[0]["content"] == "Résultat 1 pour: copie"
+
 @pytest.mark.asyncio
 async def test_calculate_tool():
     """Test l'outil de calcul."""
@@ -85,3 +123,119 @@ def test_mcp_tools_schema():
     assert all("name" in schema for schema in schemas)
     assert all("description" in schema for schema in schemas)
     assert all("parameters" in schema for schema in schemas)
+
+def test_mcp_accessors_cached_until_registration():
+    """Test la mise en cache des infos/schémas, invalidée par register_tool."""
+    from backend.mcp.server import MCPServer, MCPTool
+
+    async def handler() -> None:
+        return None
+
+    server = MCPServer("test", "0.0.1")
+    server.register_tool(MCPTool("first", "Premier outil", {}, handler))
+
+    server.get_tools_schema()
+    server.get_server_info()
+    schema_cache, info_cache = server._schema_cache, server._info_cache
+    assert server.get_tools_schema() == schema_cache
+    assert server.get_server_info() == info_cache
+    assert server._schema_cache is schema_cache and server._info_cache is info_cache
+
+    # Les appelants reçoivent des copies : les modifier n'altère pas le cache
+    server.get_tools_schema()[0]["extra"] = True
+    server.get_server_info()["extra"] = True
+    assert "extra" not in server.get_tools_schema()[0]
+    assert "extra" not in server.get_server_info()
+
+    server.register_tool(MCPTool("second", "Second outil", {}, handler))
+
+    assert [s["name"] for s in server.get_tools_schema()] == ["first", "second"]
+    assert server.get_server_info()["capabilities"]["tools"] == ["first", "second"]
+
+@pytest.mark.asyncio
+async def test_text_view_shared_between_tools():
+    """Test le partage d'une TextView entre sentiment et mots-clés."""
+    view = TextView("Python est super, Python est génial")
+
+    sentiment = await analyze_sentiment(view)
+    keywords = await extract_keywords(view, max_keywords=1)
+
+    assert sentiment["sentiment"] == "positive"
+    assert keywords[0]["keyword"] == "python"
+    assert view.lower == "python est super, python est génial"
+
+@pytest.mark.asyncio
+async def test_multi_platform_post_keeps_platform_order(monkeypatch):
+    """Test l'ordre des résultats du fan-out, indépendant de l'ordre de complétion."""
+
+    delays = {"twitter": 0.03, "linkedin": 0.0, "instagram": 0.02}
+
+    async def fake_post(topic, platform, tone, include_hashtags):
+        await asyncio.sleep(delays[platform])
+        return {"success": True, "platform": platform}
+
+    monkeypatch.setattr(social_media, "generate_social_post", fake_post)
+    result = await social_media.generate_multi_platform_post(
+        "IA", platforms=["twitter", "linkedin", "instagram"]
+    )
+
+    assert list(result["posts"]) == ["twitter", "linkedin", "instagram"]
+    assert [p["platform"] for p in result["posts"].values()] == list(result["posts"])
+    assert result["count"] == 3
+
+@pytest.mark.asyncio
+async def test_multi_platform_post_failure_cancels_other_platforms(monkeypatch):
+    """Test qu'un échec sur une plateforme annule les générations restantes."""
+
+    cancelled = []
+
+    async def fake_post(topic, platform, tone, include_hashtags):
+        if platform == "linkedin":
+            raise RuntimeError("quota dépassé")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(platform)
+            raise
+
+    monkeypatch.setattr(social_media, "generate_social_post", fake_post)
+
+    with pytest.raises(ExceptionGroup) as excinfo:
+        await social_media.generate_multi_platform_post(
+            "IA", platforms=["twitter", "linkedin", "instagram"]
+        )
+
+    assert excinfo.group_contains(RuntimeError, match="quota")
+    assert sorted(cancelled) == ["instagram", "twitter"]
+
+@pytest.mark.asyncio
+async def test_publish_wordpress_pipeline_runs_analyses_concurrently(monkeypatch):
+    """Test le pipeline WordPress : analyses indépendantes en parallèle puis publication."""
+
+    started = []
+    all_started = asyncio.Event()
+
+    def concurrent(name, value):
+        async def step(*args):
+            started.append(name)
+            if len(started) == 4:
+                all_started.set()
+            # Bloque tant que les 4 analyses n'ont pas démarré (échoue si séquentiel)
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return value
+        return step
+
+    monkeypatch.setattr(wordpress, "calculate_seo_score", concurrent("seo", {"score": 90}))
+    monkeypatch.setattr(wordpress, "calculate_readability", concurrent("readability", {"grade": "B"}))
+    monkeypatch.setattr(wordpress, "generate_featured_image", concurrent("image", {"url": "i"}))
+    monkeypatch.setattr(wordpress, "fetch_stock_images", concurrent("stock", {"images": []}))
+
+    result = await wordpress.publish_wordpress_pipeline("DevOps", "https://blog.example")
+
+    assert sorted(started) == ["image", "readability", "seo", "stock"]
+    assert result["seo"] == {"score": 90}
+    assert result["readability"] == {"grade": "B"}
+    assert result["post"]["status"] == "draft"
+    assert result["post"]["url"].startswith("https://blog.example/")
+    assert result["yoast"]["post_id"] == result["post"]["post_id"]
+    assert result["keywords"][0]["keyword"] == "devops"
@@ -0,0 +1,292 @@
+import json
+import pytest
+import numpy as np
+import networkx as nx
+from datetime import datetime
+from backend.memory.context_manager import ContextManager, Turn
+from backend.memory.graph_memory import GraphMemory
+from backend.memory import vector_store
+from backend.memory.vector_store import VectorStore
+
+def test_context_token_estimate_is_incremental():
+    """Test le suivi incrémental de l'estimation de tokens."""
+    cm = ContextManager(max_length=1000)
+
+    cm.add_turn("user", "a" * 40)
+    cm.add_turn("assistant", "b" * 80)
+
+    assert cm.get_token_count_estimate() == (40 + 4) // 4 + (80 + 9) // 4
+
+    cm.clear()
+    assert cm.get_token_count_estimate() == 0
+
+def test_context_truncation_keeps_system_message():
+    """Test que la troncature conserve le message système."""
+    cm = ContextManager(max_length=50)
+
+    cm.add_turn("system", "Tu es un assistant.")
+    for i in range(10):
+        cm.add_turn("user", f"message {i} " + "x" * 40)
+
+    assert cm.history[0].role == "system"
+    assert cm.get_token_count_estimate() <= 50 or len(cm.history) == 2
+    assert cm.history[-1].content.startswith("message 9")
+
+def test_full_context_cache_invalidation():
+    """Test que le contexte texte est reconstruit après mutation."""
+    cm = ContextManager()
+
+    cm.add_turn("user", "Bonjour")
+    assert cm.get_full_context() == "USER: Bonjour"
+
+    cm.add_turn("assistant", "Salut")
+    assert cm.get_full_context() == "USER: Bonjour\n\nASSISTANT: Salut"
+
+    cm.clear()
+    assert cm.get_full_context() == ""
+
+
+def test_export_history_formats_timestamps():
+    """Test le formatage ISO des horodatages à l'export."""
+    cm = ContextManager()
+    cm.add_turn("user", "Bonjour")
+
+    exported = cm.export_history()[0]
+    assert datetime.fromisoformat(exported["timestamp"]).date() == datetime.now().date()
+    assert isinstance(cm.history[0], Turn)
+
+
+def test_context_truncation_evicts_oldest_first():
+    """Test l'éviction FIFO des tours les plus anciens."""
+    cm = ContextManager(max_length=30)
+    for i in range(20):
+        cm.add_turn("user", f"tour {i} " + "x" * 20)
+
+    contents = [turn["content"] for turn in cm.export_history()]
+    assert contents[-1].startswith("tour 19")
+    assert contents == sorted(contents, key=lambda c: int(c.split()[1]))
+    assert cm.get_recent_history(1)[0].content.startswith("tour 19")
+
+
+def test_graph_related_concepts_depth():
+    """Test le parcours BFS borné des concepts liés."""
+    gm = GraphMemory()
+    gm.add_edge("a", "b", "related")
+    gm.add_edge("b", "c", "related")
+    gm.add_edge("c", "d", "related")
+    gm.add_edge("a", "c", "related")
+
+    related = {r["node_id"]: r["depth"] for r in gm.get_related_concepts("a", max_depth=2)}
+    assert related == {"b": 1, "c": 1, "d": 2}
+    assert gm.get_related_concepts("missing") == []
+
+
+def test_graph_neighbors_sorted_and_refreshed():
+    """Test le tri par poids des voisins et l'invalidation du snapshot."""
+    gm = GraphMemory()
+    gm.add_edge("a", "b", "related", weight=0.2)
+    gm.add_edge("a", "c", "cause", weight=0.8)
+
+    assert [n for n, _ in gm.get_neighbors("a")] == ["c", "b"]
+    assert [n for n, _ in gm.get_neighbors("a", relation="related")] == ["b"]
+
+    gm.add_edge("a", "d", "related", weight=0.9)
+    assert [n for n, _ in gm.get_neighbors("a")] == ["d", "c", "b"]
+
+
+def test_graph_edits_visible_without_full_rebuild():
+    """Test que les nœuds modifiés sont lus sans reconstruire tout le snapshot CSR."""
+    gm = GraphMemory()
+    gm.add_edge("a", "b", "related", weight=0.2)
+    gm.add_edge("b", "c", "related")
+    assert [r["node_id"] for r in gm.get_related_concepts("a")] == ["b", "c"]
+
+    before = gm._indptr
+
+    gm.add_edge("a", "c", "cause", weight=0.9)
+    gm.strengthen_edge("a", "b", delta=0.5)
+    assert [n for n, _ in gm.get_neighbors("a")] == ["c", "b"]
+    assert {r["node_id"]: r["depth"] for r in gm.get_related_concepts("a")} == {"c": 1, "b": 1}
+    assert gm._indptr is before
+
+    # Un nouveau nœud atteignable impose la reconstruction
+    gm.add_edge("c", "d", "related")
+    assert {r["node_id"] for r in gm.get_related_concepts("a")} == {"b", "c", "d"}
+    assert gm._indptr is not before
+
+
+def test_graph_bfs_follows_insertion_order_and_direct_mutation():
+    """Test l'ordre d'insertion du BFS et la prise en compte des nœuds ajoutés sur `graph`."""
+    gm = GraphMemory()
+    gm.add_edge("a", "b", "related", weight=0.1)
+    gm.add_edge("a", "c", "related", weight=0.9)
+    assert [r["node_id"] for r in gm.get_related_concepts("a")] == ["b", "c"]
+
+    gm.graph.add_edge("c", "z")
+    assert [r["node_id"] for r in gm.get_related_concepts("a")] == ["b", "c", "z"]
+
+def test_graph_export_graphml_round_trip(tmp_path):
+    """Test l'export GraphML : created_at ISO calculé à l'export, attributs relus."""
+    gm = GraphMemory()
+    gm.add_node("a", "concept", {"label": "Alpha"})
+    gm.add_edge("a", "b", "cause", weight=0.5, metadata={"source": "test"})
+    path = tmp_path / "graph.graphml"
+
+    before = datetime.now()
+    gm.export_graphml(str(path))
+    loaded = nx.read_graphml(path)
+
+    node = loaded.nodes["a"]
+    assert node["type"] == "concept"
+    assert json.loads(node["data"]) == {"label": "Alpha"}
+    assert "created_ns" not in node
+    assert abs((datetime.fromisoformat(node["created_at"]) - before).total_seconds()) < 60
+
+    edge = loaded.edges["a", "b"]
+    assert edge["relation"] == "cause"
+    assert edge["weight"] == 0.5
+    assert json.loads(edge["metadata"]) == {"source": "test"}
+    assert datetime.fromisoformat(edge["created_at"]) <= datetime.now()
+
+
+def test_vector_store_add_batch():
+    """Test l'ajout groupé de documents."""
+    store = VectorStore(dimension=16)
+    ids = store.add_batch(["alpha", "beta"], [{"k": 1}, None])
+
+    assert ids == ["doc_0", "doc_1"]
+    assert store.add("gamma") == "doc_2"
+    assert store.documents[0]["metadata"] == {"k": 1}
+    assert store.documents[1]["metadata"] == {}
+    assert len(store.search("alpha", top_k=2)) == 2
+
+
+class _KeywordEncoder:
+    """Encodeur déterministe : un axe par mot-clé connu."""
+
+    axes = ("chat", "chien", "voiture")
+
+    def encode(self, texts, **kwargs):
+        def vec(text):
+            return np.array([text.count(axis) for axis in self.axes], dtype="float32")
+        if isinstance(texts, list):
+            return np.stack([vec(t) for t in texts])
+        return vec(texts)
+
+
+@pytest.mark.parametrize("quantization", ["fp32", "fp16", "int8"])
+def test_vector_store_fallback_ranking(monkeypatch, quantization):
+    """Test le classement cosine du fallback sans FAISS."""
+    monkeypatch.setattr(vector_store, "FAISS_AVAILABLE", False)
+    store = VectorStore(dimension=3, quantization=quantization)
+    store.encoder = _KeywordEncoder()
+
+    store.add_batch(["chat chat", "chien", "voiture chien", "chat chien"])
+    results = store.search("chat", top_k=2)
+
+    assert [doc["text"] for doc, _ in results] == ["chat chat", "chat chien"]
+    assert results[0][1] == pytest.approx(1.0, abs=1e-2)
+
+
+def test_vector_store_rejects_unknown_quantization():
+    """Test le refus d'une quantification inconnue."""
+    with pytest.raises(ValueError):
+        VectorStore(quantization="int4")
+
+
+def test_vector_store_fallback_growth(monkeypatch):
+    """Test la croissance de la matrice du fallback au-delà de la capacité initiale."""
+    monkeypatch.setattr(vector_store, "FAISS_AVAILABLE", False)
+    store = VectorStore(dimension=8)
+    store.add_batch([f"doc {i}" for i in range(300)])
+
+    assert len(store.documents) == 300
+    assert len(store.search("doc", top_k=300)) == 300
+
+    store.clear()
+    assert store.search("doc") == []
+
+
+def test_context_summarizes_old_turns_near_limit():
+    """Test le résumé heuristique des anciens tours à l'approche de la limite."""
+    cm = ContextManager(max_length=400)
+    cm.add_turn("system", "Tu es un assistant.")
+    for i in range(12):
+        cm.add_turn("user", f"Question {i} sur https://exemple.fr/{i}. " + "détails " * 10)
+
+    summaries = [t for t in cm.history if t.metadata.get("summary")]
+    assert summaries
+    assert cm.history[0].content == "Tu es un assistant."
+    assert "https://exemple.fr/1" in summaries[0].content
+    assert cm.history[-1].content.startswith("Question 11")
+    assert cm.get_token_count_estimate() == sum(t.tokens for t in cm.history)
+    assert cm.get_token_count_estimate() <= 400
+
+
+def test_context_compaction_attempts_are_spaced(monkeypatch):
+    """Test l'hystérésis : pas de nouvelle tentative de résumé à chaque tour."""
+    cm = ContextManager(max_length=400)
+    attempts = []
+    original = ContextManager._summarize_turns
+
+    def counting(turns):
+        attempts.append(len(turns))
+        return original(turns)
+
+    monkeypatch.setattr(ContextManager, "_summarize_turns", staticmethod(counting))
+
+    # Tours courts sans phrase ni fait : le résumé n'est jamais plus petit
+    for i in range(40):
+        cm.add_turn("user", "x" * 40)
+
+    assert 0 < len(attempts) <= 40 // 8
+
+
+def test_context_summaries_kept_and_not_resummarized():
+    """Test que les résumés ne sont ni re-résumés ni tronqués en premier (sans message system)."""
+    cm = ContextManager(max_length=400)
+    for i in range(40):
+        cm.add_turn("user", f"Question {i} sur https://exemple.fr/{i}. " + "détails " * 10)
+
+    summaries = [t for t in cm.history if t.metadata.get("summary")]
+    assert summaries
+    assert cm.history[0].metadata.get("summary")
+    assert all("[Summary]" not in line for s in summaries for line in s.content.splitlines()[1:])
+    assert cm.get_token_count_estimate() == sum(t.tokens for t in cm.history)
+    assert cm.get_token_count_estimate() <= 400
+
+
+def test_graph_stats_refresh_after_mutation():
+    """Test l'invalidation du cache des statistiques du graphe."""
+    gm = GraphMemory()
+    gm.add_edge("a", "b", "related")
+    assert gm.get_stats()["edges"] == 1
+    assert gm.get_stats()["is_connected"] is True
+
+    gm.add_node("c", "concept")
+    stats = gm.get_stats()
+    assert stats["nodes"] == 3
+    assert stats["is_connected"] is False
+
+
+@pytest.mark.parametrize("use_faiss", [True, False])
+def test_vector_store_persistence(monkeypatch, tmp_path, use_faiss):
+    """Test la sauvegarde puis le rechargement du store."""
+    if use_faiss and not vector_store.FAISS_AVAILABLE:
+        pytest.skip("FAISS not available")
+    monkeypatch.setattr(vector_store, "FAISS_AVAILABLE", use_faiss)
+    path = str(tmp_path / "store.index")
+
+    store = VectorStore(dimension=3, persist_path=path)
+    store.encoder = _KeywordEncoder()
+    store.add_batch(["chat chat", "chien", "voiture"], [{"n": 1}, None, None])
+    store.save()
+
+    reloaded = VectorStore(dimension=3, persist_path=path)
+    reloaded.encoder = _KeywordEncoder()
+    assert [d["id"] for d in reloaded.documents] == ["doc_0", "doc_1", "doc_2"]
+    assert reloaded.documents[0]["metadata"] == {"n": 1}
+    assert reloaded.search("chat", top_k=1)[0][0]["text"] == "chat chat"
+
+    assert reloaded.add("chat voiture") == "doc_3"
+    assert len(reloaded.search("voiture", top_k=5)) == 4
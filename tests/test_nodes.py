@@ -2,7 +2,12 @@ import pytest
 from backend.nodes.perception import PerceptionNode
 from backend.nodes.interpretation import InterpretationNode
 from backend.nodes.reasoning import ReasoningNode
+from backend.nodes.memory import MemoryNode
+from backend.nodes.action import ActionNode
+from backend.nodes.synthesis import SynthesisNode
+from backend.core.base_node import BaseNode
 from backend.core.shared import Shared
+from backend.llm.cache import LLMCache
 
 @pytest.mark.asyncio
 async def test_perception_node():
@@ -85,3 +90,162 @@ async def test_node_error_handling():
 
     assert result is not None
     assert result["clean_input"] == ""
+
+@pytest.mark.asyncio
+async def test_memory_node_keyword_search():
+    """Test la recherche mémoire par mots-clés après troncature."""
+    node = MemoryNode()
+    node.max_memory_size = 3
+
+    for query in ["météo paris", "recette crêpes", "météo lyon", "prix essence", "météo nice"]:
+        shared = Shared()
+        shared.set_result("perception", {"clean_input": query})
+        await node.run(shared)
+
+    assert [m["query"] for m in node._search("Météo demain")] == ["météo lyon", "météo nice"]
+    assert node._search("crêpes") == []
+
+@pytest.mark.asyncio
+async def test_memory_node_search_ignores_punctuation():
+    """Test que la ponctuation collée n'empêche pas la correspondance des mots."""
+    node = MemoryNode()
+
+    for query in ["j'aime python, vraiment", "rust"]:
+        shared = Shared()
+        shared.set_result("perception", {"clean_input": query})
+        await node.run(shared)
+
+    assert [m["query"] for m in node._search("python?")] == ["j'aime python, vraiment"]
+    assert [m["query"] for m in node._search("Rust !")] == ["rust"]
+
+def test_interpretation_keywords_match_whole_words():
+    """Test la détection par mots entiers (pas de sous-chaînes)."""
+    node = InterpretationNode()
+
+    assert node._analyze_sentiment("merci, c'est parfait") == "positive"
+    assert node._analyze_sentiment("un fonctionnement normal") == "neutral"
+    assert node._detect_intent("écris un script", {"has_command": True}) == "creation"
+
+def test_interpretation_keywords_match_inflected_forms():
+    """Test la détection des formes fléchies des mots-clés."""
+    node = InterpretationNode()
+    command = {"has_command": True}
+
+    assert node._detect_intent("expliquez ce code", command) == "analysis"
+    assert node._detect_intent("analyser les logs", command) == "analysis"
+    assert node._detect_intent("créer une page", command) == "creation"
+    assert node._detect_intent("générer un résumé", command) == "creation"
+    assert node._detect_task_type("créer des fonctions utiles", "creation") == "code_generation"
+    assert node._analyze_sentiment("des erreurs et des bugs") == "negative"
+    assert node._analyze_sentiment("plusieurs problèmes") == "negative"
+
+def test_interpretation_sentiment_counts_distinct_keywords():
+    """Test que les répétitions d'un même mot-clé ne comptent qu'une fois."""
+    node = InterpretationNode()
+
+    assert node._analyze_sentiment("bug, bug, bug mais merci et parfait") == "positive"
+
+@pytest.mark.asyncio
+async def test_interpretation_extracts_capitalized_entities():
+    """Test que les entités sont extraites du texte original (casse conservée)."""
+    node = InterpretationNode()
+
+    result = await node.exec({"clean_input": "Je vais à Paris avec Marie Curie"})
+
+    assert set(result["entities"]) == {"Je", "Paris", "Marie Curie"}
+    assert result["complexity"] == "simple"
+
+def test_action_post_process_strips_fences():
+    """Test le retrait du bloc de code englobant la réponse."""
+    node = ActionNode()
+
+    assert node._post_process("```python\nprint('ok')\n```") == "print('ok')"
+    assert node._post_process("  ```\na\nb\n```  ") == "a\nb"
+    assert node._post_process("Texte avec ```code``` au milieu") == "Texte avec ```code``` au milieu"
+
+@pytest.mark.asyncio
+async def test_perception_normalizes_unicode_whitespace():
+    """Test la normalisation des tabulations, retours ligne et espaces insécables."""
+    node = PerceptionNode()
+
+    result = await node.exec("Un\ttest\n\navec\u00a0blancs")
+    assert result["clean_input"] == "Un test avec blancs"
+
+    result = await node.exec("déjà propre")
+    assert result["clean_input"] == "déjà propre"
+
+class _ScriptedGemini:
+    """Client Gemini de test renvoyant des réponses prédéfinies."""
+    model = "test-model"
+
+    def __init__(self, *responses: str):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def generate(self, prompt: str, **kwargs) -> str:
+        self.calls += 1
+        return self.responses.pop(0)
+
+@pytest.mark.asyncio
+async def test_reasoning_does_not_cache_malformed_decomposition():
+    """Une réponse de décomposition illisible n'est pas mise en cache."""
+    node = ReasoningNode()
+    node.gemini = _ScriptedGemini("pas du json", '{"steps": [{"id": 1, "action": "ok"}]}')
+    node.cache = LLMCache()
+    context = {"intent": "analysis", "task_type": "reasoning", "clean_input": "x", "memory_context": []}
+
+    fallback = await node._decompose(context)
+    steps = await node._decompose(context)
+    cached = await node._decompose(context)
+
+    assert fallback[0]["action"] == "Répondre directement"
+    assert steps == cached == [{"id": 1, "action": "ok"}]
+    assert node.gemini.calls == 2
+
+def test_llm_nodes_share_gemini_client():
+    """Test que les nodes LLM réutilisent le même client Gemini."""
+    assert ReasoningNode().gemini is ReasoningNode().gemini
+    assert ReasoningNode().gemini is SynthesisNode().gemini
+
+def test_llm_nodes_share_settings():
+    """Test que la configuration n'est chargée qu'une fois pour tous les nodes."""
+    assert ReasoningNode().settings is SynthesisNode().settings
+
+@pytest.mark.asyncio
+async def test_reasoning_logic_chain_orders_by_priority():
+    """La chaîne logique suit la priorité ; le chemin critique garde l'ordre d'origine."""
+    node = ReasoningNode()
+    steps = await node._reflect(
+        [{"id": 1, "action": "a"}, {"id": 2, "action": "b"}, {"id": 3, "action": "c"}],
+        {}
+    )
+
+    chain = await node._build_logic_chain(steps)
+    assert chain["sequence"] == [1, 2, 3]
+    assert chain["critical_path"] == [1, 2]
+
+    single = await node._build_logic_chain([{"id": 7, "action": "seule"}])
+    assert single["sequence"] == [7]
+    assert single["critical_path"] == []
+
+    # Étapes sans priorité (sortie LLM non fiable) : priorité 0 par défaut
+    partial = await node._build_logic_chain([{"id": 1}, {"id": 2, "priority": 5}])
+    assert partial["sequence"] == [2, 1]
+
+@pytest.mark.asyncio
+async def test_trace_node_names_interned():
+    """Test que les entrées de trace de nodes homonymes partagent la même chaîne."""
+    class EchoNode(BaseNode):
+        async def exec(self, input_data):
+            return input_data
+
+    # Noms égaux construits dynamiquement (objets chaîne distincts)
+    first = EchoNode("".join(["ec", "ho"]))
+    second = EchoNode("".join(["e", "cho"]))
+    shared = Shared()
+
+    await first.run(shared, "un")
+    await second.run(shared, "deux")
+
+    trace = shared.get_trace()
+    assert trace[0].node is trace[1].node
@@ -1,5 +1,6 @@
 import pytest
 from backend.core.orchestrator import Orchestrator
+from backend.core.base_node import BaseNode
 from backend.core.shared import Shared
 import uuid
 
@@ -74,3 +75,31 @@ async def test_partial_run():
     assert result is not None
     assert "status" in result
     assert result["status"] == "partial_completed"
+
+@pytest.mark.asyncio
+async def test_orchestrator_nodes_read_inputs_from_prep():
+    """Test que seul le premier node reçoit l'entrée utilisateur, les autres leur prep."""
+    received = {}
+
+    class RecordingNode(BaseNode):
+        def prep(self, shared):
+            return {"prep_of": self.name}
+
+        async def exec(self, input_data):
+            received[self.name] = input_data
+            return {"output_of": self.name}
+
+    orchestrator = Orchestrator()
+    orchestrator.pipeline = [RecordingNode("first"), RecordingNode("second"), RecordingNode("action")]
+    shared = Shared()
+    shared.set_metadata("flow_id", str(uuid.uuid4()))
+    shared.set_context("user_input", "Bonjour")
+
+    result = await orchestrator.run(shared)
+
+    assert received == {
+        "first": "Bonjour",
+        "second": {"prep_of": "second"},
+        "action": {"prep_of": "action"},
+    }
+    assert result["status"] == "completed"
@@ -1,6 +1,9 @@
 import pytest
 from backend.core.shared import Shared, TraceEntry, NodeStatus
-from datetime import datetime
+from collections import deque
+import json
+import pickle
+import time
 
 def test_shared_initialization():
     """Test l'initialisation du Shared."""
@@ -12,7 +15,45 @@ def test_shared_initialization():
     assert "metadata" in shared
     assert isinstance(shared["context"], dict)
     assert isinstance(shared["results"], dict)
-    assert isinstance(shared["trace"], list)
+    assert isinstance(shared["trace"], deque)
+
+def test_shared_containers_replaced_via_dict_api():
+    """Test que les méthodes suivent un conteneur remplacé via shared[...]."""
+    shared = Shared()
+
+    shared["context"] = {"key": "value"}
+
+    assert shared.get_context("key") == "value"
+    assert not hasattr(shared, "__dict__")
+
+    shared.update(context={"key": "updated"})
+    assert shared.get_context("key") == "updated"
+
+    shared |= {"results": {"node1": {"data": 1}}}
+    assert shared.get_result("node1", "data") == 1
+
+    del shared["metadata"]
+    shared.setdefault("metadata", {"flow_id": "restored"})
+    assert shared.get_metadata("flow_id") == "restored"
+
+def test_shared_pickle_roundtrip():
+    """Test le pickling d'un Shared (slots restaurés et synchronisés)."""
+    shared = Shared(trace_max_entries=3)
+    shared.set_context("key", "value")
+    shared.add_trace(TraceEntry(
+        ts_ns=time.monotonic_ns(),
+        node="test",
+        status=NodeStatus.SUCCESS,
+        duration_ms=1.0
+    ))
+
+    restored = pickle.loads(pickle.dumps(shared))
+
+    assert restored.get_context("key") == "value"
+    assert restored["context"] is restored._context
+    assert restored.get_trace()[0].node == "test"
+    assert restored["trace"].maxlen == 3
+    assert restored.to_dict()["trace"] == shared.to_dict()["trace"]
 
 def test_context_operations():
     """Test les opérations sur le contexte."""
@@ -44,13 +85,19 @@ def test_results_operations():
     # Get nonexistent
     assert shared.get_result("nonexistent") is None
 
+    # Get deeper path
+    shared.set_result("node2", {"data": {"score": 0.9}})
+    assert shared.get_result("node2", "data", "score") == 0.9
+    assert shared.get_result("node2", "missing", "score") is None
+    assert shared.get_result("nonexistent", "data") is None
+
 def test_trace_operations():
     """Test les opérations sur la trace."""
     shared = Shared()
 
     # Add trace
     entry = TraceEntry(
-        timestamp=datetime.now(),
+        ts_ns=time.monotonic_ns(),
         node="test_node",
         status=NodeStatus.SUCCESS,
         duration_ms=10.5,
@@ -65,6 +112,20 @@ def test_trace_operations():
     assert trace[0].status == NodeStatus.SUCCESS
     assert trace[0].duration_ms == 10.5
 
+def test_trace_is_bounded():
+    """Test l'éviction des entrées les plus anciennes au-delà de la taille maximale."""
+    shared = Shared(trace_max_entries=3)
+
+    for i in range(5):
+        shared.add_trace(TraceEntry(
+            ts_ns=time.monotonic_ns(),
+            node=f"node{i}",
+            status=NodeStatus.SUCCESS,
+            duration_ms=1.0
+        ))
+
+    assert [t.node for t in shared.get_trace()] == ["node2", "node3", "node4"]
+
 def test_metadata_operations():
     """Test les opérations sur les métadonnées."""
     shared = Shared()
@@ -83,7 +144,7 @@ def test_shared_to_dict():
     shared.set_context("ctx_key", "ctx_value")
     shared.set_result("node1", {"result": "ok"})
     shared.add_trace(TraceEntry(
-        timestamp=datetime.now(),
+        ts_ns=time.monotonic_ns(),
         node="test",
         status=NodeStatus.SUCCESS,
         duration_ms=5.0
@@ -98,3 +159,60 @@ def test_shared_to_dict():
     assert dict_repr["context"]["ctx_key"] == "ctx_value"
     assert dict_repr["results"]["node1"] == {"result": "ok"}
     assert len(dict_repr["trace"]) == 1
+
+def test_shared_to_dict_reuses_trace_until_add():
+    """Test la réutilisation de la trace sérialisée tant qu'elle n'est pas modifiée."""
+    shared = Shared()
+    entry = TraceEntry(
+        ts_ns=time.monotonic_ns(),
+        node="test",
+        status=NodeStatus.SUCCESS,
+        duration_ms=1.0
+    )
+    shared.add_trace(entry)
+
+    first = shared.to_dict()["trace"]
+    assert shared.to_dict()["trace"][0] is first[0]
+
+    shared.add_trace(entry)
+    assert len(shared.to_dict()["trace"]) == 2
+
+    # Ajout direct via l'API dict (sans add_trace)
+    shared["trace"].append(TraceEntry(
+        ts_ns=time.monotonic_ns(),
+        node="direct",
+        status=NodeStatus.SUCCESS,
+        duration_ms=1.0
+    ))
+    assert [t["node"] for t in shared.to_dict()["trace"]] == ["test", "test", "direct"]
+
+def test_shared_to_dict_follows_full_ring():
+    """Test que la trace sérialisée suit les évictions d'un tampon plein."""
+    shared = Shared(trace_max_entries=2)
+    for i in range(4):
+        shared.add_trace(TraceEntry(
+            ts_ns=time.monotonic_ns(),
+            node=f"node{i}",
+            status=NodeStatus.SUCCESS,
+            duration_ms=1.0
+        ))
+        assert [t["node"] for t in shared.to_dict()["trace"]] == [t.node for t in shared.get_trace()]
+
+def test_shared_to_json_bytes():
+    """Test la sérialisation JSON directe du Shared."""
+    shared = Shared()
+    shared.set_context("ctx_key", "ctx_value")
+    shared.set_result("node1", {"status": NodeStatus.SUCCESS})
+    shared.add_trace(TraceEntry(
+        ts_ns=time.monotonic_ns(),
+        node="test",
+        status=NodeStatus.SUCCESS,
+        duration_ms=5.0
+    ))
+
+    data = json.loads(shared.to_json_bytes())
+
+    assert data["context"]["ctx_key"] == "ctx_value"
+    assert data["results"]["node1"]["status"] == "success"
+    assert data["trace"] == shared.to_dict()["trace"]
+    assert data["metadata"]["start_time"] == shared.get_metadata("start_time").isoformat()
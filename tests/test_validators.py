@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+from backend.utils.validators import ChatRequest, MCPCallRequest, sanitize_html
+
+def test_sanitize_html_strips_tags_and_scripts():
+    """Test la suppression des balises, scripts et gestionnaires d'événements."""
+    text = '<p onclick="alert(1)">Bonjour <b>monde</b></p><script>evil()</script ><style>p{}</style>fin'
+
+    assert sanitize_html(text) == "Bonjour mondefin"
+
+def test_sanitize_html_keeps_entities_escaped():
+    """Test que les entités ne sont pas décodées en balises."""
+    assert sanitize_html("&lt;script&gt; &amp; co") == "&lt;script&gt; &amp; co"
+
+def test_chat_request_validation():
+    """Test le nettoyage de l'input et le format de l'user_id."""
+    request = ChatRequest(input="  Bonjour  ", user_id="")
+    assert request.input == "Bonjour"
+    assert request.user_id == "anonymous"
+
+    with pytest.raises(ValidationError):
+        ChatRequest(input="   ")
+    with pytest.raises(ValidationError):
+        ChatRequest(input="a" * 60)
+    with pytest.raises(ValidationError):
+        ChatRequest(input="ok", user_id="bad id!")
+
+def test_mcp_call_request_tool_pattern():
+    """Test le format du nom d'outil."""
+    assert MCPCallRequest(tool="search_memory").tool == "search_memory"
+
+    with pytest.raises(ValidationError):
+        MCPCallRequest(tool="Search-Memory")